@@ -3,18 +3,25 @@ from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
 import mysql.connector
 import os
+import sys
 from dotenv import load_dotenv
 from flask_cors import CORS
 import re
-import pytube
-from youtube_transcript_api import YouTubeTranscriptApi
-from transformers import pipeline
-import pdfplumber
-import docx
+import json
+import base64
+import queue
+import time
+import uuid
 from werkzeug.utils import secure_filename
-from flask import Flask, request, jsonify, redirect, url_for, session, render_template
-from text_summarizer import TextSummarizer
-from youtube_summarizer import YouTubeVideoSummarizer
+from flask import Flask, request, jsonify, redirect, url_for, session, render_template, Response, stream_with_context, g
+from summary_cache import SummaryCache, SQLiteSummaryStore
+from db import create_mysql_pool
+from model_registry import model_registry
+from job_queue import JobQueue, InMemoryJobStore, SQLiteJobStore
+from password_hashing import PasswordHasher, HasherBusyError
+from document_extraction import (iter_document_pages, save_upload, UploadTooLargeError, DocumentExtractionError,
+                                 SQLitePageCache)
+from metrics import metrics, LoggingSink, StatsDSink
 
 # Load environment variables
 load_dotenv()
@@ -27,25 +34,108 @@ CORS(app, resources={r"/*": {"origins": "http://localhost:3000"}})
 
 # Initialize extensions
 bcrypt = Bcrypt(app)
+# bcrypt runs on its own bounded pool; requests beyond its queue get a 503
+password_hasher = PasswordHasher(
+    bcrypt,
+    max_workers=int(os.getenv("BCRYPT_WORKERS", "2")),
+    max_queue=int(os.getenv("BCRYPT_MAX_QUEUE", "16")),
+    timeout=float(os.getenv("BCRYPT_TIMEOUT", "5")),
+    rounds=int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+)
 app.config['JWT_SECRET_KEY'] = os.getenv("JWT_SECRET_KEY", "your_secret_key")
 jwt = JWTManager(app)
 
 # App Configurations
 app.config['UPLOAD_FOLDER'] = 'uploads'
 ALLOWED_EXTENSIONS = {'pdf', 'txt', 'docx'}
+# Upload size limit for /summarize_file and the worker processes used to extract large PDFs
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)))
+EXTRACTION_WORKERS = int(os.getenv("EXTRACTION_WORKERS", "2"))
+# PDF_BACKEND=pypdf extracts text-only pages faster, falling back to pdfplumber per page
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pdfplumber")
+# Werkzeug enforces the limit for every request body, including chunked uploads
+app.config['MAX_CONTENT_LENGTH'] = MAX_UPLOAD_BYTES
+PAGE_CACHE_PATH = os.getenv("PAGE_CACHE_PATH", "cache/pages.sqlite3")
+page_cache = SQLitePageCache(PAGE_CACHE_PATH) if PAGE_CACHE_PATH else None
 
 # Ensure upload directory exists
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 
-# Database Connection
-def get_db_connection():
-    return mysql.connector.connect(
-        host="127.0.0.1", 
-        port=3306,
-        user="root", 
-        password="root", 
-        database="concisely"
-    )
+# Summary cache: in-process LRU backed by a local SQLite file
+SUMMARY_CACHE_PATH = os.getenv("SUMMARY_CACHE_PATH", "cache/summaries.sqlite3")
+summary_cache = SummaryCache(
+    max_entries=int(os.getenv("SUMMARY_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("SUMMARY_CACHE_TTL", str(24 * 3600))),
+    store=SQLiteSummaryStore(SUMMARY_CACHE_PATH) if SUMMARY_CACHE_PATH else None
+)
+TEXT_SUMMARY_PARAMS = {"ratio": 0.3, "min_sentences": 2}
+
+# Models are loaded once per worker and shared across requests. Whisper sizes
+# other than the ones in use are unloaded when more than WHISPER_MAX_LOADED are held.
+model_registry.max_evictable = int(os.getenv("WHISPER_MAX_LOADED", "1"))
+model_registry.configure("whisper", max_concurrency=int(os.getenv("WHISPER_CONCURRENCY", "1")), evictable=True)
+model_registry.configure("summarizer", max_concurrency=int(os.getenv("SUMMARIZER_CONCURRENCY", "2")))
+
+# PIPELINE_VERBOSE=0 silences the per-video progress output and progress bars
+PIPELINE_VERBOSE = os.getenv("PIPELINE_VERBOSE", "1").lower() in ("1", "true", "yes")
+
+# The summarizers pull in NLTK, SciPy and (for video) torch, so they are imported
+# on first use; workers serving only auth and history routes never load them.
+def get_text_summarizer():
+    from text_summarizer import TextSummarizer
+    return model_registry.get("text:default", TextSummarizer)
+
+def get_video_summarizer():
+    from youtube_summarizer import YouTubeVideoSummarizer
+    return model_registry.get("video:default", lambda: YouTubeVideoSummarizer(
+        model_registry=model_registry,
+        max_cache_bytes=int(os.getenv("ARTIFACT_CACHE_BYTES", str(2 * 1024 ** 3))),
+        verbose=PIPELINE_VERBOSE
+    ))
+
+if os.getenv("PRELOAD_MODELS", "").lower() in ("1", "true", "yes"):
+    get_text_summarizer()
+    get_video_summarizer().preload_models()
+
+# Database Connection Pool (settings from the DB_* environment variables)
+db_pool = create_mysql_pool()
+
+# Metrics are exposed on /metrics; METRICS_STATSD_HOST also forwards them to StatsD
+# and METRICS_LOG=1 logs every recorded value at DEBUG level
+if os.getenv("METRICS_STATSD_HOST"):
+    metrics.add_sink(StatsDSink(os.getenv("METRICS_STATSD_HOST"), int(os.getenv("METRICS_STATSD_PORT", "8125"))))
+if os.getenv("METRICS_LOG", "").lower() in ("1", "true", "yes"):
+    metrics.add_sink(LoggingSink(app.logger))
+
+def model_registry_metrics():
+    stats = {}
+    for key, entry in model_registry.stats().items():
+        stats[f"{key}_loaded"] = int(entry["loaded"])
+        stats[f"{key}_load_time"] = entry["load_time"] or 0.0
+        stats[f"{key}_uses"] = entry["uses"]
+    return stats
+
+metrics.register_collector("summary_cache", summary_cache.stats)
+metrics.register_collector("password_hasher", password_hasher.stats)
+metrics.register_collector("models", model_registry_metrics)
+metrics.register_collector("db_pool", db_pool.stats)
+
+@app.before_request
+def start_request_timer():
+    g.request_start_time = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    # Streamed responses are measured up to the first byte
+    start_time = g.pop("request_start_time", None)
+    if start_time is not None:
+        metrics.observe("http_request_seconds", time.perf_counter() - start_time,
+                        endpoint=request.endpoint or "unknown", method=request.method, status=response.status_code)
+    return response
+
+@app.errorhandler(413)
+def request_too_large(error):
+    return jsonify({"error": f"Request exceeds the limit of {MAX_UPLOAD_BYTES} bytes"}), 413
 
 # Helper Functions
 def allowed_file(filename):
@@ -54,21 +144,26 @@ def allowed_file(filename):
 def extract_text_from_file(file_path, file_type):
     text = ""
     try:
-        if file_type == 'pdf':
-            with pdfplumber.open(file_path) as pdf:
-                text = "\n".join([page.extract_text() or "" for page in pdf.pages])
-        elif file_type == 'docx':
-            doc = docx.Document(file_path)
-            text = "\n".join([para.text for para in doc.paragraphs])
-        elif file_type == 'txt':
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
+        text = "\n".join(iter_document_pages(file_path, file_type, workers=EXTRACTION_WORKERS,
+                                             backend=PDF_BACKEND, cache=page_cache))
         return text
     except Exception as e:
         print(f"Error extracting text: {e}")
         return ""
 
 # User Routes
+def hasher_busy_response():
+    return jsonify({"error": "Server is busy, please retry shortly"}), 503, {"Retry-After": "1"}
+
+def upgrade_password_hash(user_id, password):
+    """Replace a stored hash that uses an outdated work factor; failures only delay the upgrade"""
+    try:
+        new_hash = password_hasher.hash(password)
+        with db_pool.cursor() as cursor:
+            cursor.execute("UPDATE users SET password_hash = %s WHERE user_id = %s", (new_hash, user_id))
+    except (HasherBusyError, mysql.connector.Error) as e:
+        app.logger.warning(f"Could not rehash password of user {user_id}: {e}")
+
 @app.route('/signup', methods=['POST'])
 def signup():
     data = request.json
@@ -79,20 +174,18 @@ def signup():
     if not username or not email or not password:
         return jsonify({"error": "Missing fields"}), 400
 
-    hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
+    try:
+        hashed_password = password_hasher.hash(password)
+    except HasherBusyError:
+        return hasher_busy_response()
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute("INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
-                       (username, email, hashed_password))
-        conn.commit()
+        with db_pool.cursor() as cursor:
+            cursor.execute("INSERT INTO users (username, email, password_hash) VALUES (%s, %s, %s)",
+                           (username, email, hashed_password))
         return jsonify({"message": "User registered successfully!"}), 201
     except mysql.connector.Error as err:
         return jsonify({"error": str(err)}), 400
-    finally:
-        cursor.close()
-        conn.close()
 
 @app.route('/login', methods=['POST'])
 def login():
@@ -100,26 +193,29 @@ def login():
     username = data.get('username')
     password = data.get('password')
 
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
-        user = cursor.fetchone()
-
-        if user and bcrypt.check_password_hash(user['password_hash'], password):
-            access_token = create_access_token(identity=user['user_id'])
-            return jsonify({
-                "message": "Login successful!", 
-                "token": access_token,
-                "user_id": user['user_id']
-            })
-        else:
-            return jsonify({"error": "Invalid credentials"}), 401
+        with db_pool.cursor(dictionary=True) as cursor:
+            cursor.execute("SELECT * FROM users WHERE username = %s", (username,))
+            user = cursor.fetchone()
     except mysql.connector.Error as err:
         return jsonify({"error": str(err)}), 500
-    finally:
-        cursor.close()
-        conn.close()
+
+    try:
+        valid = bool(user) and bool(password) and password_hasher.check(user['password_hash'], password)
+    except HasherBusyError:
+        return hasher_busy_response()
+
+    if valid:
+        if password_hasher.needs_rehash(user['password_hash']):
+            upgrade_password_hash(user['user_id'], password)
+        access_token = create_access_token(identity=user['user_id'])
+        return jsonify({
+            "message": "Login successful!", 
+            "token": access_token,
+            "user_id": user['user_id']
+        })
+    else:
+        return jsonify({"error": "Invalid credentials"}), 401
 
 @app.route('/summarize', methods=['POST'])
 def summarize():  # Removed @jwt_required()
@@ -131,36 +227,43 @@ def summarize():  # Removed @jwt_required()
         text = data.get("text", "").strip()
         
         if text:
+            summarizer = get_text_summarizer()
+            # Keyed on the summarizer configuration too, so config changes do not serve stale summaries
+            cache_key = summary_cache.text_key(text, {**TEXT_SUMMARY_PARAMS, "summarizer": summarizer.config})
+            cached = summary_cache.get(cache_key)
+            if cached:
+                return jsonify({
+                    "file_id": cached["file_id"],
+                    "original_text": text,
+                    "summary": cached["summary"]
+                })
+
+            # Generate summary before borrowing a connection, so it is not held idle
+            summary = summarizer.generate_summary(text, **TEXT_SUMMARY_PARAMS)
+
             try:
-                conn = get_db_connection()
-                cursor = conn.cursor()
-
-                # Insert file record without user_id
-                cursor.execute("""
-                    INSERT INTO files 
-                    (user_id,file_name, file_type, file_path, file_status) 
-                    VALUES (%s, %s, %s, %s,%s)
-                """, (
-                    None,
-                    'text_input', 
-                    'text', 
-                    text[:255],  # truncate for file_path 
-                    'completed'
-                ))
-                conn.commit()
-                file_id = cursor.lastrowid
-
-                # Generate summary
-                summarizer = TextSummarizer()
-                summary = summarizer.generate_summary(text, ratio=0.3, min_sentences=2)
-
-                # Save summary
-                cursor.execute("""
-                    INSERT INTO summaries 
-                    (file_id, summary_text, summary_type) 
-                    VALUES (%s, %s, %s)
-                """, (file_id, summary, 'text'))
-                conn.commit()
+                with db_pool.cursor() as cursor:
+                    # Insert file record without user_id
+                    cursor.execute("""
+                        INSERT INTO files 
+                        (user_id,file_name, file_type, file_path, file_status) 
+                        VALUES (%s, %s, %s, %s,%s)
+                    """, (
+                        None,
+                        'text_input', 
+                        'text', 
+                        text[:255],  # truncate for file_path 
+                        'completed'
+                    ))
+                    file_id = cursor.lastrowid
+
+                    # Save summary
+                    cursor.execute("""
+                        INSERT INTO summaries 
+                        (file_id, summary_text, summary_type) 
+                        VALUES (%s, %s, %s)
+                    """, (file_id, summary, 'text'))
+                summary_cache.set(cache_key, {"file_id": file_id, "summary": summary})
 
                 return jsonify({
                     "file_id": file_id,
@@ -169,12 +272,140 @@ def summarize():  # Removed @jwt_required()
                 })
             except mysql.connector.Error as db_err:
                 return jsonify({"error": f"Database error: {str(db_err)}"}), 500
-            finally:
-                cursor.close()
-                conn.close()
 
     return jsonify({"error": "Invalid request. Provide text."}), 400
 
+@app.route('/summarize_file', methods=['POST'])
+def summarize_file():
+    """
+    Summarize an uploaded PDF, DOCX or TXT document.
+
+    Accepts a multipart form with a "file" field, or the raw file as the request
+    body with its name in the "filename" query parameter. The upload is written to
+    disk block by block (at most MAX_UPLOAD_BYTES) and its text is fed page by page
+    into the summarizer, so large documents are never held in memory as a whole.
+    """
+    # Oversized bodies are rejected with a 413 through MAX_CONTENT_LENGTH
+    if request.mimetype == 'multipart/form-data':
+        upload = request.files.get('file')
+        if upload is None:
+            return jsonify({"error": "No file provided"}), 400
+        filename, stream = upload.filename, upload.stream
+    else:
+        filename, stream = request.args.get('filename', ''), request.stream
+
+    if not filename or not allowed_file(filename):
+        return jsonify({"error": f"Unsupported file type. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"}), 400
+
+    file_type = filename.rsplit('.', 1)[1].lower()
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], f"{uuid.uuid4().hex}_{secure_filename(filename)}")
+    try:
+        size, content_hash = save_upload(stream, file_path, MAX_UPLOAD_BYTES)
+    except UploadTooLargeError as e:
+        return jsonify({"error": str(e)}), 413
+
+    # The upload is only needed until its text has been summarized
+    try:
+        return summarize_saved_file(file_path, filename, file_type, size, content_hash)
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+def summarize_saved_file(file_path, filename, file_type, size, content_hash):
+    """Summarize an upload written to file_path and record it in the database"""
+    try:
+        pages = iter_document_pages(file_path, file_type, workers=EXTRACTION_WORKERS, backend=PDF_BACKEND,
+                                    cache=page_cache, content_hash=content_hash)
+        summary = get_text_summarizer().summarize_stream(pages, **TEXT_SUMMARY_PARAMS)
+    except DocumentExtractionError as e:
+        # Only unreadable documents are the client's fault; anything else is a 500
+        app.logger.error(f"Error extracting {filename}: {e}")
+        return jsonify({"error": f"Could not read the document: {str(e)}"}), 422
+
+    if not summary:
+        return jsonify({"error": "No text could be extracted from the document"}), 422
+
+    try:
+        with db_pool.cursor() as cursor:
+            # The upload is deleted once the request ends, so only its original name is recorded
+            cursor.execute("""
+                INSERT INTO files 
+                (user_id, file_name, file_type, file_path, file_status) 
+                VALUES (%s, %s, %s, %s, %s)
+            """, (None, filename[:255], file_type, filename[:255], 'completed'))
+            file_id = cursor.lastrowid
+
+            cursor.execute("""
+                INSERT INTO summaries 
+                (file_id, summary_text, summary_type) 
+                VALUES (%s, %s, %s)
+            """, (file_id, summary, 'text'))
+    except mysql.connector.Error as db_err:
+        return jsonify({"error": f"Database error: {str(db_err)}"}), 500
+
+    return jsonify({
+        "file_id": file_id,
+        "file_name": filename,
+        "size": size,
+        "summary": summary
+    })
+
+def video_cache_key(summarizer, youtube_url):
+    return summary_cache.video_key(summarizer._extract_video_id(youtube_url), {
+        "whisper_model": summarizer.whisper_model_size,
+        "summarizer_model": summarizer.summarizer_model,
+        "chunking": summarizer.chunking,
+        "max_chunk_size": summarizer.max_chunk_size,
+        "max_chunk_tokens": summarizer.max_chunk_tokens,
+        "chunk_overlap": summarizer.chunk_overlap,
+        "batch_size": summarizer.batch_size,
+        "length_tolerance": summarizer.length_tolerance,
+        "transcribe_workers": summarizer.transcribe_workers,
+        "segment_seconds": summarizer.segment_seconds,
+        # pcm_mmap only changes where decoded samples live, not the transcript
+        "audio_format": summarizer.audio_format,
+        "transcript_sources": [source.name for source in summarizer.transcript_sources]
+    })
+
+def run_video_job(payload, report):
+    """Job handler running the full video pipeline in a background worker
+
+    pipeline="stream" overlaps transcription and summarization. Every progress
+    event, including partial summaries, is passed on to the job's subscribers.
+    """
+    summarizer = get_video_summarizer()
+    if payload.get("pipeline") == "stream":
+        result = None
+        for event in summarizer.process_video_stream(payload["youtube_url"]):
+            if event["stage"] == "done":
+                result = {key: value for key, value in event.items() if key != "stage"}
+            else:
+                report(**event)
+    else:
+        result = summarizer.process_video(
+            payload["youtube_url"],
+            progress_callback=lambda event: report(**event),
+            force_refresh=payload.get("force_refresh", False)
+        )
+    if not isinstance(result, dict):
+        raise RuntimeError(result)
+    summary_cache.set(payload["cache_key"], result)
+    return result
+
+# Background jobs for /summarize_youtube; JOB_STORE=sqlite keeps them across restarts.
+# Finished jobs are kept for JOB_RETENTION_SECONDS, at most JOB_RETENTION_MAX of them.
+JOB_RETENTION = {
+    "finished_ttl": float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600))),
+    "max_finished": int(os.getenv("JOB_RETENTION_MAX", "1000")),
+}
+if os.getenv("JOB_STORE", "memory") == "sqlite":
+    job_store = SQLiteJobStore(os.getenv("JOB_STORE_PATH", "cache/jobs.sqlite3"), **JOB_RETENTION)
+else:
+    job_store = InMemoryJobStore(**JOB_RETENTION)
+video_jobs = JobQueue(run_video_job, store=job_store, max_workers=int(os.getenv("JOB_WORKERS", "2")))
+if os.getenv("JOB_RESUME_ON_START", "").lower() in ("1", "true", "yes"):
+    video_jobs.resume()
+
 @app.route('/summarize_youtube', methods=['POST'])
 def summarize_video():
     data = request.get_json()
@@ -183,19 +414,122 @@ def summarize_video():
     if not youtube_url:
         return jsonify({"error": "YouTube URL is required"}), 400
 
-    summarizer = YouTubeVideoSummarizer()
-    result = summarizer.process_video(youtube_url)
+    # force_refresh skips the summary cache and stored transcripts and audio
+    force_refresh = bool(data.get("force_refresh"))
+    summarizer = get_video_summarizer()
+    cache_key = video_cache_key(summarizer, youtube_url)
+    cached = None if force_refresh else summary_cache.get(cache_key)
+    if cached:
+        return jsonify(cached)
+
+    # Asynchronous mode: return a job to poll instead of blocking the request
+    if data.get("async"):
+        job, created = video_jobs.submit(cache_key, {
+            "youtube_url": youtube_url, "cache_key": cache_key, "force_refresh": force_refresh
+        })
+        return jsonify({
+            "job_id": job["job_id"],
+            "status": job["status"],
+            "created": created,
+            "status_url": url_for('get_job', job_id=job["job_id"])
+        }), 202
+
+    result = summarizer.process_video(youtube_url, force_refresh=force_refresh)
 
     if isinstance(result, str):  
         result = {"summary": result}
     elif not isinstance(result, dict):  
         return jsonify({"error": "Invalid response format from summarizer"}), 500
+    else:
+        # Only complete results are cached; failures come back as plain strings
+        summary_cache.set(cache_key, result)
 
     # Logging to both terminal and potential log file
     app.logger.info(f"Summarization Result: {result}")
 
     return jsonify(result)
 
+def sse_event(event, data):
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# Seconds between keep-alive comments while a stage produces no events
+SSE_KEEPALIVE_SECONDS = 15
+
+@app.route('/summarize_youtube/stream', methods=['GET', 'POST'])
+def summarize_video_stream():
+    """
+    Stream progress and partial summaries of a video as Server-Sent Events.
+
+    Sends "progress" events for stage transitions and every summarized chunk (with
+    its partial summary), then a "done" event with the full result or an "error"
+    event. GET takes youtube_url as a query parameter so browsers can use
+    EventSource; pipeline=stream overlaps transcription and summarization.
+    """
+    data = (request.get_json(silent=True) or {}) if request.method == 'POST' else request.args
+    youtube_url = data.get("youtube_url")
+    if not youtube_url:
+        return jsonify({"error": "YouTube URL is required"}), 400
+
+    force_refresh = str(data.get("force_refresh", "")).lower() in ("1", "true", "yes")
+    overlap = data.get("pipeline") == "stream"
+    summarizer = get_video_summarizer()
+    cache_key = video_cache_key(summarizer, youtube_url)
+    cached = None if force_refresh else summary_cache.get(cache_key)
+
+    def generate():
+        if cached:
+            yield sse_event("done", cached)
+            return
+
+        # Runs as a background job, shared with any identical request in flight; the job
+        # keeps running (and fills the cache) if the client disconnects
+        job, _ = video_jobs.submit(cache_key, {
+            "youtube_url": youtube_url, "cache_key": cache_key, "force_refresh": force_refresh,
+            "pipeline": "stream" if overlap else "batch"
+        })
+        events = video_jobs.subscribe(job["job_id"])
+        try:
+            while True:
+                try:
+                    event = events.get(timeout=SSE_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                status = event["status"]
+                if status == "running":
+                    yield sse_event("progress", {key: value for key, value in event.items() if key != "status"})
+                elif status == "completed":
+                    yield sse_event("done", event["result"])
+                    return
+                else:
+                    yield sse_event("error", {"error": event["error"]})
+                    return
+        finally:
+            # Also reached through GeneratorExit when the client disconnects
+            video_jobs.unsubscribe(job["job_id"], events)
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Report the stage, progress and result of a background job"""
+    job = video_jobs.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+
+    return jsonify({
+        "job_id": job["job_id"],
+        "status": job["status"],
+        "stage": job["stage"],
+        "progress": job["progress"],
+        "result": job["result"],
+        "error": job["error"],
+        "created_at": job["created_at"],
+        "updated_at": job["updated_at"]
+    })
+
 @app.route('/save_summary', methods=['POST'])
 @jwt_required()
 def save_summary():
@@ -208,47 +542,41 @@ def save_summary():
         return jsonify({"error": "Invalid summary data"}), 400
 
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
         # Generate a unique filename
-        import uuid
         unique_filename = f"{uuid.uuid4()}_{data.get('source')[:50]}"
 
-        # Insert file record
-        cursor.execute("""
-            INSERT INTO files 
-            (user_id, file_name, file_type, file_path, file_status) 
-            VALUES (%s, %s, %s, %s, %s)
-        """, (
-            user_id, 
-            unique_filename,
-            data.get('type', 'video'),
-            data.get('source', ''),
-            'completed'
-        ))
-        conn.commit()
-        file_id = cursor.lastrowid
-
-        # Save summary
-        cursor.execute("""
-            INSERT INTO summaries 
-            (file_id, summary_text, summary_type) 
-            VALUES (%s, %s, %s)
-        """, (
-            file_id, 
-            data['summary'], 
-            data.get('type', 'video')
-        ))
-        conn.commit()
-
-        # Log action
-        cursor.execute("""
-            INSERT INTO login 
-            (user_id, file_id, action) 
-            VALUES (%s, %s, %s)
-        """, (user_id, file_id, 'Summary Saved'))
-        conn.commit()
+        with db_pool.cursor() as cursor:
+            # Insert file record
+            cursor.execute("""
+                INSERT INTO files 
+                (user_id, file_name, file_type, file_path, file_status) 
+                VALUES (%s, %s, %s, %s, %s)
+            """, (
+                user_id, 
+                unique_filename,
+                data.get('type', 'video'),
+                data.get('source', ''),
+                'completed'
+            ))
+            file_id = cursor.lastrowid
+
+            # Save summary
+            cursor.execute("""
+                INSERT INTO summaries 
+                (file_id, summary_text, summary_type) 
+                VALUES (%s, %s, %s)
+            """, (
+                file_id, 
+                data['summary'], 
+                data.get('type', 'video')
+            ))
+
+            # Log action
+            cursor.execute("""
+                INSERT INTO login 
+                (user_id, file_id, action) 
+                VALUES (%s, %s, %s)
+            """, (user_id, file_id, 'Summary Saved'))
 
         return jsonify({
             "message": "Summary saved successfully",
@@ -258,45 +586,138 @@ def save_summary():
 
     except mysql.connector.Error as db_err:
         return jsonify({"error": f"Database error: {str(db_err)}"}), 500
-    finally:
-        cursor.close()
-        conn.close()
+
+# /history page sizes and the default preview length in characters
+HISTORY_PAGE_SIZE = 50
+HISTORY_MAX_PAGE_SIZE = 200
+HISTORY_PREVIEW_CHARS = 200
+# Rows fetched per query while streaming an unpaginated history
+HISTORY_STREAM_BATCH = 500
+
+def encode_history_cursor(row):
+    """Build the opaque cursor pointing after a history row"""
+    position = json.dumps([str(row["upload_timestamp"]), row["file_id"], row["summary_id"]])
+    return base64.urlsafe_b64encode(position.encode("utf-8")).decode("ascii")
+
+def decode_history_cursor(cursor):
+    """Return the (upload_timestamp, file_id, summary_id) position encoded in a cursor; raises ValueError if malformed"""
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        # Cursors issued before summary_id was part of the key resume after the whole file
+        upload_timestamp, file_id, summary_id = position if len(position) == 3 else (*position, 0)
+        return str(upload_timestamp), int(file_id), int(summary_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def fetch_history_page(user_id, after, limit, preview):
+    """
+    Fetch one page of a user's summaries, newest first.
+
+    Uses keyset pagination on (upload_timestamp, file_id, summary_id), served by the
+    files (user_id, upload_timestamp) and summaries (file_id, summary_id) indexes, so
+    deep pages cost the same as the first. summary_id keeps the order total when a
+    file has several summaries. With preview, only the first preview characters of
+    each summary are read.
+    """
+    summary_column = "LEFT(s.summary_text, %s) AS summary_preview" if preview else "s.summary_text"
+    params = [preview] if preview else []
+    params.append(user_id)
+    position = ""
+    if after is not None:
+        position = ("AND (f.upload_timestamp < %s OR (f.upload_timestamp = %s AND "
+                    "(f.file_id < %s OR (f.file_id = %s AND s.summary_id < %s))))")
+        params += [after[0], after[0], after[1], after[1], after[2]]
+    params.append(limit)
+
+    query = f"""
+    SELECT 
+        f.file_id, 
+        s.summary_id, 
+        f.file_name, 
+        f.file_path, 
+        f.file_type, 
+        {summary_column}, 
+        f.upload_timestamp
+    FROM files f
+    JOIN summaries s ON f.file_id = s.file_id
+    WHERE f.user_id = %s {position}
+    ORDER BY f.upload_timestamp DESC, f.file_id DESC, s.summary_id DESC
+    LIMIT %s
+    """
+
+    with db_pool.cursor(dictionary=True) as cursor:
+        cursor.execute(query, params)
+        return cursor.fetchall()
 
 @app.route('/history', methods=['GET'])
 @jwt_required()
 def get_user_summaries():
-    """Retrieve all summaries for the logged-in user"""
+    """
+    Retrieve the summaries of the logged-in user, newest first.
+
+    With limit and/or cursor the response is one page, {"items": [...],
+    "next_cursor": ...}; pass next_cursor back to get the following page. Without
+    them all summaries are returned as a JSON array, streamed in batches; if the
+    database fails midway, the array ends with an {"error": ...} element. preview
+    (true or a number of characters) returns summary_preview instead of the full
+    summary_text.
+    """
     user_id = get_jwt_identity()
 
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
+    preview = request.args.get("preview", "").lower()
+    if preview in ("", "0", "false", "no"):
+        preview = 0
+    elif preview in ("1", "true", "yes"):
+        preview = HISTORY_PREVIEW_CHARS
+    elif preview.isdigit():
+        preview = int(preview)
+    else:
+        return jsonify({"error": "preview must be true, false or a number of characters"}), 400
 
     try:
-        # Query to get all summaries with file details
-        query = """
-        SELECT 
-            f.file_id, 
-            f.file_name, 
-            f.file_path, 
-            f.file_type, 
-            s.summary_text, 
-            f.upload_timestamp
-        FROM files f
-        JOIN summaries s ON f.file_id = s.file_id
-        WHERE f.user_id = %s
-        ORDER BY f.upload_timestamp DESC
-        """
-        
-        cursor.execute(query, (user_id,))
-        summaries = cursor.fetchall()
-        
-        return jsonify(summaries)
+        after = decode_history_cursor(request.args["cursor"]) if request.args.get("cursor") else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    paginated = "limit" in request.args or "cursor" in request.args
+    try:
+        if paginated:
+            limit = min(max(request.args.get("limit", HISTORY_PAGE_SIZE, type=int), 1), HISTORY_MAX_PAGE_SIZE)
+            # One extra row tells whether another page follows
+            rows = fetch_history_page(user_id, after, limit + 1, preview)
+            items = rows[:limit]
+            return jsonify({
+                "items": items,
+                "next_cursor": encode_history_cursor(items[-1]) if len(rows) > limit else None
+            })
 
+        first_batch = fetch_history_page(user_id, None, HISTORY_STREAM_BATCH, preview)
     except mysql.connector.Error as err:
         return jsonify({"error": str(err)}), 500
-    finally:
-        cursor.close()
-        conn.close()
+
+    def generate():
+        # Each batch borrows a pooled connection only for its own query
+        rows = first_batch
+        yield "["
+        count = 0
+        while True:
+            for row in rows:
+                yield ("," if count else "") + app.json.dumps(row)
+                count += 1
+            if len(rows) < HISTORY_STREAM_BATCH:
+                break
+            last = rows[-1]
+            try:
+                rows = fetch_history_page(user_id, (str(last["upload_timestamp"]), last["file_id"],
+                                                    last["summary_id"]), HISTORY_STREAM_BATCH, preview)
+            except mysql.connector.Error as err:
+                # The 200 status is already sent; end with an error element instead of truncated JSON
+                app.logger.error(f"History stream for user {user_id} failed after {count} rows: {err}")
+                yield ("," if count else "") + app.json.dumps({"error": "Database error; the history is incomplete"})
+                break
+        yield "]"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
 
 @app.route('/download_summary/<int:file_id>', methods=['GET'])
 @jwt_required()
@@ -304,22 +725,20 @@ def download_summary(file_id):
     """Download a saved summary"""
     user_id = get_jwt_identity()
 
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
-
     try:
         # Fetch summary, ensuring user ownership
-        cursor.execute("""
-            SELECT 
-                f.file_name, 
-                s.summary_text, 
-                f.file_type
-            FROM files f
-            JOIN summaries s ON f.file_id = s.file_id
-            WHERE f.file_id = %s AND f.user_id = %s
-        """, (file_id, user_id))
-        
-        summary = cursor.fetchone()
+        with db_pool.cursor(dictionary=True) as cursor:
+            cursor.execute("""
+                SELECT 
+                    f.file_name, 
+                    s.summary_text, 
+                    f.file_type
+                FROM files f
+                JOIN summaries s ON f.file_id = s.file_id
+                WHERE f.file_id = %s AND f.user_id = %s
+            """, (file_id, user_id))
+            
+            summary = cursor.fetchone()
         
         if not summary:
             return jsonify({"error": "Summary not found or access denied"}), 404
@@ -342,9 +761,32 @@ def download_summary(file_id):
 
     except Exception as err:
         return jsonify({"error": str(err)}), 500
-    finally:
-        cursor.close()
-        conn.close()
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Report summary cache hit/miss counters"""
+    return jsonify(summary_cache.stats())
+
+@app.route('/auth/stats', methods=['GET'])
+def auth_stats():
+    """Report password hashing pool usage and rejections"""
+    return jsonify(password_hasher.stats())
+
+@app.route('/db/stats', methods=['GET'])
+def db_stats():
+    """Report connection pool usage and borrow wait times"""
+    return jsonify(db_pool.stats())
+
+@app.route('/models/stats', methods=['GET'])
+def model_stats():
+    """Report which models are loaded in this worker"""
+    return jsonify(model_registry.stats())
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Expose pipeline, cache, pool and request metrics in the Prometheus text format"""
+    return Response(metrics.render_prometheus(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 # Health check route
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -354,4 +796,9 @@ def health_check():
     }), 200
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    if '--profile-startup' in sys.argv:
+        # Report import times and memory of a fresh worker importing this module
+        from startup_profile import print_startup_report
+        print_startup_report('app')
+    else:
+        app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,316 @@
+import glob
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Optional
+
+# YouTube video IDs; anything else must not become a directory name under the root
+VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+class ArtifactStore:
+    """
+    On-disk store for downloaded audio and Whisper transcripts.
+
+    Artifacts live in <root>/<video_id>/: the audio as audio.<ext> (shared by all
+    Whisper model sizes) and one transcript_<model>.json per model size. Files are
+    written atomically (temporary file plus rename), so a crash never leaves a
+    truncated artifact behind. Reading an artifact marks it as recently used; when
+    a write makes the store grow beyond max_bytes the least recently used files
+    are deleted, except those of videos currently leased by a request.
+    """
+
+    def __init__(self, root: str, max_bytes: Optional[int] = 2 * 1024 ** 3):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the artifacts; created if needed.
+            max_bytes: Size limit of the store in bytes (None disables eviction).
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._counters = {"transcript_hits": 0, "audio_hits": 0, "misses": 0, "evictions": 0}
+        self._leases = {}  # video ID -> number of requests using its artifacts
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def is_valid_video_id(video_id: str) -> bool:
+        """
+        Check whether a video ID can be stored.
+
+        Args:
+            video_id: Video ID.
+
+        Returns:
+            True for YouTube video IDs (11 letters, digits, "-" or "_").
+        """
+        return isinstance(video_id, str) and VIDEO_ID_PATTERN.match(video_id) is not None
+
+    def _entry_dir(self, video_id: str) -> str:
+        if not self.is_valid_video_id(video_id):
+            raise ValueError(f"Invalid video ID: {video_id!r}")
+        return os.path.join(self.root, video_id)
+
+    def _transcript_path(self, video_id: str, model: str) -> str:
+        return os.path.join(self._entry_dir(video_id), f"transcript_{model}.json")
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Mark a file as recently used"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def _read_json(self, path: str) -> Optional[Dict]:
+        """Read a JSON artifact and mark it as recently used"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._touch(path)
+        return value
+
+    def _write_json(self, path: str, value: Dict) -> str:
+        """Write a JSON artifact atomically, then make room for it"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(dict(value, stored_at=time.time()), f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.evict(keep=[path])
+        return path
+
+    def get_transcript(self, video_id: str, model: str) -> Optional[Dict]:
+        """
+        Look up a stored transcript.
+
+        Args:
+            video_id: Video ID.
+            model: Whisper model size the transcript was produced with.
+
+        Returns:
+            The stored transcript ({"text", "title", "duration", ...}), or None.
+        """
+        transcript = self._read_json(self._transcript_path(video_id, model))
+        with self._lock:
+            self._counters["transcript_hits" if transcript is not None else "misses"] += 1
+        return transcript
+
+    def put_transcript(self, video_id: str, model: str, transcript: Dict) -> str:
+        """
+        Store a transcript atomically, replacing any previous one.
+
+        Args:
+            video_id: Video ID.
+            model: Whisper model size the transcript was produced with.
+            transcript: JSON-serializable transcript, at least {"text": ...}.
+
+        Returns:
+            Path of the stored transcript.
+        """
+        return self._write_json(self._transcript_path(video_id, model), transcript)
+
+    def get_info(self, video_id: str) -> Optional[Dict]:
+        """
+        Look up the stored metadata of a video.
+
+        Args:
+            video_id: Video ID.
+
+        Returns:
+            The stored metadata (e.g. {"title", "duration"}), or None.
+        """
+        return self._read_json(os.path.join(self._entry_dir(video_id), "info.json"))
+
+    def put_info(self, video_id: str, info: Dict) -> str:
+        """
+        Store the metadata of a video, e.g. its title and duration.
+
+        Args:
+            video_id: Video ID.
+            info: JSON-serializable metadata.
+
+        Returns:
+            Path of the stored metadata.
+        """
+        return self._write_json(os.path.join(self._entry_dir(video_id), "info.json"), info)
+
+    def get_audio(self, video_id: str) -> Optional[str]:
+        """
+        Look up the stored audio of a video.
+
+        Args:
+            video_id: Video ID.
+
+        Returns:
+            Path of the audio file, or None.
+        """
+        matches = glob.glob(os.path.join(glob.escape(self._entry_dir(video_id)), "audio.*"))
+        if not matches:
+            with self._lock:
+                self._counters["misses"] += 1
+            return None
+
+        self._touch(matches[0])
+        with self._lock:
+            self._counters["audio_hits"] += 1
+        return matches[0]
+
+    def put_audio(self, video_id: str, source_path: str) -> str:
+        """
+        Move a finished download into the store.
+
+        Args:
+            video_id: Video ID.
+            source_path: Downloaded file; it is moved, not copied.
+
+        Returns:
+            Path of the stored audio file.
+        """
+        directory = self._entry_dir(video_id)
+        os.makedirs(directory, exist_ok=True)
+        for existing in glob.glob(os.path.join(glob.escape(directory), "audio.*")):
+            os.remove(existing)
+
+        extension = os.path.splitext(source_path)[1]
+        path = os.path.join(directory, f"audio{extension}")
+        fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=extension, dir=directory)
+        os.close(fd)
+        try:
+            # A copy is only needed when the download lives on another filesystem
+            shutil.move(source_path, temp_path)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self._touch(path)
+        self.evict(keep=[path])
+        return path
+
+    @contextmanager
+    def lease(self, video_id: str):
+        """
+        Keep a video's artifacts from being evicted for the duration of a with block.
+
+        Args:
+            video_id: Video ID.
+        """
+        self._entry_dir(video_id)
+        with self._lock:
+            self._leases[video_id] = self._leases.get(video_id, 0) + 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._leases[video_id] -= 1
+                if not self._leases[video_id]:
+                    del self._leases[video_id]
+
+    def contains(self, path: str) -> bool:
+        """
+        Check whether a file belongs to the store.
+
+        Args:
+            path: File path.
+
+        Returns:
+            True if the file lives inside the store's root directory.
+        """
+        return os.path.abspath(path).startswith(os.path.abspath(self.root) + os.sep)
+
+    def invalidate(self, video_id: str) -> None:
+        """
+        Delete all artifacts of a video.
+
+        Args:
+            video_id: Video ID.
+        """
+        shutil.rmtree(self._entry_dir(video_id), ignore_errors=True)
+
+    def _files(self):
+        """List (mtime, size, path) of all complete artifacts"""
+        files = []
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    info = os.stat(path)
+                except OSError:
+                    continue
+                files.append((info.st_mtime, info.st_size, path))
+        return files
+
+    def evict(self, keep: Iterable[str] = ()) -> int:
+        """
+        Delete least recently used artifacts until the store fits in max_bytes.
+
+        Artifacts of leased videos are skipped, so the store may stay above
+        max_bytes until those leases end and the next write evicts again.
+
+        Args:
+            keep: Paths that must not be evicted, e.g. the artifact just written.
+
+        Returns:
+            Number of files deleted.
+        """
+        if self.max_bytes is None:
+            return 0
+
+        keep = {os.path.abspath(path) for path in keep}
+        with self._lock:
+            files = sorted(self._files())
+            total = sum(size for _, size, _ in files)
+            evicted = 0
+            for _, size, path in files:
+                if total <= self.max_bytes:
+                    break
+                if os.path.abspath(path) in keep:
+                    continue
+                if os.path.relpath(path, self.root).split(os.sep)[0] in self._leases:
+                    continue
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                evicted += 1
+
+            self._counters["evictions"] += evicted
+        return evicted
+
+    def stats(self) -> Dict:
+        """
+        Get usage counters for the store.
+
+        Returns:
+            Dictionary with hit/miss/eviction counters, the number of files and the total size in bytes.
+        """
+        files = self._files()
+        with self._lock:
+            stats = dict(self._counters)
+        stats["files"] = len(files)
+        stats["bytes"] = sum(size for _, size, _ in files)
+        return stats
@@ -0,0 +1,83 @@
+import subprocess
+
+import numpy as np
+
+from transcription import SAMPLE_RATE, find_silence_splits
+
+# Extra audio buffered beyond a segment, so the cut can be moved to a pause
+SEARCH_SECONDS = 5.0
+
+
+def _ffmpeg_pcm_command(source, http_headers=None):
+    """Build an ffmpeg command decoding any input to 16 kHz mono s16le on stdout"""
+    command = ["ffmpeg", "-nostdin", "-loglevel", "error"]
+    if http_headers:
+        command += ["-headers", "".join(f"{key}: {value}\r\n" for key, value in http_headers.items())]
+    return command + ["-i", source, "-f", "s16le", "-ac", "1", "-ar", str(SAMPLE_RATE), "-"]
+
+
+def decode_to_pcm(source, mmap_path=None):
+    """Decode a media file straight to 16 kHz mono float32 PCM, as Whisper expects
+
+    Without mmap_path the samples are returned as an in-memory array. With it,
+    ffmpeg writes raw samples to that file, which is returned as a copy-on-write
+    memory map so long recordings do not have to fit in RAM.
+    """
+    command = _ffmpeg_pcm_command(source)
+    # Whisper takes float32 samples; let ffmpeg produce them directly
+    command[command.index("s16le")] = "f32le"
+
+    if mmap_path is None:
+        result = subprocess.run(command, capture_output=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg could not decode {source}: {result.stderr.decode('utf-8', errors='replace')}")
+        return np.frombuffer(result.stdout, dtype=np.float32).copy()
+
+    result = subprocess.run(command[:-1] + ["-y", mmap_path], capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg could not decode {source}: {result.stderr.decode('utf-8', errors='replace')}")
+    return np.memmap(mmap_path, dtype=np.float32, mode="c")
+
+
+def stream_pcm_segments(source, segment_seconds=30.0, http_headers=None):
+    """Decode a local file or media URL with ffmpeg and yield Whisper-ready segments
+
+    Audio is read progressively, so the first segment is available long before a
+    remote file has finished downloading. Segments are float32 arrays at 16 kHz of
+    at most segment_seconds, cut at the quietest point near each boundary.
+    """
+    process = subprocess.Popen(_ffmpeg_pcm_command(source, http_headers),
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    block_bytes = SAMPLE_RATE * 2  # one second of 16-bit samples
+    flush_length = int((segment_seconds + SEARCH_SECONDS) * SAMPLE_RATE)
+    buffer = np.empty(0, dtype=np.float32)
+    produced = False
+
+    try:
+        while True:
+            data = process.stdout.read(block_bytes)
+            if not data:
+                break
+            data = data[:len(data) - len(data) % 2]
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            buffer = np.concatenate([buffer, samples])
+
+            if len(buffer) >= flush_length:
+                cut = find_silence_splits(buffer, segment_seconds)[0][1]
+                produced = True
+                yield buffer[:cut]
+                buffer = buffer[cut:]
+
+        process.wait()
+        if process.returncode != 0 and not produced and not len(buffer):
+            error = process.stderr.read().decode("utf-8", errors="replace").strip()
+            raise RuntimeError(f"ffmpeg could not decode {source}: {error}")
+
+        if len(buffer):
+            yield buffer
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        process.stderr.close()
@@ -0,0 +1,445 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Vocabulary for synthetic text; a mix of topic words and function words
+_TOPIC_WORDS = ("model", "data", "network", "learning", "summary", "video", "audio", "graph", "rank", "memory",
+                "system", "text", "signal", "vector", "matrix", "layer", "token", "sentence", "speech", "energy")
+_FILLER_WORDS = ("the", "a", "of", "and", "to", "in", "is", "that", "with", "for", "on", "as", "by", "this")
+_SUITES = ("text", "video", "http")
+
+
+def _sentence(rng, min_words=8, max_words=22):
+    words = [rng.choice(_TOPIC_WORDS if rng.random() < 0.55 else _FILLER_WORDS)
+             for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def synthetic_corpora(seed=0):
+    """Build the synthetic corpora: {name: list of documents}
+
+    short_articles: 20 news-length articles of 12 to 25 sentences.
+    long_document: a single 5,000-sentence document.
+    repetitive_transcript: a speech-like transcript in which phrases and whole
+        sentences recur, as in lectures and meetings.
+    """
+    rng = random.Random(seed)
+    short_articles = [" ".join(_sentence(rng) for _ in range(rng.randint(12, 25))) for _ in range(20)]
+    long_document = [" ".join(_sentence(rng) for _ in range(5000))]
+
+    phrases = [_sentence(rng, 5, 12) for _ in range(60)]
+    transcript = []
+    for _ in range(2000):
+        roll = rng.random()
+        if roll < 0.3:
+            transcript.append(rng.choice(phrases))
+        elif roll < 0.4 and transcript:
+            # Speakers repeat themselves almost verbatim
+            transcript.append(rng.choice(transcript[-20:]))
+        else:
+            transcript.append(_sentence(rng, 6, 16))
+    repetitive_transcript = [" ".join(transcript)]
+
+    return {
+        "short_articles": short_articles,
+        "long_document": long_document,
+        "repetitive_transcript": repetitive_transcript,
+    }
+
+
+def fixture_corpora(directory):
+    """Load fixture documents: every .txt file, and .json transcripts with a "text" field"""
+    corpora = {}
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        stem, extension = os.path.splitext(name)
+        if extension == ".txt":
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+        elif extension == ".json":
+            with open(path, "r", encoding="utf-8") as f:
+                text = json.load(f).get("text", "")
+        else:
+            continue
+        if text.strip():
+            corpora[f"fixture:{stem}"] = [text]
+    return corpora
+
+
+def _timings(samples):
+    """Summarize a list of durations in seconds"""
+    return {
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "min": min(samples),
+        "max": max(samples),
+        "runs": len(samples),
+    }
+
+
+def _percentile(sorted_samples, fraction):
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def _timed(function, *args):
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+def benchmark_text(corpora, repeats=3, summary_params=None):
+    """Time TextSummarizer.generate_summary stage by stage on every corpus
+
+    Stages mirror generate_summary: sentence splitting, sentence features
+    (tokenizing and counting words, once per document), deduplication, similarity
+    matrix, ranking and composing the summary. "total" is a separate end-to-end
+    generate_summary call.
+    """
+    from text_summarizer import TextSummarizer
+
+    params = summary_params or {"ratio": 0.3, "min_sentences": 2, "max_sentences": 10}
+    summarizer = TextSummarizer()
+    results = {}
+
+    for corpus, documents in corpora.items():
+        stages = {name: [] for name in ("preprocess", "dedup", "vectors", "similarity", "ranking", "compose",
+                                        "total")}
+        sentence_counts = []
+        for _ in range(repeats):
+            for text in documents:
+                stage_times = dict.fromkeys(stages, 0.0)
+                original, stage_times["preprocess"] = _timed(summarizer._preprocess_text, text)
+                # Sentences are tokenized once; dedup and ranking reuse the features
+                features, stage_times["vectors"] = _timed(summarizer._sentence_features, original)
+                filtered, stage_times["dedup"] = _timed(summarizer._filter_sentences, original, text,
+                                                        params["min_sentences"], True, features)
+                early_summary, original, sentences, indices, ranked_features = filtered
+                if early_summary is None:
+                    vectors = [sentence_features.vector for sentence_features in ranked_features]
+                    matrix, stage_times["similarity"] = _timed(summarizer._similarity_for_ranking, vectors)
+                    scores, stage_times["ranking"] = _timed(summarizer._rank_sentences, matrix)
+                    _, stage_times["compose"] = _timed(summarizer._compose_summary, original, sentences, indices,
+                                                       scores, params["ratio"], params["min_sentences"],
+                                                       params["max_sentences"])
+                _, stage_times["total"] = _timed(summarizer.generate_summary, text, params["ratio"],
+                                                 params["min_sentences"], params["max_sentences"])
+                # Per-corpus stage time is the sum over its documents
+                for name, seconds in stage_times.items():
+                    stages[name].append(seconds)
+                sentence_counts.append(len(original))
+
+        runs = len(documents)
+        results[corpus] = {
+            "documents": runs,
+            "sentences": sum(sentence_counts[:runs]),
+            "stages": {name: _timings([sum(samples[i:i + runs]) for i in range(0, len(samples), runs)])
+                       for name, samples in stages.items()},
+        }
+    return results
+
+
+def benchmark_video(corpora, model_name, repeats=1, batch_size=4):
+    """Time YouTubeVideoSummarizer.chunk_text and summarize_text with a (tiny) local model"""
+    from youtube_summarizer import YouTubeVideoSummarizer
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        summarizer = YouTubeVideoSummarizer(output_dir=output_dir, summarizer_model=model_name, transcript_sources=[],
+                                            batch_size=batch_size, cache_artifacts=False)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, load_seconds = _timed(summarizer._load_summarizer)
+        tokenizer = getattr(summarizer._load_summarizer(), "tokenizer", None)
+
+        results = {"model": model_name, "load_seconds": load_seconds, "corpora": {}}
+        for corpus, documents in corpora.items():
+            chunk_samples, summarize_samples, chunk_counts = [], [], []
+            for _ in range(repeats):
+                chunk_seconds = summarize_seconds = 0.0
+                chunks = 0
+                for text in documents:
+                    # Progress output would dominate the timings of small inputs
+                    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                        pieces, seconds = _timed(summarizer.chunk_text, text, tokenizer)
+                        chunk_seconds += seconds
+                        chunks += len(pieces)
+                        _, seconds = _timed(summarizer.summarize_text, text)
+                        summarize_seconds += seconds
+                chunk_samples.append(chunk_seconds)
+                summarize_samples.append(summarize_seconds)
+                chunk_counts.append(chunks)
+
+            summarize = _timings(summarize_samples)
+            results["corpora"][corpus] = {
+                "documents": len(documents),
+                "chunks": chunk_counts[0],
+                "chunk_text": _timings(chunk_samples),
+                "summarize_text": summarize,
+                "chunks_per_second": chunk_counts[0] / summarize["median"] if summarize["median"] > 0 else 0.0,
+            }
+    return results
+
+
+class _SQLiteCursor:
+    """MySQL-style cursor over sqlite3: %s placeholders and dictionary rows"""
+
+    def __init__(self, cursor, dictionary):
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def execute(self, query, params=()):
+        self._cursor.execute(query.replace("%s", "?"), params)
+
+    def _row(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return dict(zip([column[0] for column in self._cursor.description], row))
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchall(self):
+        return [self._row(row) for row in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+
+class _SQLiteConnection:
+    """Stands in for a MySQL connection in the /summarize load test"""
+
+    def __init__(self, path):
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+
+    def cursor(self, dictionary=False):
+        return _SQLiteCursor(self._conn.cursor(), dictionary)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        self._conn.close()
+
+
+def _create_standin_schema(path):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS files (
+            file_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            file_name TEXT,
+            file_type TEXT,
+            file_path TEXT,
+            file_status TEXT,
+            upload_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS summaries (
+            summary_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            file_id INTEGER,
+            summary_text TEXT,
+            summary_type TEXT
+        );
+    """)
+    conn.close()
+
+
+def benchmark_http(requests_total=200, concurrency=8, seed=0):
+    """Load-test POST /summarize over real HTTP, with SQLite standing in for MySQL
+
+    Every request carries a different document, so the summary cache never hits
+    and each request runs the summarizer and the database inserts.
+    """
+    from werkzeug.serving import WSGIRequestHandler, make_server
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    # Keep the app's persistent caches out of the measurement (and out of the working tree)
+    os.environ.setdefault("SUMMARY_CACHE_PATH", "")
+    os.environ.setdefault("PAGE_CACHE_PATH", "")
+    import app as app_module
+    from db import ConnectionPool
+
+    rng = random.Random(seed)
+    documents = [" ".join(_sentence(rng) for _ in range(rng.randint(15, 40))) for _ in range(requests_total)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = os.path.join(directory, "standin.sqlite3")
+        _create_standin_schema(db_path)
+        original_pool = app_module.db_pool
+        app_module.db_pool = ConnectionPool(lambda: _SQLiteConnection(db_path), pool_size=concurrency)
+        server = make_server("127.0.0.1", 0, app_module.app, threaded=True, request_handler=QuietHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_port}/summarize"
+
+        def send(text):
+            body = json.dumps({"text": text}).encode("utf-8")
+            request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+            start_time = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request, timeout=60) as response:
+                    response.read()
+                    status = response.status
+            except urllib.error.HTTPError as e:
+                status = e.code
+            except OSError:
+                status = None
+            return time.perf_counter() - start_time, status
+
+        try:
+            # Warm up: first use loads the summarizer
+            send(_sentence(rng) * 5)
+            start_time = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                outcomes = list(executor.map(send, documents))
+            elapsed = time.perf_counter() - start_time
+        finally:
+            server.shutdown()
+            app_module.db_pool = original_pool
+
+    latencies = sorted(latency for latency, status in outcomes if status == 200)
+    errors = sum(1 for _, status in outcomes if status != 200)
+    return {
+        "requests": requests_total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "seconds": elapsed,
+        "requests_per_second": requests_total / elapsed if elapsed > 0 else 0.0,
+        "latency": {
+            "p50": _percentile(latencies, 0.5),
+            "p90": _percentile(latencies, 0.9),
+            "p99": _percentile(latencies, 0.99),
+            "max": latencies[-1],
+        } if latencies else None,
+    }
+
+
+def _environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "commit": commit,
+    }
+
+
+def _run_suite(name, function, *args, **kwargs):
+    """Run one suite; a missing optional dependency or NLTK resource skips the suite instead of failing the run"""
+    print(f"⏱️ Running {name} benchmarks...", file=sys.stderr)
+    try:
+        return function(*args, **kwargs)
+    except (ImportError, LookupError) as e:
+        print(f"Note: skipping {name} benchmarks ({e})", file=sys.stderr)
+        return {"skipped": str(e)}
+
+
+def compare(baseline, current, threshold=0.1):
+    """List median timings that got slower than the baseline by more than threshold (a fraction)"""
+    regressions = []
+
+    def walk(base, new, path):
+        if isinstance(base, dict) and isinstance(new, dict):
+            if "median" in base and "median" in new and base["median"] > 0:
+                change = new["median"] / base["median"] - 1
+                if change > threshold:
+                    regressions.append({"metric": path, "baseline": base["median"], "current": new["median"],
+                                        "change": change})
+                return
+            for key in base.keys() & new.keys():
+                walk(base[key], new[key], f"{path}.{key}" if path else key)
+
+    walk(baseline.get("results", {}), current.get("results", {}), "")
+    return sorted(regressions, key=lambda regression: -regression["change"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the summarization hot paths')
+    parser.add_argument('--suites', type=str, default=','.join(_SUITES),
+                        help=f'Comma-separated suites to run (default: {",".join(_SUITES)})')
+    parser.add_argument('--fixtures', type=str, help='Directory of .txt/.json fixture documents to add as corpora')
+    parser.add_argument('--no-synthetic', action='store_true', help='Only use fixture corpora')
+    parser.add_argument('--repeats', type=int, default=3, help='Runs per corpus (default: 3)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic corpora (default: 0)')
+    parser.add_argument('--video-model', type=str, default='sshleifer/bart-tiny-random',
+                        help='Summarization model for the video suite (default: sshleifer/bart-tiny-random)')
+    parser.add_argument('--http-requests', type=int, default=200, help='Requests in the load test (default: 200)')
+    parser.add_argument('--http-concurrency', type=int, default=8, help='Concurrent clients (default: 8)')
+    parser.add_argument('--output', type=str, help='Write the JSON results to this file instead of stdout')
+    parser.add_argument('--compare', type=str, help='Earlier results file to report regressions against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Slowdown reported as a regression, as a fraction (default: 0.1)')
+    args = parser.parse_args()
+
+    suites = [suite.strip() for suite in args.suites.split(',') if suite.strip()]
+    unknown = set(suites) - set(_SUITES)
+    if unknown:
+        parser.error(f"Unknown suites: {', '.join(sorted(unknown))}")
+
+    corpora = {} if args.no_synthetic else synthetic_corpora(args.seed)
+    if args.fixtures:
+        corpora.update(fixture_corpora(args.fixtures))
+
+    results = {}
+    if "text" in suites:
+        results["text"] = _run_suite("text", benchmark_text, corpora, args.repeats)
+    if "video" in suites:
+        # The 5k-sentence document takes minutes even with a tiny model; transcripts are what matter here
+        video_corpora = {name: documents for name, documents in corpora.items() if name != "long_document"}
+        results["video"] = _run_suite("video", benchmark_video, video_corpora, args.video_model, args.repeats)
+    if "http" in suites:
+        results["http"] = _run_suite("http", benchmark_http, args.http_requests, args.http_concurrency, args.seed)
+
+    report = {
+        "environment": _environment(),
+        "parameters": {"suites": suites, "repeats": args.repeats, "seed": args.seed,
+                       "corpora": {name: len(documents) for name, documents in corpora.items()}},
+        "results": results,
+    }
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            report["regressions"] = compare(json.load(f), report, args.threshold)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+        print(f"📄 Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if report.get("regressions"):
+        for regression in report["regressions"]:
+            print(f"⚠️ {regression['metric']}: {round(regression['change'] * 100, 1)}% slower", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
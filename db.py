@@ -0,0 +1,239 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+import mysql.connector
+from mysql.connector.errors import PoolError
+
+
+class PoolTimeoutError(PoolError):
+    """Raised when no connection could be borrowed within the borrow timeout"""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    Connections are created lazily up to pool_size, checked for health when they
+    have been idle for a while, and handed out through context managers so routes
+    can never leak them. Any DB-API connection factory works, which lets the pool
+    run against MySQL/MariaDB in production and sqlite3 in local experiments.
+    """
+
+    def __init__(self, connect: Callable, pool_size: int = 5, borrow_timeout: float = 5.0,
+                 health_check_interval: float = 30.0):
+        """
+        Initialize the pool.
+
+        Args:
+            connect: Zero-argument callable returning a new connection.
+            pool_size: Maximum number of open connections.
+            borrow_timeout: Seconds to wait for a free connection before giving up.
+            health_check_interval: Idle seconds after which a connection is checked
+                before it is handed out again.
+        """
+        self._connect = connect
+        self.pool_size = pool_size
+        self.borrow_timeout = borrow_timeout
+        self.health_check_interval = health_check_interval
+
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._idle = []  # (connection, time it was returned)
+        self._stats = {
+            "borrows": 0,
+            "timeouts": 0,
+            "created": 0,
+            "discarded": 0,
+            "in_use": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "hold_time_total": 0.0,
+            "hold_time_max": 0.0,
+        }
+
+    def _is_healthy(self, conn) -> bool:
+        """Check that an idle connection still works"""
+        try:
+            if hasattr(conn, "is_connected"):
+                return conn.is_connected()
+            cursor = conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    def _close_quietly(self, conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def acquire(self):
+        """
+        Borrow a connection from the pool.
+
+        Returns:
+            An open connection; give it back with release().
+
+        Raises:
+            PoolTimeoutError: If every connection stayed busy for borrow_timeout seconds.
+        """
+        start_time = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.borrow_timeout)
+        waited = time.perf_counter() - start_time
+
+        with self._lock:
+            self._stats["wait_time_total"] += waited
+            self._stats["wait_time_max"] = max(self._stats["wait_time_max"], waited)
+            if not acquired:
+                self._stats["timeouts"] += 1
+                raise PoolTimeoutError(f"No database connection available after {self.borrow_timeout} seconds")
+            self._stats["borrows"] += 1
+            self._stats["in_use"] += 1
+            idle = self._idle.pop() if self._idle else None
+
+        try:
+            if idle is not None:
+                conn, returned_at = idle
+                if time.time() - returned_at < self.health_check_interval or self._is_healthy(conn):
+                    return conn
+                self._close_quietly(conn)
+                with self._lock:
+                    self._stats["discarded"] += 1
+
+            conn = self._connect()
+            with self._lock:
+                self._stats["created"] += 1
+            return conn
+        except Exception:
+            self._free_slot()
+            raise
+
+    def _free_slot(self) -> None:
+        with self._lock:
+            self._stats["in_use"] -= 1
+        self._slots.release()
+
+    def release(self, conn, discard: bool = False) -> None:
+        """
+        Return a borrowed connection to the pool.
+
+        Args:
+            conn: Connection obtained from acquire().
+            discard: Close the connection instead of reusing it (e.g. after an error).
+        """
+        if discard:
+            self._close_quietly(conn)
+            with self._lock:
+                self._stats["discarded"] += 1
+        else:
+            with self._lock:
+                self._idle.append((conn, time.time()))
+        self._free_slot()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection for the duration of a with block.
+
+        The transaction is rolled back if the block raises. The time the block holds
+        the connection (queries and any work in between) is added to the hold_time
+        statistics.
+        """
+        conn = self.acquire()
+        discard = False
+        start_time = time.perf_counter()
+        try:
+            yield conn
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                # The connection is broken; do not hand it out again
+                discard = True
+            raise
+        finally:
+            held = time.perf_counter() - start_time
+            with self._lock:
+                self._stats["hold_time_total"] += held
+                self._stats["hold_time_max"] = max(self._stats["hold_time_max"], held)
+            self.release(conn, discard=discard)
+
+    @contextmanager
+    def cursor(self, dictionary: bool = False):
+        """
+        Borrow a connection and open a cursor on it for a with block.
+
+        The transaction is committed when the block completes and rolled back if it
+        raises.
+
+        Args:
+            dictionary: Return rows as dictionaries (MySQL connector cursors).
+        """
+        with self.connection() as conn:
+            cursor = conn.cursor(dictionary=True) if dictionary else conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            finally:
+                cursor.close()
+
+    def stats(self) -> Dict:
+        """
+        Get pool usage and wait-time metrics.
+
+        Returns:
+            Dictionary of counters, including the average and maximum borrow wait and
+            connection hold times.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["idle"] = len(self._idle)
+        stats["pool_size"] = self.pool_size
+        attempts = stats["borrows"] + stats["timeouts"]
+        stats["wait_time_avg"] = stats["wait_time_total"] / attempts if attempts else 0.0
+        stats["hold_time_avg"] = stats["hold_time_total"] / stats["borrows"] if stats["borrows"] else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+
+def create_mysql_pool(pool_size: Optional[int] = None, borrow_timeout: Optional[float] = None) -> ConnectionPool:
+    """
+    Create a connection pool for the application's MySQL database.
+
+    Connection settings come from the DB_* environment variables.
+
+    Args:
+        pool_size: Maximum number of connections (defaults to DB_POOL_SIZE or 5).
+        borrow_timeout: Seconds to wait for a connection (defaults to DB_POOL_TIMEOUT or 5).
+
+    Returns:
+        Connection pool.
+    """
+    settings = {
+        "host": os.getenv("DB_HOST", "127.0.0.1"),
+        "port": int(os.getenv("DB_PORT", "3306")),
+        "user": os.getenv("DB_USER", "root"),
+        "password": os.getenv("DB_PASSWORD", "root"),
+        "database": os.getenv("DB_NAME", "concisely"),
+    }
+
+    return ConnectionPool(
+        lambda: mysql.connector.connect(**settings),
+        pool_size=pool_size or int(os.getenv("DB_POOL_SIZE", "5")),
+        borrow_timeout=borrow_timeout or float(os.getenv("DB_POOL_TIMEOUT", "5")),
+        health_check_interval=float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30"))
+    )
@@ -0,0 +1,171 @@
+import zlib
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+SimilarityFunction = Callable[[Dict[str, int], Dict[str, int]], float]
+
+
+class ExactDeduplicator:
+    """
+    Compare every sentence against every sentence kept so far.
+
+    Quadratic in the number of sentences, but it never misses a near-duplicate,
+    which makes it the reference for the approximate strategies.
+    """
+
+    def select(self, sentence_vectors: List[Dict[str, int]], threshold: float,
+               similarity: SimilarityFunction) -> List[int]:
+        """
+        Select the sentences that are not near-duplicates of an earlier sentence.
+
+        Args:
+            sentence_vectors: List of sentence vectors.
+            threshold: Similarity at or above which a sentence counts as a duplicate.
+            similarity: Function computing the similarity of two sentence vectors.
+
+        Returns:
+            Indices of the sentences to keep, in their original order.
+        """
+        kept_indices = []
+
+        for i, vector in enumerate(sentence_vectors):
+            is_duplicate = any(
+                similarity(vector, sentence_vectors[j]) >= threshold for j in kept_indices
+            )
+            if not is_duplicate:
+                kept_indices.append(i)
+
+        return kept_indices
+
+
+class MinHashLSHDeduplicator:
+    """
+    Find near-duplicate candidates with MinHash signatures bucketed by LSH bands.
+
+    Only sentences that share a band bucket with a kept sentence are compared with
+    the exact similarity function, so deduplication is close to linear in the number
+    of sentences. Being approximate, a pair just above the threshold can occasionally
+    be missed.
+    """
+
+    # Mersenne prime used for the universal hash family
+    _PRIME = (1 << 31) - 1
+
+    def __init__(self, num_permutations: int = 128, seed: int = 1):
+        """
+        Initialize the MinHash permutations.
+
+        Args:
+            num_permutations: Number of hash functions in each signature.
+            seed: Seed for the hash functions, so results are reproducible.
+        """
+        rng = np.random.RandomState(seed)
+        self.num_permutations = num_permutations
+        self._a = rng.randint(1, self._PRIME, size=num_permutations).astype(np.uint64)
+        self._b = rng.randint(0, self._PRIME, size=num_permutations).astype(np.uint64)
+
+    def _band_layout(self, threshold: float) -> Tuple[int, int]:
+        """
+        Choose the number of bands and rows per band for a similarity threshold.
+
+        For sets of similar size a cosine similarity c corresponds to a Jaccard
+        similarity of c / (2 - c); the layout is chosen so that the LSH threshold
+        (1 / bands) ** (1 / rows) sits below that value, favouring recall.
+
+        Args:
+            threshold: Cosine similarity threshold.
+
+        Returns:
+            Tuple of (bands, rows per band).
+        """
+        target = threshold / (2 - threshold) if threshold < 1 else 1.0
+        best = (self.num_permutations, 1)
+
+        for rows in range(1, self.num_permutations + 1):
+            if self.num_permutations % rows:
+                continue
+            bands = self.num_permutations // rows
+            if (1.0 / bands) ** (1.0 / rows) <= target * 0.9:
+                best = (bands, rows)
+
+        return best
+
+    def _signature(self, vector: Dict[str, int]) -> np.ndarray:
+        """
+        Compute the MinHash signature of the set of words in a sentence vector.
+
+        Args:
+            vector: Sentence vector.
+
+        Returns:
+            Array with one minimum hash per permutation.
+        """
+        word_hashes = np.fromiter(
+            (zlib.crc32(word.encode('utf-8')) for word in vector), dtype=np.uint64, count=len(vector)
+        )
+        hashed = (np.outer(self._a, word_hashes) + self._b[:, None]) % np.uint64(self._PRIME)
+        return hashed.min(axis=1)
+
+    def select(self, sentence_vectors: List[Dict[str, int]], threshold: float,
+               similarity: SimilarityFunction) -> List[int]:
+        """
+        Select the sentences that are not near-duplicates of an earlier sentence.
+
+        Args:
+            sentence_vectors: List of sentence vectors.
+            threshold: Similarity at or above which a sentence counts as a duplicate.
+            similarity: Function computing the similarity of two sentence vectors.
+
+        Returns:
+            Indices of the sentences to keep, in their original order.
+        """
+        bands, rows = self._band_layout(threshold)
+        buckets = [{} for _ in range(bands)]
+        kept_indices = []
+
+        for i, vector in enumerate(sentence_vectors):
+            # Sentences without any words are never similar to anything
+            if not vector:
+                kept_indices.append(i)
+                continue
+
+            signature = self._signature(vector)
+            band_keys = [signature[band * rows:(band + 1) * rows].tobytes() for band in range(bands)]
+
+            candidates = set()
+            for band, key in enumerate(band_keys):
+                candidates.update(buckets[band].get(key, ()))
+
+            is_duplicate = any(
+                similarity(vector, sentence_vectors[j]) >= threshold for j in candidates
+            )
+
+            if not is_duplicate:
+                kept_indices.append(i)
+                for band, key in enumerate(band_keys):
+                    buckets[band].setdefault(key, []).append(i)
+
+        return kept_indices
+
+
+DEDUP_STRATEGIES = {
+    'exact': ExactDeduplicator,
+    'minhash': MinHashLSHDeduplicator,
+}
+
+
+def get_dedup_strategy(strategy) -> object:
+    """
+    Resolve a deduplication strategy from its name or return the given instance.
+
+    Args:
+        strategy: Strategy name ('exact' or 'minhash') or an object with a select method.
+
+    Returns:
+        Deduplication strategy instance.
+    """
+    if isinstance(strategy, str):
+        if strategy not in DEDUP_STRATEGIES:
+            raise ValueError(f"Unknown dedup strategy: {strategy}")
+        return DEDUP_STRATEGIES[strategy]()
+    return strategy
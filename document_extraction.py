@@ -0,0 +1,371 @@
+import argparse
+import hashlib
+import importlib
+import itertools
+import multiprocessing
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Documents with fewer pages are extracted in-process; pool startup would dominate
+PARALLEL_PAGE_THRESHOLD = 20
+# Read size for uploads and text files
+BLOCK_SIZE = 64 * 1024
+# "pdfplumber" keeps layout-aware extraction; "pypdf" is a faster text-only mode
+PDF_BACKENDS = ("pdfplumber", "pypdf")
+# Pages where the fast backend finds less text than this are re-read with pdfplumber
+MIN_FAST_PAGE_CHARS = 20
+# Unmapped glyphs, as pypdf reports them for fonts without a usable encoding
+_GARBLED_TEXT = re.compile(r"\(cid:\d+\)|\ufffd")
+
+# Worker processes shared by every extraction in this process, started on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+class DocumentExtractionError(Exception):
+    """Raised when a document cannot be parsed, e.g. it is corrupt or not of its declared type"""
+
+
+# Base exceptions of the parsing libraries, meaning the document itself is unreadable
+_PARSE_ERROR_TYPES = (
+    ("pdfminer.psparser", "PSException"),
+    ("pdfplumber.utils.exceptions", "PdfminerException"),
+    ("pypdf.errors", "PyPdfError"),
+    ("docx.opc.exceptions", "OpcError"),
+)
+
+
+def _parse_errors():
+    """Return the parse exception types of the installed parsing libraries"""
+    errors = [zipfile.BadZipFile]
+    for module, name in _PARSE_ERROR_TYPES:
+        try:
+            errors.append(getattr(importlib.import_module(module), name))
+        except (ImportError, AttributeError):
+            pass
+    return tuple(errors)
+
+
+def save_upload(stream, path, max_bytes, block_size=BLOCK_SIZE):
+    """Copy an upload stream to disk block by block, enforcing a size limit
+
+    Returns (size in bytes, SHA-256 hex digest of the content). The partial file is
+    removed and UploadTooLargeError raised as soon as max_bytes is exceeded.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as f:
+            while True:
+                block = stream.read(block_size)
+                if not block:
+                    break
+                size += len(block)
+                if max_bytes is not None and size > max_bytes:
+                    raise UploadTooLargeError(f"Upload exceeds the limit of {max_bytes} bytes")
+                digest.update(block)
+                f.write(block)
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    return size, digest.hexdigest()
+
+
+def file_digest(path, block_size=BLOCK_SIZE):
+    """Return the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SQLitePageCache:
+    """Cache of extracted page text in a local SQLite file, keyed by file content hash and page number"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_text (
+                content_hash TEXT NOT NULL,
+                backend TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (content_hash, backend, page)
+            )
+        """)
+        self._conn.commit()
+
+    def get_range(self, content_hash, backend, start, end):
+        """Return the texts of pages [start, end), or None unless all of them are cached"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT text FROM page_text WHERE content_hash = ? AND backend = ? AND page >= ? AND page < ? "
+                "ORDER BY page", (content_hash, backend, start, end)
+            ).fetchall()
+        return [row[0] for row in rows] if len(rows) == end - start else None
+
+    def set_range(self, content_hash, backend, start, texts):
+        """Store the texts of consecutive pages starting at page start"""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO page_text (content_hash, backend, page, text) VALUES (?, ?, ?, ?)",
+                [(content_hash, backend, start + offset, text) for offset, text in enumerate(texts)]
+            )
+            self._conn.commit()
+
+
+def _extraction_pool(workers):
+    """Return the shared extraction pool, starting it with the given number of workers
+
+    The pool keeps the size it was started with, so concurrent requests never run
+    more extraction processes than that.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a multi-threaded server process can deadlock the child
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_broken_pool(pool):
+    """Forget a pool whose worker died, so the next extraction starts a new one"""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_extraction_pool():
+    """Stop the shared extraction worker processes; the next extraction starts new ones"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def count_pdf_pages(path, backend="pdfplumber"):
+    """Return the number of pages of a PDF"""
+    if backend == "pypdf":
+        from pypdf import PdfReader
+
+        return len(PdfReader(path).pages)
+
+    import pdfplumber
+
+    with pdfplumber.open(path) as pdf:
+        return len(pdf.pages)
+
+
+def _needs_layout(text):
+    """Tell whether text from the fast backend looks unusable (empty or garbled)"""
+    stripped = text.strip()
+    if len(stripped) < MIN_FAST_PAGE_CHARS:
+        return True
+    garbled = sum(len(match) for match in _GARBLED_TEXT.findall(stripped))
+    return garbled > 0.05 * len(stripped)
+
+
+def _extract_pdf_pages(job):
+    """Extract the text of pages [start, end) of a PDF; runs inside worker processes"""
+    import pdfplumber
+
+    path, start, end, backend = job
+    texts = []
+
+    if backend == "pypdf":
+        from pypdf import PdfReader
+
+        reader = PdfReader(path)
+        plumber = None
+        try:
+            for number in range(start, end):
+                text = reader.pages[number].extract_text() or ""
+                if _needs_layout(text):
+                    # Scanned-looking, sparse or oddly encoded page: let pdfplumber have a go
+                    plumber = plumber or pdfplumber.open(path)
+                    page = plumber.pages[number]
+                    layout_text = page.extract_text() or ""
+                    page.flush_cache()
+                    text = layout_text if len(layout_text.strip()) > len(text.strip()) else text
+                texts.append(text)
+        finally:
+            if plumber is not None:
+                plumber.close()
+        return texts
+
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:end]:
+            texts.append(page.extract_text() or "")
+            # Drop the parsed layout objects; they dominate memory on large pages
+            page.flush_cache()
+    return texts
+
+
+def iter_pdf_pages(path, workers=1, pages_per_job=8, parallel_threshold=PARALLEL_PAGE_THRESHOLD,
+                   backend="pdfplumber", cache=None, content_hash=None):
+    """Yield the text of every PDF page in order
+
+    Documents of at least parallel_threshold pages are split into ranges of
+    pages_per_job pages that are extracted by the worker processes shared by all
+    callers. At most two ranges per worker are in flight per document, so memory
+    stays bounded however long the document is.
+
+    With a cache (e.g. SQLitePageCache), page ranges already extracted from a file
+    with the same content hash are read from it instead; content_hash can be passed
+    when it is already known, e.g. from save_upload.
+    """
+    if backend not in PDF_BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend}")
+    if cache is not None and content_hash is None:
+        content_hash = file_digest(path)
+
+    page_count = count_pdf_pages(path, backend)
+    jobs = ((path, start, min(start + pages_per_job, page_count), backend)
+            for start in range(0, page_count, pages_per_job))
+    parallel = workers > 1 and page_count >= parallel_threshold
+    pending = deque()
+    pool = None
+
+    def start_job(job):
+        nonlocal pool
+        cached = cache.get_range(content_hash, backend, job[1], job[2]) if cache is not None else None
+        if cached is not None:
+            return job, cached
+        if not parallel:
+            return job, None
+        if pool is None:
+            # Only started once a range is missing from the cache
+            pool = _extraction_pool(workers)
+        return job, pool.submit(_extract_pdf_pages, job)
+
+    try:
+        pending.extend(start_job(job) for job in itertools.islice(jobs, workers * 2 if parallel else 1))
+        while pending:
+            job, texts = pending.popleft()
+            for next_job in itertools.islice(jobs, 1):
+                pending.append(start_job(next_job))
+
+            extracted = texts is None or isinstance(texts, Future)
+            if texts is None:
+                texts = _extract_pdf_pages(job)
+            elif isinstance(texts, Future):
+                try:
+                    texts = texts.result()
+                except BrokenProcessPool:
+                    _discard_broken_pool(pool)
+                    raise
+            if extracted and cache is not None:
+                cache.set_range(content_hash, backend, job[1], texts)
+            yield from texts
+    finally:
+        # The pool is shared; only drop this document's queued ranges
+        for _, texts in pending:
+            if isinstance(texts, Future):
+                texts.cancel()
+
+
+def iter_docx_paragraphs(path):
+    """Yield the text of every paragraph of a DOCX document"""
+    import docx
+
+    for paragraph in docx.Document(path).paragraphs:
+        yield paragraph.text
+
+
+def iter_text_blocks(path, block_size=BLOCK_SIZE):
+    """Yield a UTF-8 text file in blocks of about block_size characters, ending at line breaks"""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        pending = ""
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            pending += block
+            cut = pending.rfind("\n")
+            if cut >= 0:
+                yield pending[:cut + 1]
+                pending = pending[cut + 1:]
+        if pending:
+            yield pending
+
+
+def iter_document_pages(path, file_type, workers=1, backend="pdfplumber", cache=None, content_hash=None):
+    """Yield the text of a PDF, DOCX or TXT document piece by piece (pages, paragraphs or blocks)
+
+    backend, cache and content_hash apply to PDFs; see iter_pdf_pages. Documents the
+    parsing libraries cannot read raise DocumentExtractionError while iterating; other
+    failures (I/O, worker processes, memory) propagate unchanged.
+    """
+    if file_type == "pdf":
+        pages = iter_pdf_pages(path, workers, backend=backend, cache=cache, content_hash=content_hash)
+    elif file_type == "docx":
+        pages = iter_docx_paragraphs(path)
+    elif file_type == "txt":
+        pages = iter_text_blocks(path)
+    else:
+        raise ValueError(f"Unsupported file type: {file_type}")
+    return _translate_parse_errors(pages)
+
+
+def _translate_parse_errors(pages):
+    """Re-raise parse errors of the underlying iterator as DocumentExtractionError"""
+    parse_errors = _parse_errors()
+    try:
+        yield from pages
+    except parse_errors as e:
+        raise DocumentExtractionError(str(e) or type(e).__name__) from e
+
+
+def main():
+    """Benchmark PDF extraction throughput (pages per second) on local files"""
+    parser = argparse.ArgumentParser(description='PDF page extraction benchmark')
+    parser.add_argument('pdfs', nargs='+', help='Local PDF files')
+    parser.add_argument('--workers', type=int, default=1, help='Number of worker processes (default: 1)')
+    parser.add_argument('--backend', type=str, default='all', choices=['all', *PDF_BACKENDS],
+                        help='Backend to benchmark (default: all)')
+    parser.add_argument('--cache', type=str, help='Also measure a second, cached pass using this SQLite file')
+    args = parser.parse_args()
+
+    backends = PDF_BACKENDS if args.backend == 'all' else (args.backend,)
+    cache = SQLitePageCache(args.cache) if args.cache else None
+
+    for backend in backends:
+        passes = [("cold", None)] + ([("cache fill", cache), ("cached", cache)] if cache is not None else [])
+        for label, pass_cache in passes:
+            pages = 0
+            characters = 0
+            start_time = time.time()
+            for path in args.pdfs:
+                for text in iter_pdf_pages(path, args.workers, backend=backend, cache=pass_cache):
+                    pages += 1
+                    characters += len(text)
+            elapsed = time.time() - start_time
+            rate = pages / elapsed if elapsed > 0 else 0.0
+            print(f"{backend:<10} {label:<10} {pages} pages, {characters} characters in {round(elapsed, 2)} seconds "
+                  f"({round(rate, 1)} pages/second)")
+    shutdown_extraction_pool()
+
+
+if __name__ == "__main__":
+    main()
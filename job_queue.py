@@ -0,0 +1,361 @@
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("completed", "failed")
+
+# Finished jobs are kept for polling for a day by default
+DEFAULT_FINISHED_TTL = 24 * 3600
+DEFAULT_MAX_FINISHED = 1000
+
+
+def _new_job(key: str, payload: Dict) -> Dict:
+    now = time.time()
+    return {
+        "job_id": uuid.uuid4().hex,
+        "key": key,
+        "status": "queued",
+        "stage": "queued",
+        "progress": 0.0,
+        "payload": payload,
+        "result": None,
+        "error": None,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+class InMemoryJobStore:
+    """
+    Job store keeping jobs in a dictionary; jobs are lost on restart.
+
+    Finished jobs hold their full result, so they are dropped once they are older
+    than finished_ttl seconds or more than max_finished of them are kept.
+    """
+
+    def __init__(self, finished_ttl: Optional[float] = DEFAULT_FINISHED_TTL,
+                 max_finished: Optional[int] = DEFAULT_MAX_FINISHED):
+        """
+        Initialize the store.
+
+        Args:
+            finished_ttl: Seconds a completed or failed job is kept (None for no limit).
+            max_finished: Maximum number of completed or failed jobs kept (None for no limit).
+        """
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._finished = OrderedDict()  # job ID -> finish time, oldest first
+
+    def create(self, job: Dict) -> None:
+        with self._lock:
+            self._jobs[job["job_id"]] = dict(job)
+            self._purge()
+
+    def update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields, updated_at=time.time())
+                if job["status"] in FINISHED_STATUSES:
+                    self._finished[job_id] = job["updated_at"]
+                    self._finished.move_to_end(job_id)
+                    self._purge()
+
+    def _purge(self) -> None:
+        """Drop finished jobs past the TTL or beyond the limit (caller holds the lock)"""
+        cutoff = time.time() - self.finished_ttl if self.finished_ttl is not None else None
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            over_limit = self.max_finished is not None and len(self._finished) > self.max_finished
+            if not over_limit and (cutoff is None or finished_at >= cutoff):
+                break
+            del self._finished[job_id]
+            self._jobs.pop(job_id, None)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def find_active(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            for job in self._jobs.values():
+                if job["key"] == key and job["status"] in ACTIVE_STATUSES:
+                    return dict(job)
+        return None
+
+    def unfinished(self) -> List[Dict]:
+        with self._lock:
+            return [dict(job) for job in self._jobs.values() if job["status"] in ACTIVE_STATUSES]
+
+
+class SQLiteJobStore:
+    """
+    Durable job store backed by a local SQLite file.
+
+    Finished jobs are deleted once they are older than finished_ttl seconds or more
+    than max_finished of them are kept.
+    """
+
+    _COLUMNS = ("job_id", "job_key", "status", "stage", "progress", "payload", "result", "error",
+                "created_at", "updated_at")
+
+    def __init__(self, path: str, finished_ttl: Optional[float] = DEFAULT_FINISHED_TTL,
+                 max_finished: Optional[int] = DEFAULT_MAX_FINISHED):
+        """
+        Open (and create if needed) the SQLite job database.
+
+        Args:
+            path: Location of the SQLite database file.
+            finished_ttl: Seconds a completed or failed job is kept (None for no limit).
+            max_finished: Maximum number of completed or failed jobs kept (None for no limit).
+        """
+        self.finished_ttl = finished_ttl
+        self.max_finished = max_finished
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                job_key TEXT NOT NULL,
+                status TEXT NOT NULL,
+                stage TEXT,
+                progress REAL,
+                payload TEXT,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_key_status ON jobs (job_key, status)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_updated ON jobs (status, updated_at)")
+        self._conn.commit()
+
+    def _to_job(self, row) -> Dict:
+        job = dict(zip(self._COLUMNS, row))
+        job["key"] = job.pop("job_key")
+        job["payload"] = json.loads(job["payload"]) if job["payload"] else None
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def create(self, job: Dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(self._COLUMNS)}) VALUES ({', '.join('?' * len(self._COLUMNS))})",
+                (job["job_id"], job["key"], job["status"], job["stage"], job["progress"],
+                 json.dumps(job["payload"]), json.dumps(job["result"]) if job["result"] is not None else None,
+                 job["error"], job["created_at"], job["updated_at"])
+            )
+            self._purge()
+            self._conn.commit()
+
+    def _purge(self) -> None:
+        """Delete finished jobs past the TTL or beyond the limit (caller holds the lock)"""
+        if self.finished_ttl is not None:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (*FINISHED_STATUSES, time.time() - self.finished_ttl)
+            )
+        if self.max_finished is not None:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE job_id IN (SELECT job_id FROM jobs WHERE status IN (?, ?) "
+                "ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+                (*FINISHED_STATUSES, self.max_finished)
+            )
+
+    def update(self, job_id: str, **fields) -> None:
+        if "result" in fields and fields["result"] is not None:
+            fields["result"] = json.dumps(fields["result"])
+        fields["updated_at"] = time.time()
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def find_active(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE job_key = ? AND status IN (?, ?) "
+                "ORDER BY created_at DESC LIMIT 1", (key, *ACTIVE_STATUSES)
+            ).fetchone()
+        return self._to_job(row) if row else None
+
+    def unfinished(self) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                ACTIVE_STATUSES
+            ).fetchall()
+        return [self._to_job(row) for row in rows]
+
+
+class JobQueue:
+    """
+    Background job runner with status polling.
+
+    Jobs run on a local thread pool; the heavy work (Whisper, BART) spends most of
+    its time in native code, so threads keep the models shared with the request
+    workers. Submitting a job whose key matches a queued or running job returns the
+    existing job instead of starting a duplicate. Callers that want every progress
+    event as it happens, rather than polling, can subscribe to a job.
+    """
+
+    def __init__(self, handler: Callable, store=None, max_workers: int = 2):
+        """
+        Initialize the queue.
+
+        Args:
+            handler: Callable(payload, report) returning the JSON-serializable result;
+                report(stage, progress, **details) records the job's current stage and
+                progress, and passes the event with its details to subscribers.
+            store: Job store (InMemoryJobStore with default retention by default).
+            max_workers: Number of jobs run concurrently.
+        """
+        self.handler = handler
+        self.store = store if store is not None else InMemoryJobStore()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job-worker")
+        self._submit_lock = threading.Lock()
+        self._subscribers = {}  # job ID -> queues receiving the job's events
+        self._subscribers_lock = threading.Lock()
+
+    def submit(self, key: str, payload: Dict) -> Tuple[Dict, bool]:
+        """
+        Queue a job unless an identical one is already in flight.
+
+        Args:
+            key: Deduplication key, e.g. the video ID and summarizer settings.
+            payload: JSON-serializable arguments for the handler.
+
+        Returns:
+            Tuple of the job and whether it was newly created.
+        """
+        with self._submit_lock:
+            existing = self.store.find_active(key)
+            if existing is not None:
+                return existing, False
+            job = _new_job(key, payload)
+            self.store.create(job)
+
+        self._executor.submit(self._run, job["job_id"], payload)
+        return job, True
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job ID returned by submit.
+
+        Returns:
+            The job, or None if it is unknown.
+        """
+        return self.store.get(job_id)
+
+    def subscribe(self, job_id: str) -> "queue.Queue":
+        """
+        Receive the events of a job from now on.
+
+        Every report becomes {"status": "running", "stage", "progress", ...details};
+        the last event has status "completed" with the "result" or "failed" with the
+        "error". A job that had already finished yields its final event right away.
+
+        Args:
+            job_id: Job ID returned by submit.
+
+        Returns:
+            Queue receiving the events; pass it to unsubscribe when done.
+        """
+        events = queue.Queue()
+        with self._subscribers_lock:
+            self._subscribers.setdefault(job_id, []).append(events)
+
+        # The job may have finished before the subscription was registered
+        job = self.store.get(job_id)
+        if job is not None and job["status"] in FINISHED_STATUSES:
+            events.put(self._final_event(job))
+        return events
+
+    def unsubscribe(self, job_id: str, events: "queue.Queue") -> None:
+        """
+        Stop receiving the events of a job; the job itself keeps running.
+
+        Args:
+            job_id: Job ID the queue was subscribed to.
+            events: Queue returned by subscribe.
+        """
+        with self._subscribers_lock:
+            subscribers = self._subscribers.get(job_id, [])
+            if events in subscribers:
+                subscribers.remove(events)
+            if not subscribers:
+                self._subscribers.pop(job_id, None)
+
+    @staticmethod
+    def _final_event(job: Dict) -> Dict:
+        if job["status"] == "completed":
+            return {"status": "completed", "result": job["result"]}
+        return {"status": "failed", "error": job["error"]}
+
+    def _publish(self, job_id: str, event: Dict) -> None:
+        with self._subscribers_lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for events in subscribers:
+            events.put(dict(event))
+
+    def resume(self) -> int:
+        """
+        Re-queue jobs left unfinished by a previous process (durable stores only).
+
+        Returns:
+            Number of jobs re-queued.
+        """
+        jobs = self.store.unfinished()
+        for job in jobs:
+            self.store.update(job["job_id"], status="queued", stage="queued", progress=0.0)
+            self._executor.submit(self._run, job["job_id"], job["payload"])
+        return len(jobs)
+
+    def _run(self, job_id: str, payload: Dict) -> None:
+        def report(stage: str, progress: Optional[float] = None, **details) -> None:
+            fields = {"stage": stage}
+            if progress is not None:
+                fields["progress"] = round(progress, 4)
+            self.store.update(job_id, **fields)
+            self._publish(job_id, dict(details, status="running", stage=stage, progress=progress))
+
+        self.store.update(job_id, status="running", stage="starting")
+        try:
+            result = self.handler(payload, report)
+            self.store.update(job_id, status="completed", stage="done", progress=1.0, result=result)
+            self._publish(job_id, {"status": "completed", "result": result})
+        except Exception as e:
+            traceback.print_exc()
+            self.store.update(job_id, status="failed", stage="failed", error=str(e))
+            self._publish(job_id, {"status": "failed", "error": str(e)})
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting jobs and optionally wait for running ones"""
+        self._executor.shutdown(wait=wait)
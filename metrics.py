@@ -0,0 +1,247 @@
+import logging
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def _metric_name(name: str) -> str:
+    """Make a string usable as a Prometheus metric name"""
+    name = _INVALID_NAME_CHARS.sub("_", name)
+    return f"_{name}" if name[:1].isdigit() else name
+
+
+def _label_key(labels: Dict) -> Tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(label_key: Tuple) -> str:
+    if not label_key:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in label_key)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(label_key, escaped)) + "}"
+
+
+class LoggingSink:
+    """Sink writing every recorded metric to a logger at DEBUG level"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger("metrics")
+
+    def record(self, kind: str, name: str, value: float, labels: Dict) -> None:
+        self.logger.debug("%s %s %s %s", kind, name, value, labels)
+
+
+class StatsDSink:
+    """Sink forwarding metrics to a StatsD daemon over UDP (fire and forget)"""
+
+    _TYPES = {"counter": "c", "gauge": "g", "observation": "ms"}
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8125, prefix: str = "concisely"):
+        self.address = (host, port)
+        self.prefix = prefix
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def record(self, kind: str, name: str, value: float, labels: Dict) -> None:
+        # Timings go to StatsD in milliseconds; labels become part of the metric path
+        if kind == "observation" and name.endswith("_seconds"):
+            value *= 1000
+        path = ".".join([self.prefix, name] + [f"{key}_{labels[key]}" for key in sorted(labels)])
+        try:
+            self._socket.sendto(f"{path}:{value}|{self._TYPES[kind]}".encode("utf-8"), self.address)
+        except OSError:
+            pass
+
+
+class Metrics:
+    """
+    Process-wide counters, gauges and timers.
+
+    Values are aggregated in memory for the Prometheus text exposition (/metrics)
+    and also passed to any registered sinks, which receive every individual
+    recording as record(kind, name, value, labels). Collectors are callables
+    returning {name: value} that are read at exposition time, so components that
+    already keep their own statistics (caches, pools) do not need to push them.
+    """
+
+    def __init__(self, sinks: Optional[List] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            sinks: Objects with a record(kind, name, value, labels) method.
+        """
+        self.sinks = list(sinks or [])
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._gauges = {}
+        self._observations = {}  # (name, label key) -> [count, sum, max]
+        self._collectors = []
+
+    def add_sink(self, sink) -> None:
+        """
+        Register a sink receiving every recorded value.
+
+        Args:
+            sink: Object with a record(kind, name, value, labels) method.
+        """
+        self.sinks.append(sink)
+
+    def register_collector(self, prefix: str, collect: Callable[[], Dict]) -> None:
+        """
+        Register a callable whose numeric results are exposed as gauges.
+
+        Args:
+            prefix: Prefix of the exposed metric names, e.g. "summary_cache".
+            collect: Callable returning a {name: value} dictionary; non-numeric
+                values are skipped.
+        """
+        with self._lock:
+            self._collectors.append((prefix, collect))
+
+    def _emit(self, kind: str, name: str, value: float, labels: Dict) -> None:
+        for sink in self.sinks:
+            try:
+                sink.record(kind, name, value, labels)
+            except Exception:
+                logging.getLogger("metrics").exception("Metrics sink failed")
+
+    def increment(self, name: str, value: float = 1, **labels) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name, conventionally ending in "_total".
+            value: Amount to add.
+            **labels: Label values.
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+        self._emit("counter", name, value, labels)
+
+    def set_gauge(self, name: str, value: float, **labels) -> None:
+        """
+        Set a gauge to its current value.
+
+        Args:
+            name: Gauge name.
+            value: Current value.
+            **labels: Label values.
+        """
+        with self._lock:
+            self._gauges[(name, _label_key(labels))] = value
+        self._emit("gauge", name, value, labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """
+        Record one observation, e.g. a duration or a size.
+
+        Args:
+            name: Metric name; durations conventionally end in "_seconds".
+            value: Observed value.
+            **labels: Label values.
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            entry = self._observations.get(key)
+            if entry is None:
+                self._observations[key] = [1, value, value]
+            else:
+                entry[0] += 1
+                entry[1] += value
+                entry[2] = max(entry[2], value)
+        self._emit("observation", name, value, labels)
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """
+        Time a with block and record the duration as an observation.
+
+        Args:
+            name: Metric name; "_seconds" is appended.
+            **labels: Label values.
+        """
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(f"{name}_seconds", time.perf_counter() - start_time, **labels)
+
+    def snapshot(self) -> Dict:
+        """
+        Get the current aggregated values.
+
+        Returns:
+            Dictionary with "counters", "gauges" and "observations" (count, sum and
+            max), keyed by metric name and label string.
+        """
+        with self._lock:
+            return {
+                "counters": {f"{name}{_format_labels(key)}": value for (name, key), value in self._counters.items()},
+                "gauges": {f"{name}{_format_labels(key)}": value for (name, key), value in self._gauges.items()},
+                "observations": {
+                    f"{name}{_format_labels(key)}": {"count": count, "sum": total, "max": largest}
+                    for (name, key), (count, total, largest) in self._observations.items()
+                },
+            }
+
+    def _collected(self) -> Dict:
+        with self._lock:
+            collectors = list(self._collectors)
+        gauges = {}
+        for prefix, collect in collectors:
+            try:
+                values = collect() or {}
+            except Exception:
+                logging.getLogger("metrics").exception(f"Metrics collector {prefix} failed")
+                continue
+            for key, value in values.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    continue
+                gauges[(_metric_name(f"{prefix}_{key}"), ())] = value
+        return gauges
+
+    def render_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text; observations are exposed as summaries (_count, _sum)
+            with an additional _max gauge.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            gauges = dict(self._gauges)
+            observations = {key: list(entry) for key, entry in self._observations.items()}
+        gauges.update(self._collected())
+
+        def grouped(values):
+            families = {}
+            for (name, key), value in sorted(values.items(), key=lambda item: item[0]):
+                families.setdefault(_metric_name(name), []).append((key, value))
+            return families
+
+        lines = []
+        for name, samples in grouped(counters).items():
+            lines.append(f"# TYPE {name} counter")
+            lines.extend(f"{name}{_format_labels(key)} {value}" for key, value in samples)
+        for name, samples in grouped(gauges).items():
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(f"{name}{_format_labels(key)} {value}" for key, value in samples)
+        for name, samples in grouped(observations).items():
+            lines.append(f"# TYPE {name} summary")
+            for key, (count, total, _) in samples:
+                lines.append(f"{name}_count{_format_labels(key)} {count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {total}")
+            lines.append(f"# TYPE {name}_max gauge")
+            lines.extend(f"{name}_max{_format_labels(key)} {largest}" for key, (_, _, largest) in samples)
+        return "\n".join(lines) + "\n"
+
+
+# Shared by every component of this process
+metrics = Metrics()
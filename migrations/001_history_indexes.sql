@@ -0,0 +1,9 @@
+-- Indexes backing the paginated /history query.
+-- Rows are selected by user and walked newest first with keyset pagination on
+-- (upload_timestamp, file_id, summary_id); InnoDB appends the primary key
+-- (file_id) to secondary indexes, so the files index covers that tie-breaker.
+
+CREATE INDEX idx_files_user_upload ON files (user_id, upload_timestamp);
+
+-- Join from files to summaries, in summary_id order for files with several summaries
+CREATE INDEX idx_summaries_file_id ON summaries (file_id, summary_id);
@@ -0,0 +1,199 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+
+class _ModelEntry:
+    """Bookkeeping for one registered model"""
+
+    __slots__ = ("model", "load_lock", "semaphore", "in_use", "uses", "last_used", "load_time")
+
+    def __init__(self, max_concurrency: Optional[int]):
+        self.model = None
+        self.load_lock = threading.Lock()
+        self.semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.in_use = 0
+        self.uses = 0
+        self.last_used = 0.0
+        self.load_time = None
+
+
+class ModelRegistry:
+    """
+    Process-wide, thread-safe registry of loaded models.
+
+    Each model is loaded once per worker process on first use (or at startup via
+    preloading) and shared by all requests. Keys have the form "family:variant",
+    e.g. "whisper:tiny"; concurrency limits and eviction are configured per family.
+    Evictable models (such as rarely used Whisper sizes) are unloaded least recently
+    used first once more than max_evictable of them are loaded, or when they have
+    been idle for longer than idle_ttl seconds. Eviction runs when a model is loaded
+    or a lease ends, never when statistics are read.
+    """
+
+    def __init__(self, max_evictable: int = 2, idle_ttl: Optional[float] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            max_evictable: Maximum number of evictable models kept loaded at once.
+            idle_ttl: Seconds after which an unused evictable model is unloaded.
+        """
+        self.max_evictable = max_evictable
+        self.idle_ttl = idle_ttl
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._policies = {}
+
+    def configure(self, family: str, max_concurrency: Optional[int] = None, evictable: bool = False) -> None:
+        """
+        Set the policy for every model of a family.
+
+        Must be called before the family's models are first used.
+
+        Args:
+            family: Key prefix before the colon, e.g. "whisper".
+            max_concurrency: Maximum number of concurrent leases per model (None for unlimited).
+            evictable: Whether models of this family may be unloaded.
+        """
+        self._policies[family] = {"max_concurrency": max_concurrency, "evictable": evictable}
+
+    def _policy(self, key: str) -> Dict:
+        return self._policies.get(key.split(":", 1)[0], {"max_concurrency": None, "evictable": False})
+
+    def _entry(self, key: str) -> _ModelEntry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _ModelEntry(self._policy(key)["max_concurrency"])
+                self._entries[key] = entry
+            return entry
+
+    def get(self, key: str, loader: Callable):
+        """
+        Get a model, loading it with loader if it is not loaded yet.
+
+        Concurrent callers asking for the same model wait for a single load.
+
+        Args:
+            key: Model key, e.g. "whisper:tiny".
+            loader: Zero-argument callable creating the model.
+
+        Returns:
+            The shared model instance.
+        """
+        entry = self._entry(key)
+        loaded = False
+
+        with entry.load_lock:
+            if entry.model is None:
+                start_time = time.perf_counter()
+                entry.model = loader()
+                entry.load_time = time.perf_counter() - start_time
+                loaded = True
+            model = entry.model
+
+        with self._lock:
+            entry.last_used = time.time()
+            entry.uses += 1
+
+        if loaded:
+            self._evict(keep=key)
+        return model
+
+    @contextmanager
+    def lease(self, key: str, loader: Callable):
+        """
+        Use a model for the duration of a with block.
+
+        Blocks while the model's concurrency limit is reached, and keeps the model
+        from being evicted while it is in use.
+
+        Args:
+            key: Model key, e.g. "whisper:tiny".
+            loader: Zero-argument callable creating the model.
+        """
+        entry = self._entry(key)
+        if entry.semaphore is not None:
+            entry.semaphore.acquire()
+        with self._lock:
+            entry.in_use += 1
+        try:
+            yield self.get(key, loader)
+        finally:
+            with self._lock:
+                entry.in_use -= 1
+                entry.last_used = time.time()
+            if entry.semaphore is not None:
+                entry.semaphore.release()
+            # Other models may have passed their idle TTL meanwhile
+            self._evict(keep=key)
+
+    def preload(self, loaders: Dict[str, Callable]) -> None:
+        """
+        Load models ahead of the first request.
+
+        Args:
+            loaders: Dictionary mapping model keys to their loaders.
+        """
+        for key, loader in loaders.items():
+            self.get(key, loader)
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Unload idle evictable models beyond the limit or past their idle TTL"""
+        now = time.time()
+        with self._lock:
+            candidates = sorted(
+                (entry.last_used, key) for key, entry in self._entries.items()
+                if entry.model is not None and self._policy(key)["evictable"]
+            )
+            loaded = len(candidates)
+
+            for last_used, key in candidates:
+                entry = self._entries[key]
+                if key == keep or entry.in_use:
+                    continue
+                expired = self.idle_ttl is not None and now - last_used > self.idle_ttl
+                if loaded > self.max_evictable or expired:
+                    entry.model = None
+                    loaded -= 1
+
+    def evict(self, key: str) -> bool:
+        """
+        Unload a model if it is not in use.
+
+        Args:
+            key: Model key.
+
+        Returns:
+            True if the model was unloaded.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.model is None or entry.in_use:
+                return False
+            entry.model = None
+            return True
+
+    def stats(self) -> Dict:
+        """
+        Get the state of every registered model, without unloading anything.
+
+        Returns:
+            Dictionary mapping model keys to their load state and usage counters.
+        """
+        with self._lock:
+            return {
+                key: {
+                    "loaded": entry.model is not None,
+                    "load_time": entry.load_time,
+                    "in_use": entry.in_use,
+                    "uses": entry.uses,
+                }
+                for key, entry in self._entries.items()
+            }
+
+
+# Registry shared by everything running in this process
+model_registry = ModelRegistry()
@@ -0,0 +1,143 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from typing import Dict, Union
+
+
+class HasherBusyError(Exception):
+    """Raised when the password hashing pool is saturated; callers should answer 503"""
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt hashing and verification on a dedicated, size-bounded thread pool.
+
+    bcrypt releases the GIL while it works, so a few hashing threads leave request
+    threads free for other routes. At most max_workers hashes run at once and at
+    most max_queue more wait for a thread; beyond that, or when a hash is not done
+    within timeout seconds, HasherBusyError is raised instead of piling up work.
+    """
+
+    def __init__(self, bcrypt, max_workers: int = 2, max_queue: int = 16, timeout: float = 5.0,
+                 rounds: int = 12):
+        """
+        Initialize the hasher.
+
+        Args:
+            bcrypt: Flask-Bcrypt extension doing the actual hashing.
+            max_workers: Number of hashing threads.
+            max_queue: Number of requests allowed to wait for a hashing thread.
+            timeout: Seconds a request waits for its hash before giving up.
+            rounds: Work factor (log2 rounds) new hashes are expected to have.
+        """
+        self.bcrypt = bcrypt
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.rounds = rounds
+
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "rejected": 0,
+            "timeouts": 0,
+            "in_flight": 0,
+            "hash_time_total": 0.0,
+        }
+
+    def _run(self, function, *args):
+        """Run a hashing call on the pool and wait for its result"""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise HasherBusyError("Password hashing capacity exhausted")
+
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["in_flight"] += 1
+
+        def timed():
+            start_time = time.time()
+            try:
+                return function(*args)
+            finally:
+                with self._lock:
+                    self._stats["hash_time_total"] += time.time() - start_time
+
+        def done(_):
+            with self._lock:
+                self._stats["in_flight"] -= 1
+            self._slots.release()
+
+        try:
+            future = self._executor.submit(timed)
+        except BaseException:
+            done(None)
+            raise
+        future.add_done_callback(done)
+
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self._stats["timeouts"] += 1
+            raise HasherBusyError("Password hashing timed out")
+
+    def hash(self, password: str) -> str:
+        """
+        Hash a password.
+
+        Args:
+            password: Plain-text password.
+
+        Returns:
+            The bcrypt hash as a string.
+        """
+        return self._run(self.bcrypt.generate_password_hash, password, self.rounds).decode("utf-8")
+
+    def check(self, password_hash: Union[str, bytes], password: str) -> bool:
+        """
+        Verify a password against a stored hash.
+
+        Args:
+            password_hash: Stored bcrypt hash.
+            password: Plain-text password to check.
+
+        Returns:
+            True if the password matches.
+        """
+        return self._run(self.bcrypt.check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: Union[str, bytes]) -> bool:
+        """
+        Tell whether a stored hash uses a lower work factor than configured.
+
+        Args:
+            password_hash: Stored bcrypt hash, e.g. "$2b$10$...".
+
+        Returns:
+            True if the hash should be replaced by one with the current work factor.
+        """
+        if isinstance(password_hash, bytes):
+            password_hash = password_hash.decode("utf-8")
+        try:
+            return int(password_hash.split("$")[2]) < self.rounds
+        except (IndexError, ValueError):
+            return False
+
+    def stats(self) -> Dict:
+        """
+        Get pool usage counters.
+
+        Returns:
+            Dictionary of counters, including the average time per hash.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        completed = stats["submitted"] - stats["in_flight"]
+        stats["hash_time_avg"] = stats["hash_time_total"] / completed if completed else 0.0
+        stats["max_workers"] = self.max_workers
+        stats["max_queue"] = self.max_queue
+        return stats
@@ -0,0 +1,75 @@
+import argparse
+import re
+import resource
+import subprocess
+import sys
+import time
+
+# One line of `python -X importtime` output: self and cumulative microseconds, then the module
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def profile_imports(module="app"):
+    """Import a module in a fresh interpreter and measure the cost
+
+    Returns a dict with the wall time of the import, the peak RSS of the child
+    process in MB and the per-module timings reported by `python -X importtime`,
+    as (module, cumulative ms, self ms, nesting depth) tuples.
+    """
+    before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    start_time = time.time()
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True)
+    wall_seconds = time.time() - start_time
+    # ru_maxrss is in KB on Linux; it is the peak over all children waited for so far
+    max_rss = max(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss, before)
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, int(cumulative_us) / 1000, int(self_us) / 1000, len(indent) // 2))
+
+    return {
+        "module": module,
+        "ok": result.returncode == 0,
+        "error": result.stderr.strip().splitlines()[-1] if result.returncode != 0 and result.stderr.strip() else None,
+        "wall_seconds": wall_seconds,
+        "max_rss_mb": max_rss / 1024,
+        "imports": imports,
+    }
+
+
+def print_startup_report(module="app", top=15):
+    """Print how long importing a module takes and which imports dominate"""
+    report = profile_imports(module)
+    if not report["ok"]:
+        print(f"❌ Importing {module} failed: {report['error']}")
+        return report
+
+    print(f"⏱️ Importing {module}: {round(report['wall_seconds'], 3)} seconds, "
+          f"peak RSS {round(report['max_rss_mb'], 1)} MB")
+
+    # Modules imported directly by the profiled module (or the interpreter) at depth 0 and 1
+    direct = sorted((entry for entry in report["imports"] if entry[3] <= 1), key=lambda entry: -entry[1])
+    print(f"\nSlowest imports (cumulative ms):")
+    for name, cumulative_ms, self_ms, _ in direct[:top]:
+        print(f"  {round(cumulative_ms, 1):>9}  {name}")
+
+    heavy = [name for name in ("torch", "transformers", "whisper", "yt_dlp", "nltk", "scipy", "networkx",
+                               "pdfplumber", "docx") if any(entry[0] == name for entry in report["imports"])]
+    print(f"\nHeavy dependencies loaded at startup: {', '.join(heavy) if heavy else 'none'}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the import time and memory of a module')
+    parser.add_argument('module', nargs='?', default='app', help='Module to import (default: app)')
+    parser.add_argument('--top', type=int, default=15, help='Number of imports to list (default: 15)')
+    args = parser.parse_args()
+    print_startup_report(args.module, args.top)
+
+
+if __name__ == "__main__":
+    main()
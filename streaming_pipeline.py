@@ -0,0 +1,159 @@
+import queue
+import threading
+
+# Marks the end of a stage's output
+_DONE = object()
+
+
+class _Stopped(Exception):
+    """Raised inside a stage when the consumer has gone away"""
+
+
+def _put(target, item, stop):
+    """Put an item on a bounded queue, giving up once the pipeline is stopped"""
+    while True:
+        if stop.is_set():
+            raise _Stopped()
+        try:
+            target.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _get(source, stop):
+    """Get an item from a queue, giving up once the pipeline is stopped"""
+    while True:
+        if stop.is_set():
+            raise _Stopped()
+        try:
+            return source.get(timeout=0.1)
+        except queue.Empty:
+            continue
+
+
+class StreamingPipeline:
+    """Overlap audio decoding, transcription and summarization with queues
+
+    Each stage runs in its own thread: audio segments flow to transcription as soon
+    as they are decoded, transcript text is packed into chunks as it arrives, and
+    every complete chunk is summarized while later audio is still being processed.
+    End-to-end latency therefore approaches that of the slowest stage rather than
+    the sum of all three. All stages are injected, so the pipeline can run offline
+    on local audio and with stand-in models.
+    """
+
+    def __init__(self, segment_source, transcribe, chunk, summarize, queue_size=4):
+        """Initialize the pipeline
+
+        segment_source: iterable of audio segments
+        transcribe: callable(segment) -> transcript text
+        chunk: callable(text) -> list of chunks; the last chunk is treated as
+            incomplete until the transcript ends
+        summarize: callable(chunk) -> summary text
+        queue_size: maximum number of items buffered between two stages
+        """
+        self.segment_source = segment_source
+        self.transcribe = transcribe
+        self.chunk = chunk
+        self.summarize = summarize
+        self.queue_size = queue_size
+
+    def _produce_segments(self, segments, events, stop):
+        try:
+            for segment in self.segment_source:
+                _put(segments, segment, stop)
+            _put(segments, _DONE, stop)
+        except _Stopped:
+            pass
+        except Exception as e:
+            events.put(("error", e))
+            stop.set()
+
+    def _transcribe_segments(self, segments, chunks, events, stop):
+        pending = ""
+        index = 0
+        try:
+            while True:
+                segment = _get(segments, stop)
+                if segment is _DONE:
+                    break
+                text = self.transcribe(segment).strip()
+                events.put(("event", {"stage": "transcribe", "segment": index, "text": text}))
+                index += 1
+                if not text:
+                    continue
+
+                pending = f"{pending} {text}" if pending else text
+                ready = self.chunk(pending)
+                # Everything but the last chunk is complete; the rest waits for more text
+                for complete in ready[:-1]:
+                    _put(chunks, complete, stop)
+                pending = ready[-1] if ready else ""
+
+            if pending.strip():
+                for complete in self.chunk(pending):
+                    _put(chunks, complete, stop)
+            _put(chunks, _DONE, stop)
+        except _Stopped:
+            pass
+        except Exception as e:
+            events.put(("error", e))
+            stop.set()
+
+    def _summarize_chunks(self, chunks, events, stop):
+        index = 0
+        try:
+            while True:
+                chunk = _get(chunks, stop)
+                if chunk is _DONE:
+                    break
+                summary = self.summarize(chunk)
+                events.put(("event", {"stage": "summarize", "chunk": index, "text": chunk, "summary": summary}))
+                index += 1
+        except _Stopped:
+            pass
+        except Exception as e:
+            events.put(("error", e))
+            stop.set()
+        finally:
+            events.put(("done", None))
+
+    def run(self):
+        """Run all stages, yielding events as soon as they are produced
+
+        Yields {"stage": "transcribe", "segment", "text"} for every transcribed
+        segment and {"stage": "summarize", "chunk", "text", "summary"} for every
+        summarized chunk, in order. The first error from any stage is re-raised;
+        closing the generator early stops all stages.
+        """
+        segments = queue.Queue(maxsize=self.queue_size)
+        chunks = queue.Queue(maxsize=self.queue_size)
+        events = queue.Queue()
+        stop = threading.Event()
+
+        threads = [
+            threading.Thread(target=self._produce_segments, args=(segments, events, stop), daemon=True),
+            threading.Thread(target=self._transcribe_segments, args=(segments, chunks, events, stop), daemon=True),
+            threading.Thread(target=self._summarize_chunks, args=(chunks, events, stop), daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        error = None
+        try:
+            while True:
+                kind, payload = events.get()
+                if kind == "done":
+                    break
+                if kind == "error":
+                    error = error or payload
+                elif error is None:
+                    yield payload
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        if error is not None:
+            raise error
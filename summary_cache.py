@@ -0,0 +1,206 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# Part of every key; bump it whenever a change to the summarization code alters its output,
+# so summaries persisted by earlier versions are no longer served
+CACHE_VERSION = 2
+
+
+class SQLiteSummaryStore:
+    """Persistent cache tier storing JSON values in a local SQLite file"""
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the SQLite cache file.
+
+        Args:
+            path: Location of the SQLite database file.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summary_cache (
+                cache_key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Dict]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Cache key.
+            ttl: Maximum age in seconds; older entries are deleted and treated as missing.
+
+        Returns:
+            The cached value, or None.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM summary_cache WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if ttl is not None and time.time() - row[1] > ttl:
+                self._conn.execute("DELETE FROM summary_cache WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a value, replacing any previous entry for the key.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summary_cache (cache_key, value, created_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time())
+            )
+            self._conn.commit()
+
+
+class SummaryCache:
+    """
+    Two-tier, content-addressed cache for generated summaries.
+
+    Keys are derived from a hash of the normalized input text (or the video ID) and
+    the summarizer parameters. The first tier is an in-process LRU with size and TTL
+    eviction; the optional second tier persists entries across restarts.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = 24 * 3600,
+                 store: Optional[SQLiteSummaryStore] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries held in memory.
+            ttl: Seconds after which an entry expires (None keeps entries forever).
+            store: Optional persistent tier.
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"memory_hits": 0, "persistent_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _make_key(kind: str, identity: str, params: Dict) -> str:
+        """Hash the input identity together with the summarizer parameters and the cache version"""
+        payload = json.dumps({"kind": kind, "id": identity, "params": params, "version": CACHE_VERSION},
+                             sort_keys=True, default=lambda value: type(value).__qualname__)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def text_key(self, text: str, params: Dict) -> str:
+        """
+        Build the cache key for a text summary.
+
+        Args:
+            text: Input text; whitespace differences do not change the key.
+            params: Summarizer parameters, including the summarizer configuration
+                (e.g. TextSummarizer.config); strategy objects count by class name.
+
+        Returns:
+            Cache key.
+        """
+        normalized = re.sub(r"\s+", " ", text).strip()
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return self._make_key("text", digest, params)
+
+    def video_key(self, video_id: str, params: Dict) -> str:
+        """
+        Build the cache key for a video summary.
+
+        Args:
+            video_id: YouTube video ID.
+            params: Summarizer parameters.
+
+        Returns:
+            Cache key.
+        """
+        return self._make_key("video", video_id, params)
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a value in memory first, then in the persistent tier.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self.ttl is None or now - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return value
+                del self._entries[key]
+
+        value = self.store.get(key, self.ttl) if self.store is not None else None
+
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["persistent_hits"] += 1
+            self._remember(key, value, now)
+        return value
+
+    def set(self, key: str, value: Dict) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Cache key.
+            value: JSON-serializable value.
+        """
+        with self._lock:
+            self._remember(key, value, time.time())
+        if self.store is not None:
+            self.store.set(key, value)
+
+    def _remember(self, key: str, value: Dict, stored_at: float) -> None:
+        """Insert into the memory tier, evicting the least recently used entries"""
+        self._entries[key] = (value, stored_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._counters["evictions"] += 1
+
+    def stats(self) -> Dict:
+        """
+        Get hit/miss counters for the cache.
+
+        Returns:
+            Dictionary with counters, the hit rate and the number of entries in memory.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        lookups = stats["memory_hits"] + stats["persistent_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        return stats
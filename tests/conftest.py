@@ -0,0 +1,65 @@
+import multiprocessing
+import os
+import random
+import re
+import sys
+
+import nltk
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import text_summarizer
+
+
+def _has_nltk_data(*resources):
+    for resource in resources:
+        try:
+            nltk.data.find(resource)
+            return True
+        except LookupError:
+            pass
+    return False
+
+
+# word_tokenize needs punkt_tab on recent NLTK releases, punkt on older ones
+HAS_PUNKT = _has_nltk_data("tokenizers/punkt_tab", "tokenizers/punkt")
+
+# Forked workers inherit the regex tokenizers patched in below
+CAN_RUN_WORKERS = HAS_PUNKT or multiprocessing.get_start_method() == "fork"
+
+TOPICS = {
+    "graphs": "graph node edge weight rank walk damping teleport matrix vector",
+    "audio": "audio sample frame silence energy segment whisper decoder speech model",
+    "storage": "cache entry disk eviction index page cursor database pool connection",
+}
+
+
+def make_document(num_sentences, seed, duplicate_every=0):
+    """Build a deterministic document of sentences drawn from a few topic vocabularies"""
+    rng = random.Random(seed)
+    sentences = []
+    for i in range(num_sentences):
+        if duplicate_every and i and i % duplicate_every == 0:
+            sentences.append(sentences[rng.randrange(len(sentences))])
+            continue
+        words = TOPICS[rng.choice(sorted(TOPICS))].split()
+        length = rng.randint(5, 12)
+        sentences.append(" ".join(rng.choice(words) for _ in range(length)).capitalize() + ".")
+    return " ".join(sentences)
+
+
+@pytest.fixture(autouse=True)
+def tokenizers(monkeypatch):
+    """Fall back to simple regex tokenizers when the NLTK punkt data is not installed"""
+    if not HAS_PUNKT:
+        monkeypatch.setattr(text_summarizer, "sent_tokenize",
+                            lambda text: [s for s in re.split(r"(?<=[.!?])\s+", text.strip()) if s])
+        monkeypatch.setattr(text_summarizer, "word_tokenize", lambda text: re.findall(r"\w+|[^\w\s]", text))
+
+
+@pytest.fixture
+def documents():
+    """Small fixed corpus: plain documents and documents with repeated sentences"""
+    return [make_document(12, seed) for seed in range(4)] + \
+        [make_document(40, seed, duplicate_every=4) for seed in range(4, 7)]
@@ -0,0 +1,38 @@
+import os
+
+import pytest
+
+from artifact_store import ArtifactStore
+
+
+@pytest.mark.parametrize("video_id", ["..", "../../../etc", "dQw4w9WgXcQ/..", "short", "dQw4w9WgXcQx", ""])
+def test_invalid_video_ids_are_rejected(tmp_path, video_id):
+    store = ArtifactStore(str(tmp_path / "artifacts"))
+
+    assert not store.is_valid_video_id(video_id)
+    with pytest.raises(ValueError):
+        store.put_info(video_id, {"title": "x"})
+    with pytest.raises(ValueError):
+        store.get_transcript(video_id, "tiny")
+    with pytest.raises(ValueError):
+        store.invalidate(video_id)
+    assert os.listdir(tmp_path / "artifacts") == []
+
+
+def test_leased_artifacts_are_not_evicted(tmp_path):
+    store = ArtifactStore(str(tmp_path / "artifacts"), max_bytes=6000)
+    source = tmp_path / "download.webm"
+
+    source.write_bytes(b"a" * 4000)
+    in_use = store.put_audio("aaaaaaaaaaa", str(source))
+    os.utime(in_use, (0, 0))  # Least recently used
+
+    with store.lease("aaaaaaaaaaa"):
+        source.write_bytes(b"b" * 4000)
+        store.put_audio("bbbbbbbbbbb", str(source))
+        assert os.path.exists(in_use)
+
+    # Once the lease has ended, the next write evicts it
+    store.put_info("ccccccccccc", {"title": "c"})
+    assert not os.path.exists(in_use)
+    assert store.get_audio("bbbbbbbbbbb") is not None
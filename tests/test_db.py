@@ -0,0 +1,137 @@
+import sqlite3
+import threading
+
+import pytest
+
+from db import ConnectionPool, PoolTimeoutError
+
+
+@pytest.fixture
+def connect(tmp_path):
+    path = str(tmp_path / "pool.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE items (name TEXT)")
+    return lambda: sqlite3.connect(path, check_same_thread=False)
+
+
+def count_items(pool):
+    with pool.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) FROM items")
+        return cursor.fetchone()[0]
+
+
+def test_cursor_commits_and_reuses_the_connection(connect):
+    pool = ConnectionPool(connect, pool_size=2)
+
+    with pool.cursor() as cursor:
+        cursor.execute("INSERT INTO items VALUES ('a')")
+
+    assert count_items(pool) == 1
+    stats = pool.stats()
+    assert stats["borrows"] == 2
+    assert stats["created"] == 1
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+
+
+def test_connection_is_returned_and_rolled_back_on_exception(connect):
+    pool = ConnectionPool(connect, pool_size=1, borrow_timeout=0.1)
+
+    with pytest.raises(RuntimeError):
+        with pool.cursor() as cursor:
+            cursor.execute("INSERT INTO items VALUES ('a')")
+            raise RuntimeError("route failed")
+
+    stats = pool.stats()
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+    # The only slot is free again and the insert was not committed
+    assert count_items(pool) == 0
+    assert pool.stats()["created"] == 1
+
+
+def test_connection_is_discarded_when_rollback_fails(connect):
+    class BrokenConnection:
+        def __init__(self):
+            self.closed = False
+
+        def rollback(self):
+            raise sqlite3.OperationalError("connection lost")
+
+        def close(self):
+            self.closed = True
+
+    broken = BrokenConnection()
+    pool = ConnectionPool(lambda: broken, pool_size=1)
+
+    with pytest.raises(ValueError):
+        with pool.connection():
+            raise ValueError("query failed")
+
+    stats = pool.stats()
+    assert broken.closed
+    assert stats["discarded"] == 1
+    assert stats["idle"] == 0
+    assert stats["in_use"] == 0
+
+
+def test_pool_size_is_bounded(connect):
+    pool = ConnectionPool(connect, pool_size=2, borrow_timeout=0.05)
+    first = pool.acquire()
+    second = pool.acquire()
+
+    with pytest.raises(PoolTimeoutError):
+        pool.acquire()
+
+    stats = pool.stats()
+    assert stats["created"] == 2
+    assert stats["in_use"] == 2
+    assert stats["timeouts"] == 1
+
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+    pool.release(second)
+    assert pool.stats()["created"] == 2
+
+
+def test_waiting_borrower_gets_the_released_connection(connect):
+    pool = ConnectionPool(connect, pool_size=1, borrow_timeout=2.0)
+    held = pool.acquire()
+    borrowed = []
+
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.acquire()))
+    waiter.start()
+    pool.release(held)
+    waiter.join(timeout=5)
+
+    assert borrowed == [held]
+    assert pool.stats()["created"] == 1
+
+
+def test_stale_connection_is_replaced(connect):
+    pool = ConnectionPool(connect, pool_size=1, health_check_interval=0)
+    stale = pool.acquire()
+    pool.release(stale)
+    stale.close()
+
+    fresh = pool.acquire()
+    try:
+        assert fresh is not stale
+        assert fresh.execute("SELECT 1").fetchone() == (1,)
+    finally:
+        pool.release(fresh)
+
+    stats = pool.stats()
+    assert stats["discarded"] == 1
+    assert stats["created"] == 2
+
+
+def test_healthy_idle_connection_is_kept_after_check(connect):
+    pool = ConnectionPool(connect, pool_size=1, health_check_interval=0)
+    conn = pool.acquire()
+    pool.release(conn)
+
+    assert pool.acquire() is conn
+    pool.release(conn)
+    assert pool.stats()["discarded"] == 0
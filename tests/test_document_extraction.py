@@ -0,0 +1,90 @@
+import pytest
+
+import document_extraction
+from document_extraction import DocumentExtractionError, SQLitePageCache, iter_document_pages, iter_pdf_pages
+
+pytest.importorskip("pdfplumber")
+pytest.importorskip("pypdf")
+
+
+def write_pdf(path, page_texts):
+    """Write a minimal PDF with one line of Helvetica text per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in page_texts:
+        content = f"BT /F1 12 Tf 72 700 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % len(objects))
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    data = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(data)
+    data += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    data += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    data += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(data)
+    return str(path)
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    return write_pdf(tmp_path / "document.pdf", [f"Page {i} explains the summary cache in detail." for i in range(5)])
+
+
+@pytest.mark.parametrize("backend", ["pdfplumber", "pypdf"])
+def test_second_run_is_served_from_the_page_cache(tmp_path, pdf, monkeypatch, backend):
+    cache = SQLitePageCache(str(tmp_path / "pages.sqlite3"))
+
+    first = list(iter_pdf_pages(pdf, workers=1, pages_per_job=2, backend=backend, cache=cache))
+
+    def fail(job):
+        raise AssertionError(f"pages {job[1]}-{job[2]} extracted again")
+
+    monkeypatch.setattr(document_extraction, "_extract_pdf_pages", fail)
+    second = list(iter_pdf_pages(pdf, workers=1, pages_per_job=2, backend=backend, cache=cache))
+
+    assert len(first) == 5
+    assert "Page 3 explains" in first[3]
+    assert second == first
+
+
+def test_pypdf_falls_back_to_pdfplumber_for_unusable_pages(pdf, monkeypatch):
+    from pypdf import PageObject
+
+    extract_text = PageObject.extract_text
+    calls = []
+
+    def garbled_third_page(page, *args, **kwargs):
+        text = extract_text(page, *args, **kwargs)
+        calls.append(text)
+        return "(cid:12)(cid:34)" if "Page 2" in text else text
+
+    monkeypatch.setattr(PageObject, "extract_text", garbled_third_page)
+    pages = list(iter_pdf_pages(pdf, workers=1, backend="pypdf"))
+
+    assert len(calls) == 5
+    assert "Page 2 explains" in pages[2]
+    assert "(cid:" not in pages[2]
+
+
+@pytest.mark.parametrize("file_type", ["pdf", "docx"])
+def test_unreadable_documents_raise_extraction_errors(tmp_path, file_type):
+    if file_type == "docx":
+        pytest.importorskip("docx")
+    path = tmp_path / f"broken.{file_type}"
+    path.write_bytes(b"%PDF-1.4\nnot really a document")
+
+    with pytest.raises(DocumentExtractionError):
+        list(iter_document_pages(str(path), file_type))
+
+
+def test_other_failures_are_not_reported_as_parse_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        list(iter_document_pages(str(tmp_path / "missing.txt"), "txt"))
@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+from job_queue import InMemoryJobStore, JobQueue, SQLiteJobStore, _new_job
+
+
+def _stores(tmp_path, **retention):
+    return [InMemoryJobStore(**retention), SQLiteJobStore(str(tmp_path / "jobs.sqlite3"), **retention)]
+
+
+def _finish(store, key, status="completed"):
+    job = _new_job(key, {"key": key})
+    store.create(job)
+    store.update(job["job_id"], status=status, result={"summary": key} if status == "completed" else None)
+    return job["job_id"]
+
+
+@pytest.mark.parametrize("index", [0, 1])
+def test_finished_jobs_beyond_the_limit_are_dropped(tmp_path, index):
+    store = _stores(tmp_path, finished_ttl=None, max_finished=2)[index]
+    active = _new_job("active", {})
+    store.create(active)
+
+    finished = [_finish(store, f"video-{i}", "failed" if i == 1 else "completed") for i in range(4)]
+    # Purging runs when a job is created
+    store.create(_new_job("next", {}))
+
+    assert [store.get(job_id) is not None for job_id in finished] == [False, False, True, True]
+    assert store.get(active["job_id"])["status"] == "queued"
+
+
+@pytest.mark.parametrize("index", [0, 1])
+def test_finished_jobs_past_the_ttl_are_dropped(tmp_path, index):
+    store = _stores(tmp_path, finished_ttl=0.05, max_finished=None)[index]
+    old = _finish(store, "old")
+    running = _new_job("running", {})
+    store.create(running)
+    store.update(running["job_id"], status="running")
+
+    time.sleep(0.1)
+    recent = _finish(store, "recent")
+    store.create(_new_job("next", {}))
+
+    assert store.get(old) is None
+    assert store.get(recent)["result"] == {"summary": "recent"}
+    assert store.get(running["job_id"])["status"] == "running"
+
+
+def test_subscribers_follow_a_shared_job():
+    started = threading.Event()
+    release = threading.Event()
+
+    def handler(payload, report):
+        started.set()
+        release.wait(5)
+        report("summarize", 0.5, summary="partial")
+        return {"summary": payload["url"]}
+
+    jobs = JobQueue(handler)
+    job, created = jobs.submit("video", {"url": "a"})
+    started.wait(5)
+    duplicate, duplicate_created = jobs.submit("video", {"url": "a"})
+    first, second = jobs.subscribe(job["job_id"]), jobs.subscribe(duplicate["job_id"])
+    release.set()
+
+    assert (created, duplicate_created, duplicate["job_id"]) == (True, False, job["job_id"])
+    for events in (first, second):
+        assert events.get(timeout=5) == {"status": "running", "stage": "summarize", "progress": 0.5,
+                                         "summary": "partial"}
+        assert events.get(timeout=5) == {"status": "completed", "result": {"summary": "a"}}
+    jobs.unsubscribe(job["job_id"], first)
+    jobs.unsubscribe(job["job_id"], second)
+
+    # Subscribing after the job finished still delivers the final event
+    late = jobs.subscribe(job["job_id"])
+    assert late.get(timeout=5) == {"status": "completed", "result": {"summary": "a"}}
+    jobs.unsubscribe(job["job_id"], late)
+    jobs.shutdown()
@@ -0,0 +1,199 @@
+import numpy as np
+import pytest
+
+from conftest import CAN_RUN_WORKERS, make_document
+from text_summarizer import TextSummarizer
+
+
+def test_sparse_similarity_matches_dense(documents):
+    sparse_summarizer = TextSummarizer(similarity_backend="sparse")
+    dense_summarizer = TextSummarizer(similarity_backend="python")
+
+    for text in documents:
+        vectors = sparse_summarizer._create_sentence_vectors(sparse_summarizer._preprocess_text(text))
+        sparse_matrix = sparse_summarizer._sparse_similarity_matrix(vectors).toarray()
+        dense_matrix = dense_summarizer._calculate_similarity_matrix(vectors)
+
+        np.testing.assert_allclose(sparse_matrix, dense_matrix, atol=1e-12)
+        assert np.all(np.diag(sparse_matrix) == 0)
+
+
+def test_sparse_and_dense_backends_give_the_same_summary(documents):
+    for text in documents:
+        assert TextSummarizer(similarity_backend="sparse").generate_summary(text) == \
+            TextSummarizer(similarity_backend="python").generate_summary(text)
+
+
+def test_power_iteration_matches_networkx(documents):
+    power = TextSummarizer(ranking_backend="power")
+    reference = TextSummarizer(ranking_backend="networkx")
+
+    for text in documents:
+        vectors = power._create_sentence_vectors(power._preprocess_text(text))
+        matrix = power._sparse_similarity_matrix(vectors)
+        power_scores = power._rank_sentences(matrix)
+        reference_scores = reference._rank_sentences(matrix)
+
+        assert power_scores.keys() == reference_scores.keys()
+        for i, score in reference_scores.items():
+            assert abs(power_scores[i] - score) < 1e-4
+
+
+def test_power_iteration_handles_sentences_without_neighbours():
+    # Sentence 2 shares no word with the others, so its row of the matrix is empty
+    matrix = np.array([[0.0, 0.5, 0.0], [0.5, 0.0, 0.0], [0.0, 0.0, 0.0]])
+    power_scores = TextSummarizer(ranking_backend="power")._rank_sentences(matrix)
+    reference_scores = TextSummarizer(ranking_backend="networkx")._rank_sentences(matrix)
+
+    for i, score in reference_scores.items():
+        assert abs(power_scores[i] - score) < 1e-4
+    assert abs(sum(power_scores.values()) - 1.0) < 1e-9
+
+
+def test_power_and_networkx_backends_give_the_same_summary(documents):
+    for text in documents:
+        assert TextSummarizer(ranking_backend="power").generate_summary(text) == \
+            TextSummarizer(ranking_backend="networkx").generate_summary(text)
+
+
+def _near_duplicate_document():
+    base = [
+        "The graph ranks every sentence node by the weight of its edges.",
+        "Whisper decodes each audio segment between two silences.",
+        "The cache keeps recent summaries on disk for a day.",
+        "Cursor pagination reads one page of the history at a time.",
+    ]
+    # One word changed per copy keeps the cosine similarity well above the 0.8 threshold
+    variants = [sentence.replace("every", "each").replace("two", "both").replace("day", "week")
+                .replace("page", "batch") for sentence in base]
+    return base + variants
+
+
+def test_exact_dedup_removes_near_duplicates():
+    summarizer = TextSummarizer(dedup_strategy="exact")
+    sentences = _near_duplicate_document()
+
+    kept, indices = summarizer._remove_duplicate_sentences(sentences)
+
+    assert indices == [0, 1, 2, 3]
+    assert kept == sentences[:4]
+
+
+def test_exact_dedup_keeps_no_similar_pair(documents):
+    summarizer = TextSummarizer(dedup_strategy="exact")
+
+    for text in documents:
+        sentences = summarizer._preprocess_text(text)
+        vectors = summarizer._create_sentence_vectors(sentences)
+        _, indices = summarizer._remove_duplicate_sentences(sentences)
+
+        kept = set(indices)
+        for position, i in enumerate(indices):
+            for j in indices[:position]:
+                assert summarizer._cosine_similarity(vectors[i], vectors[j]) < summarizer.similarity_threshold
+        # Every dropped sentence repeats or resembles a kept sentence before it
+        for i, vector in enumerate(vectors):
+            if i not in kept and summarizer._normalize_sentence(sentences[i]):
+                assert any(summarizer._cosine_similarity(vector, vectors[j]) >= summarizer.similarity_threshold
+                           for j in indices if j < i)
+
+
+def test_minhash_dedup_agrees_with_exact_reference(documents):
+    exact = TextSummarizer(dedup_strategy="exact")
+    minhash = TextSummarizer(dedup_strategy="minhash")
+
+    for sentences in [_near_duplicate_document()] + [exact._preprocess_text(text) for text in documents]:
+        assert minhash._remove_duplicate_sentences(sentences) == exact._remove_duplicate_sentences(sentences)
+
+
+def test_batched_summaries_equal_sequential(documents):
+    summarizer = TextSummarizer()
+    sequential = [summarizer.generate_summary(text) for text in documents]
+
+    results = list(summarizer.summarize_many(documents, mode="batched", chunksize=3))
+
+    assert [result["index"] for result in results] == list(range(len(documents)))
+    assert [result["summary"] for result in results] == sequential
+
+
+@pytest.mark.skipif(not CAN_RUN_WORKERS, reason="worker processes need the NLTK punkt data")
+def test_process_summaries_equal_sequential(documents):
+    summarizer = TextSummarizer()
+    sequential = [summarizer.generate_summary(text) for text in documents]
+
+    results = list(summarizer.summarize_many(documents, mode="process", workers=2, chunksize=2))
+
+    assert [result["index"] for result in results] == list(range(len(documents)))
+    assert [result["summary"] for result in results] == sequential
+
+
+@pytest.mark.skipif(not CAN_RUN_WORKERS, reason="worker processes need the NLTK punkt data")
+def test_process_mode_reads_input_lazily(documents):
+    pulled = []
+
+    def texts():
+        for i in range(1000):
+            pulled.append(i)
+            yield documents[i % len(documents)]
+
+    results = TextSummarizer().summarize_many(texts(), mode="process", workers=2, chunksize=2)
+    next(results)
+    results.close()
+
+    # At most two chunks per worker are in flight, plus the chunk submitted as a refill
+    assert len(pulled) <= 2 * 2 * 2 + 2
+
+
+def test_windowed_summary_equals_unwindowed_within_one_window(documents):
+    windowed = TextSummarizer(window_size=100)
+    unwindowed = TextSummarizer()
+
+    for text in documents:
+        assert windowed.summarize_stream([text]) == unwindowed.generate_summary(text)
+        assert windowed.generate_summary(text) == unwindowed.generate_summary(text)
+
+
+@pytest.mark.parametrize("window_size", [1, 2, 5])
+def test_small_windows_keep_the_summary_budget(window_size):
+    text = make_document(60, seed=3)
+    summarizer = TextSummarizer(window_size=window_size)
+
+    summary = summarizer.generate_summary(text, ratio=0.3, min_sentences=2, max_sentences=10)
+    streamed = summarizer.summarize_stream([text], ratio=0.3, min_sentences=2, max_sentences=10)
+
+    assert len(summarizer._preprocess_text(summary)) == 10
+    assert len(summarizer._preprocess_text(streamed)) == 10
+
+
+def test_small_windows_keep_the_minimum(documents):
+    summarizer = TextSummarizer(window_size=1)
+
+    for text in documents:
+        summary = summarizer.generate_summary(text, ratio=0.01, min_sentences=2, max_sentences=10)
+        assert len(summarizer._preprocess_text(summary)) == 2
+
+
+def test_batched_summaries_follow_the_window_size(documents):
+    summarizer = TextSummarizer(window_size=8)
+    sequential = [summarizer.generate_summary(text) for text in documents]
+
+    assert [result["summary"] for result in summarizer.summarize_many(documents, mode="batched")] == sequential
+
+
+def test_input_sentences_are_counted_once_in_every_path(documents):
+    from metrics import metrics
+
+    def input_count():
+        return metrics.snapshot()["counters"].get('text_summarizer_sentences_total{step="input"}', 0)
+
+    for summarizer in (TextSummarizer(), TextSummarizer(window_size=8)):
+        for text in documents:
+            expected = len(summarizer._preprocess_text(text))
+
+            before = input_count()
+            summarizer.generate_summary(text)
+            assert input_count() - before == expected
+
+            before = input_count()
+            summarizer.summarize_stream([text])
+            assert input_count() - before == expected
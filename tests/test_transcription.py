@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from transcription import SAMPLE_RATE, find_silence_splits
+
+
+@pytest.fixture
+def speech_with_pauses():
+    """Ten seconds of noise "speech" with 200 ms pauses starting at 2.6 s, 5.3 s and 7.9 s"""
+    rng = np.random.default_rng(0)
+    audio = rng.uniform(-0.5, 0.5, 10 * SAMPLE_RATE).astype(np.float32)
+    pauses = [2.6, 5.3, 7.9]
+    for start in pauses:
+        audio[int(start * SAMPLE_RATE):int((start + 0.2) * SAMPLE_RATE)] = 0.0
+    return audio, pauses
+
+
+def _assert_covers(splits, total, segment_length):
+    assert splits[0][0] == 0
+    assert splits[-1][1] == total
+    for (_, end), (start, _) in zip(splits, splits[1:]):
+        assert end == start
+    assert all(0 < end - start <= segment_length for start, end in splits)
+
+
+def test_splits_fall_in_the_pauses(speech_with_pauses):
+    audio, pauses = speech_with_pauses
+
+    splits = find_silence_splits(audio, segment_seconds=3.0, search_seconds=1.0)
+
+    _assert_covers(splits, len(audio), 3 * SAMPLE_RATE)
+    cuts = [end / SAMPLE_RATE for _, end in splits[:-1]]
+    assert len(cuts) == len(pauses)
+    for cut, pause in zip(cuts, pauses):
+        assert pause <= cut <= pause + 0.2
+
+
+def test_short_audio_is_a_single_segment(speech_with_pauses):
+    audio, _ = speech_with_pauses
+
+    assert find_silence_splits(audio, segment_seconds=30.0) == [(0, len(audio))]
+
+
+@pytest.mark.parametrize("segment_seconds", [0.01, 0.0301, 1.0])
+def test_segments_shorter_than_the_search_window_fall_back_to_hard_splits(speech_with_pauses, segment_seconds):
+    audio, _ = speech_with_pauses
+    audio = audio[:SAMPLE_RATE + 7]  # Ends in a partial frame
+
+    splits = find_silence_splits(audio, segment_seconds=segment_seconds, search_seconds=5.0, frame_ms=30)
+
+    _assert_covers(splits, len(audio), int(segment_seconds * SAMPLE_RATE))
@@ -0,0 +1,139 @@
+import os
+
+import pytest
+
+from transcript_sources import LocalTranscriptSource
+from youtube_summarizer import YouTubeVideoSummarizer
+
+
+class WordTokenizer:
+    """Tokenizer stand-in counting a fixed number of tokens per word"""
+
+    model_max_length = 1024
+
+    def __init__(self, tokens_per_word=1):
+        self.tokens_per_word = tokens_per_word
+
+    def __call__(self, text, add_special_tokens=True):
+        texts = text if isinstance(text, list) else [text]
+        ids = [list(range(len(item.split()) * self.tokens_per_word)) for item in texts]
+        return {"input_ids": ids if isinstance(text, list) else ids[0]}
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+
+@pytest.fixture
+def summarizer(tmp_path):
+    return YouTubeVideoSummarizer(output_dir=str(tmp_path), transcript_sources=[], cache_artifacts=False,
+                                  verbose=False)
+
+
+@pytest.mark.parametrize("num_tokens", [1, 5, 20, 50, 100, 214, 500, 1022])
+def test_chunk_lengths_leave_room_between_the_bounds(summarizer, num_tokens):
+    max_length, min_length = summarizer._chunk_lengths("", num_tokens=num_tokens)
+
+    assert 0 <= min_length <= 30
+    assert max_length <= max(150, min_length + 10)
+    assert max_length >= min_length + 10
+
+
+def test_full_chunks_get_the_capped_bounds(summarizer):
+    assert summarizer._chunk_lengths("", num_tokens=1022) == (150, 30)
+
+
+def test_chunk_lengths_count_tokens_not_words(summarizer):
+    text = "word " * 40
+
+    assert summarizer._chunk_lengths(text, WordTokenizer(tokens_per_word=3)) == \
+        summarizer._chunk_lengths("", num_tokens=120)
+
+
+def test_packed_chunks_carry_their_token_counts(summarizer):
+    tokenizer = WordTokenizer()
+    text = " ".join(f"Sentence number {i} talks about the cache." for i in range(400))
+
+    packed = summarizer._pack_by_tokens(text, tokenizer)
+
+    assert len(packed) > 1
+    for chunk, num_tokens in packed:
+        assert num_tokens == len(chunk.split())
+        assert num_tokens <= 1022
+    assert [chunk for chunk, _ in packed] == summarizer.chunk_text_by_tokens(text, tokenizer)
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "transcripts")
+
+
+class FakePipeline:
+    """Summarization pipeline stand-in returning the first words of every chunk"""
+
+    tokenizer = None
+
+    def __call__(self, chunks, max_length=None, min_length=None, **kwargs):
+        return [{"summary_text": " ".join(chunk.split()[:8])} for chunk in chunks]
+
+
+@pytest.fixture
+def offline_summarizer(tmp_path, monkeypatch):
+    summarizer = YouTubeVideoSummarizer(output_dir=str(tmp_path), transcript_sources=[LocalTranscriptSource(FIXTURES)],
+                                        cache_artifacts=False, verbose=False)
+    summarizer.summarizer = FakePipeline()
+    whisper_runs = []
+
+    def download_audio(youtube_url, force_refresh=False):
+        whisper_runs.append(youtube_url)
+        return "audio.webm", "Downloaded title", 60, summarizer._extract_video_id(youtube_url)
+
+    monkeypatch.setattr(summarizer, "download_audio", download_audio)
+    monkeypatch.setattr(summarizer, "transcribe_audio",
+                        lambda audio_file: "Whisper heard this transcript. It has two sentences.")
+    monkeypatch.setattr(summarizer, "_fetch_video_info", lambda youtube_url: ("Fetched title", 90))
+    return summarizer, whisper_runs
+
+
+def test_captions_from_a_local_fixture_skip_whisper(offline_summarizer):
+    summarizer, whisper_runs = offline_summarizer
+
+    result = summarizer.process_video("https://youtu.be/CaptionVid1", save_files=False)
+
+    assert whisper_runs == []
+    assert result["transcript_source"] == "local"
+    assert result["title"] == "Caching and pagination"
+    assert result["duration"] == 312
+    assert result["transcription"].startswith("The summary cache keeps recent results on disk.")
+    assert result["summary"]
+
+
+def test_plain_text_fixture_is_used_with_the_fetched_title(offline_summarizer):
+    summarizer, whisper_runs = offline_summarizer
+
+    result = summarizer.process_video("https://www.youtube.com/watch?v=PlainText01", save_files=False)
+
+    assert whisper_runs == []
+    assert result["transcript_source"] == "local"
+    assert result["title"] == "Fetched title"
+
+
+def test_videos_without_captions_fall_back_to_whisper(offline_summarizer):
+    summarizer, whisper_runs = offline_summarizer
+
+    result = summarizer.process_video("https://youtu.be/NoCaptions1", save_files=False)
+
+    assert whisper_runs == ["https://youtu.be/NoCaptions1"]
+    assert result["transcript_source"] == "whisper"
+    assert result["transcription"] == "Whisper heard this transcript. It has two sentences."
+
+
+def test_sources_are_tried_in_order(tmp_path):
+    class EmptySource:
+        name = "empty"
+
+        def fetch(self, video_id):
+            return {"text": "   "}
+
+    summarizer = YouTubeVideoSummarizer(output_dir=str(tmp_path), cache_artifacts=False, verbose=False,
+                                        transcript_sources=[EmptySource(), LocalTranscriptSource(FIXTURES)])
+
+    assert summarizer.fetch_transcript("CaptionVid1")["source"] == "local"
+    assert summarizer.fetch_transcript("NoCaptions1") is None
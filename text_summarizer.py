@@ -1,29 +1,125 @@
 import numpy as np
 import networkx as nx
+from scipy import sparse
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize, word_tokenize
-from typing import List, Dict, Tuple, Set
-import re
+from typing import List, Dict, Tuple, Set, Optional, Union, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+import math
+import os
+import time
+from dedup import get_dedup_strategy
+from metrics import metrics
 
 # Download required NLTK resources (uncomment if not already downloaded)
 # nltk.download('punkt')
 # nltk.download('stopwords')
 
+
+class TermVector(dict):
+    """
+    Word counts of a sentence that also carry their Euclidean norm.
+    
+    Still a plain word -> count mapping for the dedup strategies and the term
+    matrix; _cosine_similarity uses the stored norm instead of recomputing it.
+    """
+    __slots__ = ('norm',)
+    
+    def __init__(self, counts: Dict[str, int]):
+        super().__init__(counts)
+        self.norm = math.sqrt(sum(count * count for count in counts.values()))
+
+
+class SentenceFeatures:
+    """
+    Everything the summarizer derives from one sentence, computed once per document.
+    
+    Sentences with the same normalized form share one instance, so repeated lines
+    are tokenized only once.
+    """
+    __slots__ = ('normalized', 'tokens', 'vector')
+    
+    def __init__(self, normalized: str, tokens: Tuple[str, ...], vector: TermVector):
+        self.normalized = normalized
+        self.tokens = tokens
+        self.vector = vector
+        
+    @property
+    def norm(self) -> float:
+        return self.vector.norm
+
 class TextSummarizer:
-    def __init__(self, language: str = 'english', similarity_threshold: float = 0.8):
+    # Sentences per window when streaming without a configured window size
+    DEFAULT_WINDOW_SIZE = 500
+    
+    def __init__(self, language: str = 'english', similarity_threshold: float = 0.8,
+                 similarity_backend: str = 'sparse', ranking_backend: str = 'power',
+                 damping: float = 0.85, tolerance: float = 1.0e-6, max_iterations: int = 100,
+                 dedup_strategy='exact', window_size: Optional[int] = None):
         """
         Initialize the TextSummarizer with a specific language.
         
         Args:
             language: Language for stopwords. Default is 'english'.
             similarity_threshold: Threshold for detecting duplicate sentences (0.0 to 1.0).
+            similarity_backend: 'sparse' computes the similarity matrix with a single sparse
+                matrix product, 'python' uses the pairwise reference implementation.
+            ranking_backend: 'power' runs PageRank as a NumPy/SciPy power iteration on the
+                similarity matrix, 'networkx' uses nx.pagerank as the reference implementation.
+            damping: PageRank damping factor.
+            tolerance: PageRank convergence tolerance (per node, as in networkx).
+            max_iterations: Maximum number of PageRank iterations.
+            dedup_strategy: 'exact' compares every sentence with every kept sentence,
+                'minhash' only compares MinHash/LSH candidates. A strategy object with a
+                select method (see dedup.py) can be passed as well.
+            window_size: When set, documents with more sentences than this are summarized
+                hierarchically: each window of sentences is ranked on its own and a second
+                ranking pass runs over the window winners, so memory is bounded by the
+                window size instead of the document size.
         """
+        if similarity_backend not in ('sparse', 'python'):
+            raise ValueError(f"Unknown similarity backend: {similarity_backend}")
+        if ranking_backend not in ('power', 'networkx'):
+            raise ValueError(f"Unknown ranking backend: {ranking_backend}")
+            
         try:
             self.stop_words = set(stopwords.words(language))
         except:
             self.stop_words = set()
         self.similarity_threshold = similarity_threshold
+        self.similarity_backend = similarity_backend
+        self.ranking_backend = ranking_backend
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.dedup_strategy = get_dedup_strategy(dedup_strategy)
+        self.window_size = window_size
+        
+        # Constructor arguments, used to build identical summarizers in worker processes
+        self._config = {
+            'language': language,
+            'similarity_threshold': similarity_threshold,
+            'similarity_backend': similarity_backend,
+            'ranking_backend': ranking_backend,
+            'damping': damping,
+            'tolerance': tolerance,
+            'max_iterations': max_iterations,
+            'dedup_strategy': dedup_strategy,
+            'window_size': window_size,
+        }
+        
+    @property
+    def config(self) -> Dict:
+        """
+        Constructor arguments of this summarizer, e.g. for cache keys.
+        
+        Returns:
+            Copy of the configuration dictionary.
+        """
+        return dict(self._config)
         
     def _preprocess_text(self, text: str) -> List[str]:
         """
@@ -57,7 +153,40 @@ class TextSummarizer:
             Normalized sentence.
         """
         # Remove extra whitespace and convert to lowercase
-        return re.sub(r'\s+', ' ', sentence.lower().strip())
+        return ' '.join(sentence.lower().split())
+    
+    def _sentence_features(self, sentences: List[str],
+                           memo: Optional[Dict[str, SentenceFeatures]] = None) -> List[SentenceFeatures]:
+        """
+        Normalize, tokenize and count the words of each sentence once.
+        
+        Args:
+            sentences: List of sentences from the text.
+            memo: Features already computed, keyed by normalized sentence; new entries
+                are added to it. Defaults to a memo private to this call.
+            
+        Returns:
+            List of sentence features, one per sentence.
+        """
+        memo = {} if memo is None else memo
+        features = []
+        
+        for sentence in sentences:
+            normalized = self._normalize_sentence(sentence)
+            sentence_features = memo.get(normalized)
+            if sentence_features is None:
+                tokens = tuple(w for w in word_tokenize(normalized) if w not in self.stop_words and w.isalnum())
+                
+                # Create sentence vector based on word frequencies
+                counts = {}
+                for word in tokens:
+                    counts[word] = counts.get(word, 0) + 1
+                    
+                sentence_features = SentenceFeatures(normalized, tokens, TermVector(counts))
+                memo[normalized] = sentence_features
+            features.append(sentence_features)
+            
+        return features
     
     def _create_sentence_vectors(self, sentences: List[str]) -> List[Dict[str, int]]:
         """
@@ -69,23 +198,79 @@ class TextSummarizer:
         Returns:
             List of sentence vectors.
         """
-        sentence_vectors = []
+        return [features.vector for features in self._sentence_features(sentences)]
+    
+    def _build_term_matrix(self, sentence_vectors: List[Dict[str, int]]) -> sparse.csr_matrix:
+        """
+        Build a CSR term-frequency matrix over a vocabulary shared by all sentences.
         
-        for sentence in sentences:
-            words = word_tokenize(sentence.lower())
-            words = [w for w in words if w not in self.stop_words and w.isalnum()]
-            
-            # Create sentence vector based on word frequencies
-            sentence_vector = {}
-            for word in words:
-                if word not in sentence_vector:
-                    sentence_vector[word] = 1
-                else:
-                    sentence_vector[word] += 1
-                    
-            sentence_vectors.append(sentence_vector)
+        Args:
+            sentence_vectors: List of sentence vectors.
+            
+        Returns:
+            Sparse matrix with one row per sentence and one column per word.
+        """
+        vocabulary = {}
+        indptr = [0]
+        indices = []
+        data = []
+        
+        for vector in sentence_vectors:
+            for word, count in vector.items():
+                indices.append(vocabulary.setdefault(word, len(vocabulary)))
+                data.append(count)
+            indptr.append(len(indices))
+            
+        return sparse.csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int64), np.array(indptr, dtype=np.int64)),
+            shape=(len(sentence_vectors), len(vocabulary))
+        )
+    
+    def _normalized_term_matrix(self, sentence_vectors: List[Dict[str, int]]) -> sparse.csr_matrix:
+        """
+        Build the term matrix and scale each row to unit length.
+        
+        Args:
+            sentence_vectors: List of sentence vectors.
+            
+        Returns:
+            Sparse matrix of L2-normalized sentence rows; empty sentences keep a zero row.
+        """
+        term_matrix = self._build_term_matrix(sentence_vectors)
+        
+        norms = np.sqrt(np.asarray(term_matrix.multiply(term_matrix).sum(axis=1)).ravel())
+        inverse_norms = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+        return (sparse.diags(inverse_norms) @ term_matrix).tocsr()
+    
+    def _cosine_product(self, normalized: sparse.csr_matrix) -> sparse.csr_matrix:
+        """
+        Multiply normalized sentence rows with their transpose.
+        
+        Args:
+            normalized: Sparse matrix of L2-normalized sentence rows.
             
-        return sentence_vectors
+        Returns:
+            Sparse similarity matrix with a zero diagonal.
+        """
+        similarity_matrix = (normalized @ normalized.T).tocsr()
+        similarity_matrix.setdiag(0)
+        similarity_matrix.eliminate_zeros()
+        return similarity_matrix
+    
+    def _sparse_similarity_matrix(self, sentence_vectors: List[Dict[str, int]]) -> sparse.csr_matrix:
+        """
+        Calculate cosine similarity between all sentence vectors with one sparse product.
+        
+        Each row of the term matrix is L2-normalized once, so the product of the matrix
+        with its transpose holds the cosine similarity of every pair of sentences.
+        
+        Args:
+            sentence_vectors: List of sentence vectors.
+            
+        Returns:
+            Sparse similarity matrix with a zero diagonal.
+        """
+        return self._cosine_product(self._normalized_term_matrix(sentence_vectors))
     
     def _calculate_similarity_matrix(self, sentence_vectors: List[Dict[str, int]]) -> np.ndarray:
         """
@@ -97,6 +282,9 @@ class TextSummarizer:
         Returns:
             Similarity matrix as numpy array.
         """
+        if self.similarity_backend == 'sparse':
+            return self._sparse_similarity_matrix(sentence_vectors).toarray()
+            
         num_sentences = len(sentence_vectors)
         similarity_matrix = np.zeros((num_sentences, num_sentences))
         
@@ -125,6 +313,13 @@ class TextSummarizer:
         if not vec1 or not vec2:
             return 0.0
             
+        # Vectors from _sentence_features know their norm; only shared words add to the dot product
+        if isinstance(vec1, TermVector) and isinstance(vec2, TermVector):
+            if len(vec1) > len(vec2):
+                vec1, vec2 = vec2, vec1
+            dot_product = sum(count * vec2.get(word, 0) for word, count in vec1.items())
+            return dot_product / (vec1.norm * vec2.norm)
+            
         # Find all unique words in both sentences
         all_words = set(vec1.keys()).union(set(vec2.keys()))
         
@@ -149,71 +344,61 @@ class TextSummarizer:
         
         return dot_product / (magnitude1 * magnitude2)
     
-    def _exact_duplicate_check(self, sentences: List[str]) -> Tuple[List[str], List[int]]:
+    def _exact_duplicate_check(self, sentences: List[str],
+                               features: Optional[List[SentenceFeatures]] = None) -> Tuple[List[str], List[int]]:
         """
         Remove exact duplicates from sentences using a more efficient approach.
         
         Args:
             sentences: List of original sentences.
+            features: Features of the sentences, if already computed.
             
         Returns:
             Tuple containing unique sentences and mapping to original indices.
         """
+        if features is None:
+            features = self._sentence_features(sentences)
+            
         unique_sentences = []
         original_indices = []
         seen = set()
         
         for i, sentence in enumerate(sentences):
-            # Normalize the sentence before checking
-            normalized = self._normalize_sentence(sentence)
+            # Compare the normalized sentences
+            normalized = features[i].normalized
             
-            if normalized not in seen and normalized.strip():
+            if normalized not in seen and normalized:
                 seen.add(normalized)
                 unique_sentences.append(sentence)
                 original_indices.append(i)
                 
         return unique_sentences, original_indices
     
-    def _remove_duplicate_sentences(self, sentences: List[str]) -> Tuple[List[str], List[int]]:
+    def _remove_duplicate_sentences(self, sentences: List[str],
+                                    features: Optional[List[SentenceFeatures]] = None) -> Tuple[List[str], List[int]]:
         """
         Remove duplicate or highly similar sentences from the text using a two-stage approach.
         
         Args:
             sentences: List of original sentences.
+            features: Features of the sentences, if already computed.
             
         Returns:
             Tuple containing filtered sentences and mapping to original indices.
         """
+        if features is None:
+            features = self._sentence_features(sentences)
+            
         # First stage: Remove exact duplicates efficiently
-        unique_sentences, original_indices = self._exact_duplicate_check(sentences)
+        unique_sentences, original_indices = self._exact_duplicate_check(sentences, features)
         
         # Second stage: Check for semantic similarity
         if len(unique_sentences) > 1:
-            sentence_vectors = self._create_sentence_vectors(unique_sentences)
-            filtered_sentences = []
-            filtered_indices = []
-            similarity_checked = set()
-            
-            for i, (sentence, vector) in enumerate(zip(unique_sentences, sentence_vectors)):
-                is_duplicate = False
-                
-                # Check similarity with already filtered sentences
-                for j in range(len(filtered_sentences)):
-                    # Create a unique pair identifier
-                    pair_id = f"{min(i, j)}_{max(i, j)}"
-                    
-                    # Only check if we haven't compared these sentences before
-                    if pair_id not in similarity_checked:
-                        similarity_checked.add(pair_id)
-                        similarity = self._cosine_similarity(vector, sentence_vectors[filtered_indices[j]])
-                        
-                        if similarity >= self.similarity_threshold:
-                            is_duplicate = True
-                            break
-                
-                if not is_duplicate:
-                    filtered_sentences.append(sentence)
-                    filtered_indices.append(i)
+            sentence_vectors = [features[idx].vector for idx in original_indices]
+            filtered_indices = self.dedup_strategy.select(
+                sentence_vectors, self.similarity_threshold, self._cosine_similarity
+            )
+            filtered_sentences = [unique_sentences[idx] for idx in filtered_indices]
                     
             # Map back to original indices
             final_indices = [original_indices[idx] for idx in filtered_indices]
@@ -221,82 +406,208 @@ class TextSummarizer:
         
         return unique_sentences, original_indices
     
-    def _rank_sentences(self, similarity_matrix: np.ndarray) -> Dict[int, float]:
+    def _power_iteration_pagerank(self, similarity_matrix: Union[np.ndarray, sparse.spmatrix],
+                                  start_scores: Optional[np.ndarray] = None) -> Tuple[np.ndarray, int]:
+        """
+        Run weighted PageRank as a power iteration directly on the similarity matrix.
+        
+        Mirrors nx.pagerank on the graph built from the matrix: rows are normalized to
+        transition probabilities and sentences without any similar sentence spread their
+        score uniformly.
+        
+        Args:
+            similarity_matrix: Dense or sparse matrix of sentence similarities.
+            start_scores: Optional score vector to warm-start the iteration from.
+            
+        Returns:
+            Tuple containing the score vector and the number of iterations run.
+        """
+        num_sentences = similarity_matrix.shape[0]
+        
+        # Row-normalize the weights into a transition matrix
+        transition = sparse.csr_matrix(similarity_matrix, dtype=np.float64)
+        out_weights = np.asarray(transition.sum(axis=1)).ravel()
+        is_dangling = out_weights == 0
+        inverse_weights = np.divide(1.0, out_weights, out=np.zeros_like(out_weights), where=~is_dangling)
+        transition = sparse.diags(inverse_weights) @ transition
+        
+        teleport = np.full(num_sentences, 1.0 / num_sentences)
+        if start_scores is None:
+            scores = teleport.copy()
+        else:
+            scores = np.asarray(start_scores, dtype=np.float64)
+            scores = scores / scores.sum()
+            
+        for iteration in range(1, self.max_iterations + 1):
+            previous = scores
+            scores = self.damping * (scores @ transition + scores[is_dangling].sum() * teleport) \
+                + (1 - self.damping) * teleport
+            
+            if np.abs(scores - previous).sum() < num_sentences * self.tolerance:
+                return scores, iteration
+                
+        raise nx.PowerIterationFailedConvergence(self.max_iterations)
+    
+    def _rank_sentences(self, similarity_matrix: Union[np.ndarray, sparse.spmatrix],
+                        start_scores: Optional[Dict[int, float]] = None) -> Dict[int, float]:
         """
         Rank sentences using PageRank algorithm.
         
         Args:
-            similarity_matrix: Matrix of sentence similarities.
+            similarity_matrix: Dense or sparse matrix of sentence similarities.
+            start_scores: Optional previous scores to warm-start the power iteration from.
             
         Returns:
             Dictionary mapping sentence indices to scores.
         """
         # Check if similarity matrix is valid
-        if similarity_matrix.size == 0:
+        if similarity_matrix.shape[0] == 0:
             return {}
             
-        # Create graph from similarity matrix
-        nx_graph = nx.from_numpy_array(similarity_matrix)
+        num_sentences = similarity_matrix.shape[0]
         
-        # Apply PageRank algorithm
         try:
-            scores = nx.pagerank(nx_graph)
+            if self.ranking_backend == 'networkx':
+                # Create graph from similarity matrix and apply PageRank algorithm
+                if sparse.issparse(similarity_matrix):
+                    nx_graph = nx.from_scipy_sparse_array(similarity_matrix)
+                else:
+                    nx_graph = nx.from_numpy_array(similarity_matrix)
+                scores = nx.pagerank(nx_graph, alpha=self.damping, max_iter=self.max_iterations,
+                                     tol=self.tolerance, nstart=start_scores)
+            else:
+                start_vector = None
+                if start_scores:
+                    start_vector = np.array([start_scores.get(i, 0.0) for i in range(num_sentences)])
+                    if start_vector.sum() <= 0:
+                        start_vector = None
+                        
+                score_vector, iterations = self._power_iteration_pagerank(similarity_matrix, start_vector)
+                # Reported through metrics; the summarizer is shared across request threads
+                metrics.observe("text_summarizer_pagerank_iterations", iterations)
+                scores = {i: float(score) for i, score in enumerate(score_vector)}
         except:
             # Fallback if PageRank fails
-            scores = {i: 1.0 for i in range(similarity_matrix.shape[0])}
+            scores = {i: 1.0 for i in range(num_sentences)}
         
         return scores
     
-    def generate_summary(self, text: str, ratio: float = 0.3, min_sentences: int = 2, max_sentences: int = 10, 
-                  remove_duplicates: bool = True) -> str:
+    def _prepare_sentences(self, text: str, ratio: float, min_sentences: int, max_sentences: int,
+                           remove_duplicates: bool
+                           ) -> Tuple[Optional[str], List[str], List[str], List[int], List[SentenceFeatures]]:
         """
-        Generate a summary of the input text.
+        Split the text into sentences and optionally remove duplicates.
+        
+        Documents with more sentences than the configured window size are summarized
+        window by window right away.
         
         Args:
             text: The input text to summarize.
             ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
             min_sentences: Minimum number of sentences in the summary.
             max_sentences: Maximum number of sentences in the summary.
-            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            remove_duplicates: Whether to remove duplicate sentences.
             
         Returns:
-            Summarized text.
+            Tuple containing the summary if the text is too short or too long to rank in
+            one pass (otherwise None), the original sentences, the sentences to rank,
+            their original indices and their features.
         """
         # Check for empty text
         if not text or not text.strip():
-            return ""
+            return "", [], [], [], []
             
         # Preprocess text
-        original_sentences = self._preprocess_text(text)
+        with metrics.timer("text_summarizer_stage", stage="preprocess"):
+            original_sentences = self._preprocess_text(text)
+        metrics.increment("text_summarizer_sentences_total", len(original_sentences), step="input")
+        
+        # Long documents are ranked window by window when a window size is configured
+        if self.window_size and len(original_sentences) > self.window_size:
+            summary = self._summarize_windows(iter(original_sentences), ratio, min_sentences, max_sentences,
+                                              remove_duplicates)
+            return summary, original_sentences, [], [], []
+            
+        return self._filter_sentences(original_sentences, text, min_sentences, remove_duplicates)
+    
+    def _filter_sentences(self, original_sentences: List[str], text: str, min_sentences: int,
+                          remove_duplicates: bool, features: Optional[List[SentenceFeatures]] = None
+                          ) -> Tuple[Optional[str], List[str], List[str], List[int], List[SentenceFeatures]]:
+        """
+        Optionally remove duplicates from already split sentences.
         
+        Args:
+            original_sentences: Sentences of the input text.
+            text: The input text, returned as is when it is too short to rank.
+            min_sentences: Minimum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences.
+            features: Features of the original sentences, if already computed.
+            
+        Returns:
+            Same tuple as _prepare_sentences.
+        """
         if not original_sentences:
-            return text
+            return text, [], [], [], []
             
         if len(original_sentences) <= min_sentences:
-            return text
+            return text, original_sentences, [], [], []
+        
+        # Tokenize every sentence once; dedup, similarity and ranking share the result
+        if features is None:
+            with metrics.timer("text_summarizer_stage", stage="vectors"):
+                features = self._sentence_features(original_sentences)
         
         # Remove duplicate sentences if requested
         if remove_duplicates:
-            sentences, original_indices_map = self._remove_duplicate_sentences(original_sentences)
+            with metrics.timer("text_summarizer_stage", stage="dedup"):
+                sentences, original_indices_map = self._remove_duplicate_sentences(original_sentences, features)
+            metrics.increment("text_summarizer_sentences_total", len(original_sentences), step="dedup_in")
+            metrics.increment("text_summarizer_sentences_total", len(sentences), step="dedup_out")
+            metrics.set_gauge("text_summarizer_dedup_ratio", 1 - len(sentences) / len(original_sentences))
             if len(sentences) <= min_sentences:
-                return ' '.join(sentences)
+                return ' '.join(sentences), original_sentences, sentences, original_indices_map, []
         else:
             sentences = original_sentences
             original_indices_map = list(range(len(original_sentences)))
         
         # Handle case where we have no sentences after deduplication
         if not sentences:
-            return original_sentences[0] if original_sentences else ""
+            return original_sentences[0] if original_sentences else "", original_sentences, [], [], []
             
-        # Create sentence vectors
-        sentence_vectors = self._create_sentence_vectors(sentences)
-        
-        # Calculate similarity matrix
-        similarity_matrix = self._calculate_similarity_matrix(sentence_vectors)
+        return None, original_sentences, sentences, original_indices_map, [features[i] for i in original_indices_map]
+    
+    def _similarity_for_ranking(self, sentence_vectors: List[Dict[str, int]]) -> Union[np.ndarray, sparse.spmatrix]:
+        """
+        Calculate the similarity matrix, kept sparse when the backend allows it.
         
-        # Rank sentences
-        sentence_scores = self._rank_sentences(similarity_matrix)
+        Args:
+            sentence_vectors: List of sentence vectors.
+            
+        Returns:
+            Dense or sparse similarity matrix.
+        """
+        if self.similarity_backend == 'sparse':
+            return self._sparse_similarity_matrix(sentence_vectors)
+        return self._calculate_similarity_matrix(sentence_vectors)
+    
+    def _compose_summary(self, original_sentences: List[str], sentences: List[str],
+                         original_indices_map: List[int], sentence_scores: Dict[int, float],
+                         ratio: float, min_sentences: int, max_sentences: int) -> str:
+        """
+        Join the top-ranked sentences in their original order.
         
+        Args:
+            original_sentences: Sentences of the original text.
+            sentences: Sentences that were ranked.
+            original_indices_map: Original index of each ranked sentence.
+            sentence_scores: Dictionary mapping ranked sentence indices to scores.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            
+        Returns:
+            Summarized text.
+        """
         # Determine number of sentences for the summary
         num_sentences = max(min_sentences, min(max_sentences, int(len(sentences) * ratio)))
         num_sentences = min(num_sentences, len(sentences))
@@ -315,6 +626,384 @@ class TextSummarizer:
         summary = ' '.join([original_sentences[i] for i in original_top_indices])
         return summary
     
+    def generate_summary(self, text: str, ratio: float = 0.3, min_sentences: int = 2, max_sentences: int = 10, 
+                  remove_duplicates: bool = True) -> str:
+        """
+        Generate a summary of the input text.
+        
+        Args:
+            text: The input text to summarize.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            
+        Returns:
+            Summarized text.
+        """
+        summary, original_sentences, sentences, original_indices_map, features = self._prepare_sentences(
+            text, ratio, min_sentences, max_sentences, remove_duplicates
+        )
+        if summary is not None:
+            return summary
+            
+        return self._rank_and_compose(original_sentences, sentences, original_indices_map,
+                                      ratio, min_sentences, max_sentences, features)
+    
+    def _rank_and_compose(self, original_sentences: List[str], sentences: List[str],
+                          original_indices_map: List[int], ratio: float, min_sentences: int,
+                          max_sentences: int, features: Optional[List[SentenceFeatures]] = None) -> str:
+        """
+        Vectorize and rank the filtered sentences and build the summary.
+        
+        Args:
+            original_sentences: Sentences of the original text.
+            sentences: Sentences to rank.
+            original_indices_map: Original index of each sentence to rank.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            features: Features of the sentences to rank, if already computed.
+            
+        Returns:
+            Summarized text.
+        """
+        # Create sentence vectors, unless dedup already did
+        if features:
+            sentence_vectors = [sentence_features.vector for sentence_features in features]
+        else:
+            with metrics.timer("text_summarizer_stage", stage="vectors"):
+                sentence_vectors = self._create_sentence_vectors(sentences)
+        
+        # Calculate similarity matrix
+        with metrics.timer("text_summarizer_stage", stage="similarity"):
+            similarity_matrix = self._similarity_for_ranking(sentence_vectors)
+        stored = similarity_matrix.nnz if sparse.issparse(similarity_matrix) else similarity_matrix.size
+        metrics.observe("text_summarizer_matrix_entries", stored, backend=self.similarity_backend)
+        
+        # Rank sentences
+        with metrics.timer("text_summarizer_stage", stage="ranking"):
+            sentence_scores = self._rank_sentences(similarity_matrix)
+        
+        with metrics.timer("text_summarizer_stage", stage="compose"):
+            summary = self._compose_summary(original_sentences, sentences, original_indices_map, sentence_scores,
+                                            ratio, min_sentences, max_sentences)
+        metrics.increment("text_summarizer_summaries_total")
+        return summary
+    
+    def _iter_stream_sentences(self, pages: Iterable[str]) -> Iterator[str]:
+        """
+        Split a stream of pages or paragraphs into sentences.
+        
+        The last sentence of each page is held back until the next page arrives, since
+        it may continue there.
+        
+        Args:
+            pages: Iterable of text pieces in document order.
+            
+        Returns:
+            Iterator of sentences.
+        """
+        pending = ""
+        
+        for page in pages:
+            if not page or not page.strip():
+                continue
+            pending = f"{pending}\n{page}" if pending else page
+            sentences = self._preprocess_text(pending)
+            if len(sentences) > 1:
+                yield from sentences[:-1]
+                pending = sentences[-1]
+                
+        if pending.strip():
+            yield from self._preprocess_text(pending)
+    
+    def _window_winners(self, window: List[Tuple[int, str]], keep: int, remove_duplicates: bool,
+                        memo: Optional[Dict[str, SentenceFeatures]] = None) -> Tuple[List[Tuple[int, str]], int]:
+        """
+        Rank one window of sentences and keep its best sentences.
+        
+        Args:
+            window: List of (position in the document, sentence) tuples.
+            keep: Maximum number of sentences to keep.
+            remove_duplicates: Whether to remove near-duplicates inside the window first.
+            memo: Sentence features by normalized sentence, reused and extended.
+            
+        Returns:
+            Tuple containing the kept sentences in document order and the number of
+            sentences left in the window after deduplication.
+        """
+        sentence_vectors = [
+            features.vector for features in self._sentence_features([sentence for _, sentence in window], memo)
+        ]
+        
+        if remove_duplicates and len(window) > 1:
+            kept_indices = self.dedup_strategy.select(
+                sentence_vectors, self.similarity_threshold, self._cosine_similarity
+            )
+            window = [window[i] for i in kept_indices]
+            sentence_vectors = [sentence_vectors[i] for i in kept_indices]
+            
+        if len(window) <= keep:
+            return window, len(window)
+            
+        sentence_scores = self._rank_sentences(self._similarity_for_ranking(sentence_vectors))
+        top_indices = sorted(sentence_scores, key=lambda i: sentence_scores[i], reverse=True)[:keep]
+        return [window[i] for i in sorted(top_indices)], len(window)
+    
+    def _summarize_windows(self, sentences: Iterator[str], ratio: float, min_sentences: int,
+                           max_sentences: int, remove_duplicates: bool) -> str:
+        """
+        Summarize a stream of sentences hierarchically, one window at a time.
+        
+        Every window contributes its top sentences; a final ranking pass over these
+        winners picks the summary. The summary length is derived from the total number
+        of (deduplicated) sentences seen, as in generate_summary. Exact duplicates are
+        detected across the whole document, near-duplicates within each window and
+        among the winners.
+        
+        Args:
+            sentences: Iterator of sentences in document order.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            
+        Returns:
+            Summarized text.
+        """
+        window_size = self.window_size or self.DEFAULT_WINDOW_SIZE
+        # Every window may supply the whole summary, however small the window is
+        keep = max(min_sentences, max_sentences)
+        # Winners are collapsed once they would fill a window, but never below the summary budget
+        collapse_size = max(window_size, 2 * keep)
+        
+        seen = set()
+        window = []
+        winners = []
+        total_sentences = 0
+        flushed = False
+        # Features of the current window and the winners, so winners are not tokenized again
+        memo = {}
+        
+        for position, sentence in enumerate(sentences):
+            if remove_duplicates:
+                normalized = self._normalize_sentence(sentence)
+                if not normalized:
+                    continue
+                # Only a hash is kept per sentence to bound memory on long documents
+                key = hash(normalized)
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+            window.append((position, sentence))
+            if len(window) < window_size:
+                continue
+                
+            window_winners, window_count = self._window_winners(window, keep, remove_duplicates, memo)
+            winners.extend(window_winners)
+            total_sentences += window_count
+            window = []
+            flushed = True
+            
+            # Collapse the winners once they would fill a window themselves
+            if len(winners) > collapse_size:
+                winners, _ = self._window_winners(winners, collapse_size // 2, False, memo)
+                
+            # Only the winners' features are needed again
+            winner_keys = [self._normalize_sentence(sentence) for _, sentence in winners]
+            memo = {key: memo[key] for key in winner_keys if key in memo}
+                
+        # A document that fits in one window is summarized in a single pass
+        if not flushed:
+            window_sentences = [sentence for _, sentence in window]
+            summary, original_sentences, ranked, original_indices_map, features = self._filter_sentences(
+                window_sentences, ' '.join(window_sentences), min_sentences, remove_duplicates
+            )
+            if summary is not None:
+                return summary
+            return self._rank_and_compose(original_sentences, ranked, original_indices_map,
+                                          ratio, min_sentences, max_sentences, features)
+            
+        if window:
+            window_winners, window_count = self._window_winners(window, keep, remove_duplicates, memo)
+            winners.extend(window_winners)
+            total_sentences += window_count
+            
+        # Second pass: rank the window winners against each other
+        if remove_duplicates and len(winners) > 1:
+            winner_vectors = [
+                features.vector for features in self._sentence_features([sentence for _, sentence in winners], memo)
+            ]
+            kept_indices = self.dedup_strategy.select(
+                winner_vectors, self.similarity_threshold, self._cosine_similarity
+            )
+            winners = [winners[i] for i in kept_indices]
+            
+        num_sentences = max(min_sentences, min(max_sentences, int(total_sentences * ratio)))
+        final_winners, _ = self._window_winners(winners, num_sentences, False, memo)
+        return ' '.join(sentence for _, sentence in final_winners)
+    
+    def summarize_stream(self, pages: Iterable[str], ratio: float = 0.3, min_sentences: int = 2,
+                         max_sentences: int = 10, remove_duplicates: bool = True) -> str:
+        """
+        Summarize a document read from an iterator of pages or paragraphs.
+        
+        Sentences are ranked in windows of window_size sentences (DEFAULT_WINDOW_SIZE
+        when the summarizer has none configured), so the whole document never has to
+        be held in memory.
+        
+        Args:
+            pages: Iterable of text pieces in document order.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            
+        Returns:
+            Summarized text.
+        """
+        input_sentences = 0
+        
+        def counted(sentences):
+            nonlocal input_sentences
+            for sentence in sentences:
+                input_sentences += 1
+                yield sentence
+                
+        try:
+            return self._summarize_windows(counted(self._iter_stream_sentences(pages)), ratio, min_sentences,
+                                           max_sentences, remove_duplicates)
+        finally:
+            # generate_summary counts its input in _prepare_sentences
+            metrics.increment("text_summarizer_sentences_total", input_sentences, step="input")
+    
+    def _summarize_batch(self, texts: List[str], ratio: float, min_sentences: int, max_sentences: int,
+                         remove_duplicates: bool) -> List[Tuple[str, float]]:
+        """
+        Summarize a batch of documents with one vectorization pass over all of them.
+        
+        The sentences of every document share a single normalized term matrix; each
+        document then only multiplies its own block of rows.
+        
+        Args:
+            texts: Documents to summarize.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            
+        Returns:
+            List of (summary, seconds) tuples in input order. The shared vectorization
+            time is split evenly across the documents of the batch.
+        """
+        prepared = []
+        timings = []
+        batch_vectors = []
+        
+        for text in texts:
+            start_time = time.perf_counter()
+            summary, original_sentences, sentences, original_indices_map, features = self._prepare_sentences(
+                text, ratio, min_sentences, max_sentences, remove_duplicates
+            )
+            offset = len(batch_vectors)
+            if summary is None:
+                batch_vectors.extend(sentence_features.vector for sentence_features in features)
+            prepared.append((summary, original_sentences, sentences, original_indices_map, offset))
+            timings.append(time.perf_counter() - start_time)
+            
+        start_time = time.perf_counter()
+        normalized = self._normalized_term_matrix(batch_vectors) if self.similarity_backend == 'sparse' else None
+        shared_time = (time.perf_counter() - start_time) / max(len(prepared), 1)
+        
+        results = []
+        for (summary, original_sentences, sentences, original_indices_map, offset), elapsed in zip(prepared, timings):
+            start_time = time.perf_counter()
+            if summary is None:
+                if normalized is not None:
+                    similarity_matrix = self._cosine_product(normalized[offset:offset + len(sentences)])
+                else:
+                    similarity_matrix = self._calculate_similarity_matrix(
+                        batch_vectors[offset:offset + len(sentences)]
+                    )
+                sentence_scores = self._rank_sentences(similarity_matrix)
+                summary = self._compose_summary(original_sentences, sentences, original_indices_map,
+                                                sentence_scores, ratio, min_sentences, max_sentences)
+            results.append((summary, elapsed + shared_time + time.perf_counter() - start_time))
+            
+        return results
+    
+    def summarize_many(self, texts: Iterable[str], ratio: float = 0.3, min_sentences: int = 2,
+                       max_sentences: int = 10, remove_duplicates: bool = True, mode: str = 'process',
+                       workers: Optional[int] = None, chunksize: int = 16) -> Iterator[Dict]:
+        """
+        Summarize many documents, yielding the results in input order.
+        
+        Args:
+            texts: Iterable of documents to summarize.
+            ratio: The proportion of sentences to include in the summary (0.0 to 1.0).
+            min_sentences: Minimum number of sentences in the summary.
+            max_sentences: Maximum number of sentences in the summary.
+            remove_duplicates: Whether to remove duplicate sentences before summarization.
+            mode: 'process' fans documents out over a process pool whose workers load the
+                stopwords and the punkt model once, 'batched' vectorizes each chunk of
+                documents in one pass in the current process.
+            workers: Number of worker processes (defaults to the CPU count).
+            chunksize: Documents sent to a worker at once, or documents per vectorization
+                pass in batched mode. In process mode at most two chunks per worker are
+                in flight, so texts are read from the iterable only as results are
+                consumed.
+            
+        Returns:
+            Iterator of dictionaries with the document index, its summary and the seconds
+            spent on it.
+        """
+        options = {
+            'ratio': ratio,
+            'min_sentences': min_sentences,
+            'max_sentences': max_sentences,
+            'remove_duplicates': remove_duplicates,
+        }
+        
+        if mode == 'batched':
+            iterator = iter(texts)
+            index = 0
+            while True:
+                batch = list(islice(iterator, chunksize))
+                if not batch:
+                    break
+                for summary, elapsed in self._summarize_batch(batch, **options):
+                    yield {"index": index, "summary": summary, "elapsed": elapsed}
+                    index += 1
+        elif mode == 'process':
+            workers = workers or os.cpu_count() or 1
+            iterator = iter(texts)
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_summary_worker,
+                                           initargs=(self._config,))
+            pending = deque()
+            
+            def submit_next():
+                chunk = [(text, options) for text in islice(iterator, chunksize)]
+                if chunk:
+                    pending.append(executor.submit(_summarize_chunk_in_worker, chunk))
+                    
+            try:
+                for _ in range(workers * 2):
+                    submit_next()
+                index = 0
+                while pending:
+                    results = pending.popleft().result()
+                    submit_next()
+                    for summary, elapsed in results:
+                        yield {"index": index, "summary": summary, "elapsed": elapsed}
+                        index += 1
+            finally:
+                # An abandoned generator only waits for the chunks already running
+                executor.shutdown(wait=True, cancel_futures=True)
+        else:
+            raise ValueError(f"Unknown batch mode: {mode}")
+    
     def get_duplicate_statistics(self, text: str) -> Dict:
         """
         Get statistics about duplicate sentences in the text.
@@ -336,3 +1025,48 @@ class TextSummarizer:
             "duplicate_sentences": duplicates,
             "duplicate_percentage": round(duplicates / len(original_sentences) * 100, 2) if original_sentences else 0
         }
+
+
+# Summarizer owned by each summarize_many worker process
+_worker_summarizer = None
+
+
+def _init_summary_worker(config: Dict) -> None:
+    """
+    Build the worker's summarizer and load the punkt model once per process.
+    
+    Args:
+        config: Constructor arguments of the parent summarizer.
+    """
+    global _worker_summarizer
+    _worker_summarizer = TextSummarizer(**config)
+    sent_tokenize("Load the sentence tokenizer. It is cached afterwards.")
+
+
+def _summarize_in_worker(job: Tuple[str, Dict]) -> Tuple[str, float]:
+    """
+    Summarize one document inside a worker process.
+    
+    Args:
+        job: Tuple of the document text and the generate_summary options.
+        
+    Returns:
+        Tuple of the summary and the seconds spent on it.
+    """
+    text, options = job
+    start_time = time.perf_counter()
+    summary = _worker_summarizer.generate_summary(text, **options)
+    return summary, time.perf_counter() - start_time
+
+
+def _summarize_chunk_in_worker(jobs: List[Tuple[str, Dict]]) -> List[Tuple[str, float]]:
+    """
+    Summarize a chunk of documents inside a worker process.
+    
+    Args:
+        jobs: List of (document text, generate_summary options) tuples.
+        
+    Returns:
+        List of (summary, seconds) tuples in input order.
+    """
+    return [_summarize_in_worker(job) for job in jobs]
@@ -0,0 +1,76 @@
+import json
+import os
+
+
+class CaptionTranscriptSource:
+    """Fetch the existing YouTube captions of a video with youtube-transcript-api"""
+
+    name = "captions"
+
+    def __init__(self, languages=("en",), verbose=True):
+        """Initialize the source with the caption languages to try, in order of preference
+
+        verbose=False silences the progress output, as for YouTubeSummarizer.
+        """
+        self.languages = list(languages)
+        self.verbose = verbose
+
+    def _fetch_entries(self, video_id):
+        """Return the caption entries as dicts with text, start and duration"""
+        from youtube_transcript_api import YouTubeTranscriptApi
+
+        # youtube-transcript-api < 1.0 exposes a static get_transcript
+        if hasattr(YouTubeTranscriptApi, "get_transcript"):
+            return YouTubeTranscriptApi.get_transcript(video_id, languages=self.languages)
+        return YouTubeTranscriptApi().fetch(video_id, languages=self.languages).to_raw_data()
+
+    def fetch(self, video_id):
+        """Return {"text", "segments"} for the video, or None if it has no usable captions"""
+        try:
+            entries = self._fetch_entries(video_id)
+        except Exception as e:
+            if self.verbose:
+                print(f"ℹ️ No captions available ({type(e).__name__}), falling back to Whisper")
+            return None
+
+        segments = [
+            {"start": entry.get("start", 0.0), "duration": entry.get("duration", 0.0),
+             "text": entry["text"].replace("\n", " ").strip()}
+            for entry in entries if entry.get("text", "").strip()
+        ]
+        text = " ".join(segment["text"] for segment in segments)
+        if not text:
+            return None
+        return {"text": text, "segments": segments}
+
+
+class LocalTranscriptSource:
+    """
+    Read transcripts from local files, e.g. test fixtures.
+
+    Looks for <directory>/<video_id>.json, containing {"text": ...} and optionally
+    "title", "duration" and "segments", or <directory>/<video_id>.txt with the
+    plain transcript text.
+    """
+
+    name = "local"
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, video_id):
+        """Return the stored transcript for the video, or None if there is no file for it"""
+        json_path = os.path.join(self.directory, f"{video_id}.json")
+        text_path = os.path.join(self.directory, f"{video_id}.txt")
+
+        if os.path.exists(json_path):
+            with open(json_path, "r", encoding="utf-8") as f:
+                transcript = json.load(f)
+            return transcript if transcript.get("text") else None
+
+        if os.path.exists(text_path):
+            with open(text_path, "r", encoding="utf-8") as f:
+                text = f.read().strip()
+            return {"text": text} if text else None
+
+        return None
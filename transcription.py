@@ -0,0 +1,167 @@
+import argparse
+import difflib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Whisper works on 16 kHz mono audio
+SAMPLE_RATE = 16000
+
+
+def find_silence_splits(audio, segment_seconds=30.0, search_seconds=5.0, frame_ms=30):
+    """Split audio into segments of at most segment_seconds, cutting at the quietest frame
+
+    A simple energy-based voice activity detector: for every cut, the frame with the
+    lowest RMS energy in the last search_seconds before the target length is chosen,
+    so segments end in pauses rather than mid-word. Returns (start, end) sample pairs.
+    """
+    total = len(audio)
+    segment_length = max(1, int(segment_seconds * SAMPLE_RATE))
+    if total <= segment_length:
+        return [(0, total)]
+
+    frame_length = max(1, int(SAMPLE_RATE * frame_ms / 1000))
+    num_frames = total // frame_length
+    frames = audio[:num_frames * frame_length].reshape(num_frames, frame_length)
+    energy = np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+
+    search_frames = max(1, int(search_seconds * SAMPLE_RATE / frame_length))
+    splits = []
+    start = 0
+
+    while total - start > segment_length:
+        target_frame = (start + segment_length) // frame_length
+        first_frame = max(start // frame_length + 1, target_frame - search_frames)
+        window = energy[first_frame:target_frame + 1]
+        if window.size:
+            quietest = first_frame + int(np.argmin(window))
+            # Cut in the middle of the quietest frame
+            cut = min(quietest * frame_length + frame_length // 2, start + segment_length)
+        else:
+            # Segments shorter than a frame, or a target past the last whole frame: hard split
+            cut = start + segment_length
+        splits.append((start, cut))
+        start = cut
+
+    splits.append((start, total))
+    return splits
+
+
+# Whisper model owned by each transcription worker process
+_worker_model = None
+
+
+def _init_transcription_worker(model_size, threads):
+    """Load the worker's own Whisper model once per process"""
+    global _worker_model
+    import torch
+    import whisper
+
+    torch.set_num_threads(threads)
+    _worker_model = whisper.load_model(model_size)
+
+
+def _transcribe_segment(job):
+    """Transcribe one audio segment inside a worker process"""
+    audio, offset, options = job
+    result = _worker_model.transcribe(audio, **options)
+    return {
+        "text": result["text"].strip(),
+        "segments": [
+            {"start": offset + segment["start"], "end": offset + segment["end"], "text": segment["text"].strip()}
+            for segment in result.get("segments", [])
+        ],
+    }
+
+
+class ParallelTranscriber:
+    """Transcribe long audio by splitting it at silences and fanning segments out to processes
+
+    Each worker process holds its own Whisper model. The pool is created on first
+    use and reused by later calls until close() is called.
+    """
+
+    def __init__(self, model_size="tiny", workers=2, segment_seconds=30.0, **transcribe_options):
+        self.model_size = model_size
+        self.workers = max(1, workers)
+        self.segment_seconds = segment_seconds
+        self.transcribe_options = transcribe_options
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                threads = max(1, (os.cpu_count() or 1) // self.workers)
+                # spawn: forking a process that already loaded torch can deadlock
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_transcription_worker,
+                    initargs=(self.model_size, threads)
+                )
+            return self._executor
+
+    def transcribe(self, audio):
+        """Transcribe an audio file path or 16 kHz mono float32 array
+
+        Returns a dict with the stitched "text" and timestamped "segments".
+        """
+        if isinstance(audio, str):
+            import whisper
+            audio = whisper.load_audio(audio)
+
+        splits = find_silence_splits(audio, self.segment_seconds)
+        jobs = [(audio[start:end], start / SAMPLE_RATE, self.transcribe_options) for start, end in splits]
+        results = list(self._get_executor().map(_transcribe_segment, jobs))
+
+        return {
+            "text": " ".join(result["text"] for result in results if result["text"]),
+            "segments": [segment for result in results for segment in result["segments"]],
+        }
+
+    def close(self):
+        """Shut down the worker processes"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+def main():
+    """Compare parallel transcription against a single Whisper pass on a local file"""
+    parser = argparse.ArgumentParser(description='Parallel Whisper transcription')
+    parser.add_argument('audio', type=str, help='Local audio or video file')
+    parser.add_argument('--model', type=str, default='tiny', help='Whisper model size (default: tiny)')
+    parser.add_argument('--workers', type=int, default=2, help='Number of worker processes (default: 2)')
+    parser.add_argument('--segment-seconds', type=float, default=30.0,
+                        help='Maximum segment length in seconds (default: 30)')
+    parser.add_argument('--compare', action='store_true', help='Also run a single-pass transcription')
+    args = parser.parse_args()
+
+    transcriber = ParallelTranscriber(args.model, args.workers, args.segment_seconds)
+    start_time = time.time()
+    parallel = transcriber.transcribe(args.audio)
+    parallel_time = time.time() - start_time
+    transcriber.close()
+    print(f"Parallel ({args.workers} workers): {round(parallel_time, 2)} seconds, "
+          f"{len(parallel['segments'])} segments")
+
+    if args.compare:
+        import whisper
+
+        model = whisper.load_model(args.model)
+        start_time = time.time()
+        single = model.transcribe(args.audio)
+        single_time = time.time() - start_time
+        similarity = difflib.SequenceMatcher(None, single["text"].split(), parallel["text"].split()).ratio()
+        print(f"Single pass: {round(single_time, 2)} seconds")
+        print(f"Word-level similarity: {round(similarity * 100, 1)}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,158 @@
 import os
 import sys
+import glob
 import time
-import yt_dlp
-import whisper               
 import re
 import uuid
-from transformers import pipeline
+import tempfile
+import threading
 from tqdm import tqdm
 import argparse
 import warnings
+from contextlib import nullcontext
+from transcript_sources import CaptionTranscriptSource
+from text_summarizer import TextSummarizer
+import numpy as np
+from transcription import ParallelTranscriber, SAMPLE_RATE
+from audio_io import stream_pcm_segments, decode_to_pcm
+from streaming_pipeline import StreamingPipeline
+from artifact_store import ArtifactStore
+from metrics import metrics
 warnings.filterwarnings('ignore')
 
 class YouTubeVideoSummarizer:
-    def __init__(self, output_dir="temp_files", whisper_model="tiny", max_chunk_size=900):
-        """Initialize the YouTube Summarizer with configurable parameters"""
+    def __init__(self, output_dir="temp_files", whisper_model="tiny", max_chunk_size=900,
+                 summarizer_model="facebook/bart-large-cnn", model_registry=None, transcript_sources=None,
+                 batch_size=4, length_tolerance=10, chunking="tokens", max_chunk_tokens=None, chunk_overlap=0,
+                 transcribe_workers=1, segment_seconds=30.0, audio_format="native", pcm_mmap=False,
+                 cache_artifacts=True, max_cache_bytes=2 * 1024 ** 3, verbose=True):
+        """Initialize the YouTube Summarizer with configurable parameters
+
+        When a ModelRegistry is given, the Whisper and summarization models are
+        shared through it instead of being loaded by this instance.
+
+        transcript_sources are tried in order before falling back to downloading the
+        audio and transcribing it with Whisper; by default the video's YouTube
+        captions are used when available. Pass an empty list to always use Whisper.
+
+        Chunks are summarized batch_size at a time; chunks whose computed max_length
+        differs by at most length_tolerance tokens may share a batch (0 batches only
+        chunks with identical lengths).
+
+        With chunking="tokens" the transcript is split at sentence boundaries and
+        packed up to max_chunk_tokens model tokens per chunk (by default the model's
+        context window), repeating the last chunk_overlap sentences at the start of
+        the next chunk. chunking="chars" splits on whitespace into chunks of about
+        max_chunk_size characters.
+
+        With transcribe_workers > 1 the audio is split at silences into segments of
+        at most segment_seconds and transcribed by that many worker processes.
+
+        audio_format selects how downloaded audio is handed to Whisper: "native"
+        keeps the downloaded container as is, "pcm" decodes it straight to 16 kHz
+        mono samples (memory-mapped from a temporary file when pcm_mmap is set) and
+        "mp3" re-encodes to 192 kbps MP3 as earlier versions did.
+
+        With cache_artifacts, downloaded audio and Whisper transcripts are kept in
+        output_dir/artifacts (keyed by video ID and Whisper model size) and reused by
+        later runs; the least recently used artifacts are evicted once the directory
+        exceeds max_cache_bytes.
+
+        verbose=False silences the per-video progress output and progress bars
+        (errors are still printed); stage timings and counters are recorded in
+        metrics.metrics either way.
+        """
         self.output_dir = output_dir
         self.whisper_model_size = whisper_model
         self.max_chunk_size = max_chunk_size
+        self.batch_size = max(1, batch_size)
+        self.length_tolerance = length_tolerance
+        self.chunking = chunking
+        self.max_chunk_tokens = max_chunk_tokens
+        self.chunk_overlap = chunk_overlap
+        self._sentence_splitter = None
+        self.transcribe_workers = transcribe_workers
+        self.segment_seconds = segment_seconds
+        self._parallel_transcriber = None
+        self.audio_format = audio_format
+        self.pcm_mmap = pcm_mmap
+        self.summarizer_model = summarizer_model
+        self.model_registry = model_registry
+        self.transcript_sources = (
+            [CaptionTranscriptSource(verbose=verbose)] if transcript_sources is None else list(transcript_sources)
+        )
         self.whisper_model = None
         self.summarizer = None
+        self.verbose = verbose
        
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
+        self.artifact_store = (
+            ArtifactStore(os.path.join(output_dir, "artifacts"), max_cache_bytes) if cache_artifacts else None
+        )
+        # Temporary audio files created by this summarizer, the only ones _discard_audio deletes
+        self._temp_files = set()
+        self._temp_files_lock = threading.Lock()
        
+    def _create_whisper_model(self):
+        """Load the Whisper model from disk"""
+        import whisper
+
+        self._log("Loading Whisper model...")
+        with metrics.timer("model_load", model=f"whisper:{self.whisper_model_size}"):
+            return whisper.load_model(self.whisper_model_size)
+
+    def _create_summarizer(self):
+        """Load the summarization model from disk"""
+        from transformers import pipeline
+
+        self._log("Loading summarization model...")
+        with metrics.timer("model_load", model=self.summarizer_model):
+            return pipeline("summarization", model=self.summarizer_model)
+
     def _load_whisper_model(self):
         """Load the Whisper model if not already loaded"""
+        if self.model_registry is not None:
+            return self.model_registry.get(f"whisper:{self.whisper_model_size}", self._create_whisper_model)
         if self.whisper_model is None:
-            print("Loading Whisper model...")
-            self.whisper_model = whisper.load_model(self.whisper_model_size)
+            self.whisper_model = self._create_whisper_model()
         return self.whisper_model
    
     def _load_summarizer(self):
         """Load the summarization model if not already loaded"""
+        if self.model_registry is not None:
+            return self.model_registry.get(f"summarizer:{self.summarizer_model}", self._create_summarizer)
         if self.summarizer is None:
-            print("Loading summarization model...")
-            self.summarizer = pipeline("summarization", model="facebook/bart-large-cnn")
+            self.summarizer = self._create_summarizer()
         return self.summarizer
+
+    def _lease_whisper_model(self):
+        """Context manager holding the Whisper model (and a registry concurrency slot)"""
+        if self.model_registry is not None:
+            return self.model_registry.lease(f"whisper:{self.whisper_model_size}", self._create_whisper_model)
+        return nullcontext(self._load_whisper_model())
+
+    def _lease_summarizer(self):
+        """Context manager holding the summarization model (and a registry concurrency slot)"""
+        if self.model_registry is not None:
+            return self.model_registry.lease(f"summarizer:{self.summarizer_model}", self._create_summarizer)
+        return nullcontext(self._load_summarizer())
+
+    def preload_models(self):
+        """Load the Whisper and summarization models ahead of the first video"""
+        self._load_whisper_model()
+        self._load_summarizer()
    
+    def _log(self, *args, **kwargs):
+        """Print progress output unless the summarizer is quiet"""
+        if self.verbose:
+            print(*args, **kwargs)
+
+    def _report_progress(self, progress_callback, stage, progress=None, **details):
+        """Send a progress event to the caller's callback, if any"""
+        if progress_callback is not None:
+            progress_callback({"stage": stage, "progress": progress, **details})
+
     def _extract_video_id(self, youtube_url):
         """Extract the video ID from a YouTube URL"""
         # Match patterns like: youtube.com/watch?v=VIDEO_ID or youtu.be/VIDEO_ID
@@ -54,76 +170,207 @@ class YouTubeVideoSummarizer:
         # If no pattern matches, generate a unique ID based on the URL
         return str(uuid.uuid5(uuid.NAMESPACE_URL, youtube_url))
    
-    def download_audio(self, youtube_url):
-        """Download the audio from a YouTube video using yt-dlp"""
+    def _youtube_dl(self, options):
+        """Create a yt-dlp downloader; yt-dlp is only imported once a video is fetched"""
+        import yt_dlp
+
+        return yt_dlp.YoutubeDL(options)
+
+    def _fetch_video_info(self, youtube_url):
+        """Retrieve the title and duration of a video without downloading it"""
+        self._log(f"📌 Retrieving video information...")
+        with self._youtube_dl({'quiet': True}) as ydl:
+            info = ydl.extract_info(youtube_url, download=False)
+        return info.get('title', 'Unknown Title'), info.get('duration', 0) or 0
+
+    def fetch_transcript(self, video_id):
+        """Try each transcript source in order; return the first transcript found, or None"""
+        for source in self.transcript_sources:
+            transcript = source.fetch(video_id)
+            if transcript and transcript.get("text", "").strip():
+                self._log(f"📜 Using transcript from {source.name}")
+                return dict(transcript, source=source.name)
+        return None
+
+    def _prepare_audio(self, path, video_id, owned=True):
+        """Turn a media file into the transcriber input for the configured audio_format
+
+        Returns the file path, or PCM samples in "pcm" mode. A downloaded (owned)
+        file is deleted once it has been decoded, or else discarded after the run.
+        """
+        if self.audio_format != "pcm":
+            if owned:
+                self._track_temp_file(path)
+            return path
+
+        mmap_path = None
+        if self.pcm_mmap:
+            # One file per request, so concurrent runs for the same video never share it
+            fd, mmap_path = tempfile.mkstemp(prefix=f"audio_{video_id}_", suffix=".f32", dir=self.output_dir)
+            os.close(fd)
+            self._track_temp_file(mmap_path)
+        start_time = time.time()
+        try:
+            audio = decode_to_pcm(path, mmap_path)
+        except Exception:
+            if mmap_path is not None:
+                self._discard_audio(mmap_path)
+            raise
+        self._log(f"🔊 Decoded {round(len(audio) / SAMPLE_RATE, 1)} seconds of audio to PCM in "
+              f"{round(time.time() - start_time, 2)} seconds")
+        if owned:
+            os.remove(path)
+        return audio
+
+    def _track_temp_file(self, path):
+        """Remember a file created by this summarizer so _discard_audio may delete it"""
+        with self._temp_files_lock:
+            self._temp_files.add(os.path.abspath(path))
+
+    def _discard_audio(self, audio):
+        """Delete temporary audio created by this summarizer
+
+        Local media and stored downloads were not created for this run and are kept.
+        """
+        if isinstance(audio, np.memmap):
+            path = audio.filename
+        elif isinstance(audio, str):
+            path = audio
+        else:
+            return False
+        if not path:
+            return False
+
+        path = os.path.abspath(path)
+        with self._temp_files_lock:
+            if path not in self._temp_files:
+                return False
+            self._temp_files.discard(path)
+        if os.path.exists(path):
+            os.remove(path)
+            return True
+        return False
+
+    def load_local_media(self, path):
+        """Prepare a local audio or video file for transcription (no network access)"""
+        video_id = self._extract_video_id(path)
+        title = os.path.splitext(os.path.basename(path))[0]
+        audio = self._prepare_audio(path, video_id, owned=False)
+        duration = len(audio) / SAMPLE_RATE if isinstance(audio, np.ndarray) else 0
+        self._log(f"🎬 Local media: {path}")
+        return audio, title, duration, video_id
+
+    def download_audio(self, youtube_url, force_refresh=False):
+        """Download the audio from a YouTube video using yt-dlp
+
+        Local media files are accepted as well and are used in place. Audio kept in
+        the artifact store is reused unless force_refresh is set.
+        """
+        if os.path.isfile(youtube_url):
+            return self.load_local_media(youtube_url)
+
+        output_base = None
         try:
             # Extract video ID or create unique identifier
             video_id = self._extract_video_id(youtube_url)
+
+            if self._uses_store(video_id) and not force_refresh:
+                stored_audio = self.artifact_store.get_audio(video_id)
+                info = self.artifact_store.get_info(video_id)
+                if stored_audio and info:
+                    self._log(f"♻️ Reusing downloaded audio: {stored_audio}")
+                    audio = self._prepare_audio(stored_audio, video_id, owned=False)
+                    return audio, info.get("title", "Unknown Title"), info.get("duration", 0), video_id
            
-            # Define output file path with video ID for uniqueness
-            output_file = os.path.join(self.output_dir, f"audio_{video_id}.mp3")
+            # One file name per request, so concurrent downloads of a video never touch each other's files
+            output_base = os.path.join(self.output_dir, f"audio_{video_id}_{uuid.uuid4().hex[:12]}")
            
             # Define yt-dlp options
             ydl_opts = {
                 'format': 'bestaudio/best',
-                'postprocessors': [{
-                    'key': 'FFmpegExtractAudio',
-                    'preferredcodec': 'mp3',
-                    'preferredquality': '192',
-                }],
-                'outtmpl': output_file.replace('.mp3', ''),
-                'quiet': False,
+                'outtmpl': output_base + '.%(ext)s',
+                'quiet': not self.verbose,
                 'no_warnings': True,
                 'force_generic_extractor': False
             }
+            if self.audio_format == "mp3":
+                ydl_opts['postprocessors'] = [{
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'mp3',
+                    'preferredquality': '192',
+                }]
            
             # Get video information first
-            print(f"📌 Retrieving video information...")
-            with yt_dlp.YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(youtube_url, download=False)
-                title = info.get('title', 'Unknown Title')
-                duration = info.get('duration', 0)
-               
-                # Check if video is too long
-                if duration > 3600:  # longer than 1 hour
-                    print(f"⚠️ Warning: This video is {round(duration/60, 2)} minutes long, processing may take a while.")
+            title, duration = self._fetch_video_info(youtube_url)
            
-            print(f"🎬 Video: {title}")
-            print(f"🔗 Video ID: {video_id}")
-            print(f"⏱️ Length: {round(duration/60, 2)} minutes")
+            # Check if video is too long
+            if duration > 3600:  # longer than 1 hour
+                self._log(f"⚠️ Warning: This video is {round(duration/60, 2)} minutes long, processing may take a while.")
            
-            # Download the audio (force redownload even if file exists)
-            print(f"⬇️ Downloading audio to {output_file}...")
+            self._log(f"🎬 Video: {title}")
+            self._log(f"🔗 Video ID: {video_id}")
+            self._log(f"⏱️ Length: {round(duration/60, 2)} minutes")
            
-            # Check if file exists and remove it to force fresh download
-            if os.path.exists(output_file):
-                print(f"🗑️ Removing existing file to ensure fresh download")
-                os.remove(output_file)
+            # Download the audio
+            self._log(f"⬇️ Downloading audio to {output_base}.*...")
            
             start_time = time.time()
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([youtube_url])
+            with self._youtube_dl(ydl_opts) as ydl:
+                info = ydl.extract_info(youtube_url, download=True)
+                if self.audio_format == "mp3":
+                    output_file = output_base + '.mp3'
+                else:
+                    downloads = info.get('requested_downloads') or [{}]
+                    output_file = downloads[0].get('filepath') or ydl.prepare_filename(info)
            
             download_time = time.time() - start_time
-            print(f"✅ Audio downloaded successfully in {round(download_time, 2)} seconds")
+            metrics.observe("video_stage_seconds", download_time, stage="download")
+            self._log(f"✅ Audio downloaded successfully in {round(download_time, 2)} seconds")
+
+            if self._uses_store(video_id):
+                output_file = self.artifact_store.put_audio(video_id, output_file)
+                self.artifact_store.put_info(video_id, {"title": title, "duration": duration})
+                return self._prepare_audio(output_file, video_id, owned=False), title, duration, video_id
            
-            return output_file, title, duration, video_id
+            return self._prepare_audio(output_file, video_id), title, duration, video_id
        
         except Exception as e:
             print(f"❌ Error downloading audio: {str(e)}")
+            # Remove what this request downloaded (including partial files), nothing else
+            if output_base is not None:
+                for leftover in glob.glob(glob.escape(output_base) + '.*'):
+                    os.remove(leftover)
             return None, None, None, None
 
+    def _transcribe_parallel(self, audio_file):
+        """Transcribe silence-delimited segments concurrently in worker processes"""
+        if self._parallel_transcriber is None:
+            self._parallel_transcriber = ParallelTranscriber(
+                self.whisper_model_size, self.transcribe_workers, self.segment_seconds
+            )
+        self._log(f"🎙️ Starting parallel transcription with {self.transcribe_workers} workers...")
+        start_time = time.time()
+        result = self._parallel_transcriber.transcribe(audio_file)
+        transcription_time = time.time() - start_time
+        metrics.observe("video_stage_seconds", transcription_time, stage="transcribe")
+        self._log(f"✅ Transcription of {len(result['segments'])} segments completed in "
+              f"{round(transcription_time, 2)} seconds")
+        return result["text"]
+
     def transcribe_audio(self, audio_file):
         """Transcribe the audio file using Whisper"""
         try:
-            model = self._load_whisper_model()
-           
-            print("🎙️ Starting transcription (this may take several minutes for long videos)...")
-            start_time = time.time()
-            result = model.transcribe(audio_file)
+            if self.transcribe_workers > 1:
+                return self._transcribe_parallel(audio_file)
+
+            with self._lease_whisper_model() as model:
+                self._log("🎙️ Starting transcription (this may take several minutes for long videos)...")
+                start_time = time.time()
+                result = model.transcribe(audio_file)
            
             transcription_time = time.time() - start_time
-            print(f"✅ Transcription completed in {round(transcription_time, 2)} seconds")
+            metrics.observe("video_stage_seconds", transcription_time, stage="transcribe")
+            self._log(f"✅ Transcription completed in {round(transcription_time, 2)} seconds")
            
             return result["text"]
        
@@ -131,8 +378,66 @@ class YouTubeVideoSummarizer:
             print(f"❌ Error transcribing audio: {str(e)}")
             return None
 
-    def chunk_text(self, text):
-        """Split text into chunks of approximately max_chunk_size characters"""
+    def _chunk_token_limit(self, tokenizer):
+        """Maximum number of text tokens per chunk, leaving room for special tokens"""
+        limit = self.max_chunk_tokens or min(getattr(tokenizer, "model_max_length", 1024), 1024)
+        return limit - tokenizer.num_special_tokens_to_add()
+
+    def chunk_text_by_tokens(self, text, tokenizer):
+        """Pack whole sentences into chunks as close to the model's token limit as possible"""
+        return [chunk for chunk, _ in self._pack_by_tokens(text, tokenizer)]
+
+    def _pack_by_tokens(self, text, tokenizer):
+        """Pack sentences into chunks for chunk_text_by_tokens, returning (chunk, token count) pairs"""
+        if self._sentence_splitter is None:
+            self._sentence_splitter = TextSummarizer()
+        sentences = self._sentence_splitter._preprocess_text(text)
+        if not sentences:
+            return []
+
+        limit = self._chunk_token_limit(tokenizer)
+        # Count with a leading space, as sentences appear mid-text once joined
+        token_ids = tokenizer([" " + sentence for sentence in sentences], add_special_tokens=False)["input_ids"]
+
+        pieces = []
+        for sentence, ids in zip(sentences, token_ids):
+            if len(ids) <= limit:
+                pieces.append((sentence, len(ids)))
+            else:
+                # A single sentence longer than the window is split on token boundaries
+                for start in range(0, len(ids), limit):
+                    window = ids[start:start + limit]
+                    pieces.append((tokenizer.decode(window).strip(), len(window)))
+
+        chunks = []
+        current = []
+        current_tokens = 0
+
+        for piece, num_tokens in pieces:
+            if current and current_tokens + num_tokens > limit:
+                chunks.append((' '.join(p for p, _ in current), current_tokens))
+                overlap = current[-self.chunk_overlap:] if self.chunk_overlap else []
+                if sum(n for _, n in overlap) + num_tokens > limit // 2:
+                    overlap = []
+                current = list(overlap)
+                current_tokens = sum(n for _, n in current)
+            current.append((piece, num_tokens))
+            current_tokens += num_tokens
+
+        if current:
+            chunks.append((' '.join(p for p, _ in current), current_tokens))
+
+        return chunks
+
+    def chunk_text(self, text, tokenizer=None):
+        """Split text into chunks for the summarization model
+
+        Uses token-aware, sentence-based packing when a tokenizer is given and
+        chunking is "tokens"; otherwise chunks of approximately max_chunk_size characters.
+        """
+        if tokenizer is not None and self.chunking == "tokens":
+            return self.chunk_text_by_tokens(text, tokenizer)
+
         words = text.split()
         chunks = []
         current_chunk = []
@@ -152,81 +457,217 @@ class YouTubeVideoSummarizer:
            
         return chunks
 
-    def summarize_text(self, text):
+    def _chunk_lengths(self, chunk, tokenizer=None, num_tokens=None):
+        """Compute the (max_length, min_length) generation bounds for a first-pass chunk
+
+        Both bounds are in model tokens, derived from the chunk's token count (counted
+        with the tokenizer unless already known; words without a tokenizer): at most
+        70% and 30% of it, capped at 150 and 30 tokens. max_length always leaves room
+        above min_length, so generation is never forced to an exact length.
+        """
+        if num_tokens is None:
+            if tokenizer is not None:
+                num_tokens = len(tokenizer(chunk, add_special_tokens=False)["input_ids"])
+            else:
+                num_tokens = len(chunk.split())
+        min_length = min(30, int(num_tokens * 0.3))
+        max_length = max(min(150, int(num_tokens * 0.7)), min_length + 10)
+        return max_length, min_length
+
+    def _length_buckets(self, chunks, lengths):
+        """Group chunk indices into batches of similar generation lengths
+
+        Chunks are sorted by their bounds, so a batch also holds chunks of similar
+        size, which keeps padding low. A batch runs with the smallest max_length and
+        min_length of its members, so no chunk exceeds its own max_length.
+        """
+        order = sorted(range(len(chunks)), key=lambda i: lengths[i])
+        batches = []
+        current = []
+
+        for i in order:
+            if current and (len(current) >= self.batch_size
+                            or lengths[i][0] - lengths[current[0]][0] > self.length_tolerance):
+                batches.append(current)
+                current = []
+            current.append(i)
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _summarize_chunks(self, summarizer, chunks, lengths, on_batch=None):
+        """Summarize chunks in length-bucketed batches, returning summaries in chunk order"""
+        summaries = [None] * len(chunks)
+
+        for batch in tqdm(self._length_buckets(chunks, lengths), disable=not self.verbose):
+            max_length = min(lengths[i][0] for i in batch)
+            min_length = min(lengths[i][1] for i in batch)
+            outputs = summarizer([chunks[i] for i in batch], max_length=max_length, min_length=min_length,
+                                 do_sample=False, batch_size=len(batch))
+            for i, output in zip(batch, outputs):
+                # Pipelines return a list per input when given a list of inputs
+                summaries[i] = (output[0] if isinstance(output, list) else output)['summary_text']
+            metrics.increment("video_summary_chunks_total", len(batch))
+            metrics.increment("video_summary_batches_total")
+            if on_batch is not None:
+                on_batch(batch, summaries)
+
+        return summaries
+
+    def _condense_summary(self, summarizer, full_summary):
+        """Summarize the combined chunk summaries once more"""
+        self._log("🔄 Generating final summary from intermediate summaries...")
+        tokenizer = getattr(summarizer, "tokenizer", None)
+        chunks = [chunk for chunk in self.chunk_text(full_summary, tokenizer) if chunk.strip()]
+        return " ".join(self._summarize_chunks(summarizer, chunks, [(150, 30)] * len(chunks)))
+
+    def summarize_text(self, text, progress_callback=None):
         """Summarize the text using a transformers model"""
         try:
-            summarizer = self._load_summarizer()
-           
-            # Split the text into chunks
-            chunks = self.chunk_text(text)
-            print(f"📝 Text split into {len(chunks)} chunks for processing")
+            with self._lease_summarizer() as summarizer:
            
-            summaries = []
-            print("🔄 Summarizing text chunks...")
-            start_time = time.time()
+                # Split the text into chunks
+                tokenizer = getattr(summarizer, "tokenizer", None)
+                if tokenizer is not None and self.chunking == "tokens":
+                    packed = self._pack_by_tokens(text, tokenizer)
+                else:
+                    packed = [(chunk, None) for chunk in self.chunk_text(text, tokenizer)]
+                packed = [(chunk, num_tokens) for chunk, num_tokens in packed if chunk.strip()]
+                chunks = [chunk for chunk, _ in packed]
+                self._log(f"📝 Text split into {len(chunks)} chunks for processing")
            
-            for i, chunk in enumerate(tqdm(chunks)):
-                if not chunk.strip():
-                    continue
-                
-                max_length = min(150, int(len(chunk.split()) * 0.7))
-                min_length = max(30, int(len(chunk.split()) * 0.3))
-                
-                summary = summarizer(chunk, max_length=max_length, min_length=min_length, do_sample=False)
-                summaries.append(summary[0]['summary_text'])
+                self._log(f"🔄 Summarizing text chunks in batches of up to {self.batch_size}...")
+                start_time = time.time()
+                completed = [0]
+
+                def report_batch(batch, summaries):
+                    # One event per chunk, carrying its partial summary
+                    for i in batch:
+                        completed[0] += 1
+                        self._report_progress(progress_callback, "summarize", completed[0] / len(chunks),
+                                              chunk=completed[0], chunks=len(chunks), chunk_index=i,
+                                              summary=summaries[i])
+
+                lengths = [self._chunk_lengths(chunk, tokenizer, num_tokens) for chunk, num_tokens in packed]
+                summaries = self._summarize_chunks(summarizer, chunks, lengths, report_batch)
+                first_pass_time = time.time() - start_time
+                chunks_per_second = len(chunks) / first_pass_time if first_pass_time > 0 else 0.0
+                self._log(f"⚡ Throughput: {round(chunks_per_second, 2)} chunks/second")
+                self._report_progress(progress_callback, "summarize", 1.0,
+                                      chunks=len(chunks), chunks_per_second=chunks_per_second)
            
-            # Combine the summaries
-            full_summary = " ".join(summaries)
+                # Combine the summaries
+                full_summary = " ".join(summaries)
            
-            # If the combined summary is still long, summarize it again
-            if len(full_summary) > 2000:
-                print("🔄 Generating final summary from intermediate summaries...")
-                chunks = self.chunk_text(full_summary)
-                second_summaries = []
-                for chunk in tqdm(chunks):
-                    if not chunk.strip():
-                        continue
-                    summary = summarizer(chunk, max_length=150, min_length=30, do_sample=False)
-                    second_summaries.append(summary[0]['summary_text'])
-                full_summary = " ".join(second_summaries)
+                # If the combined summary is still long, summarize it again
+                if len(full_summary) > 2000:
+                    self._report_progress(progress_callback, "final_summary")
+                    full_summary = self._condense_summary(summarizer, full_summary)
            
-            summarization_time = time.time() - start_time
-            print(f"✅ Summarization completed in {round(summarization_time, 2)} seconds")
+                summarization_time = time.time() - start_time
+                metrics.observe("video_stage_seconds", summarization_time, stage="summarize")
+                self._log(f"✅ Summarization completed in {round(summarization_time, 2)} seconds")
                
-            return full_summary
+                return full_summary
        
         except Exception as e:
             print(f"❌ Error summarizing text: {str(e)}")
             return None
 
-    def process_video(self, youtube_url, save_files=True, cleanup=True):
-        """Main function to summarize a YouTube video"""
-        print(f"🚀 Starting to process video: {youtube_url}")
+    def _uses_store(self, video_id):
+        """Whether artifacts of this video are kept (YouTube video IDs only, not local media or other URLs)"""
+        return self.artifact_store is not None and self.artifact_store.is_valid_video_id(video_id)
+
+    def _stored_transcript(self, video_id):
+        """Return a Whisper transcript kept from an earlier run with the same model size, if any"""
+        if not self._uses_store(video_id):
+            return None
+        transcript = self.artifact_store.get_transcript(video_id, self.whisper_model_size)
+        if not transcript or not transcript.get("text"):
+            metrics.increment("artifact_transcript_requests_total", result="miss")
+            return None
+        metrics.increment("artifact_transcript_requests_total", result="hit")
+        self._log(f"♻️ Reusing stored {self.whisper_model_size} Whisper transcript")
+        return dict(transcript, source="whisper")
+
+    def process_video(self, youtube_url, save_files=True, cleanup=True, progress_callback=None,
+                      force_refresh=False):
+        """Main function to summarize a YouTube video
+
+        progress_callback, if given, receives a dict for every stage transition
+        ({"stage": ..., "progress": ...}) and for every summarized chunk, with the
+        chunk's position ("chunk_index" of "chunks") and its partial "summary".
+
+        Transcripts and audio from earlier runs are reused unless force_refresh is set.
+        """
+        video_id = self._extract_video_id(youtube_url)
+        # Keep this video's stored artifacts from being evicted by other requests while in use
+        lease = self.artifact_store.lease(video_id) if self._uses_store(video_id) else nullcontext()
+        with lease:
+            return self._process_video(youtube_url, video_id, save_files, cleanup, progress_callback, force_refresh)
+
+    def _process_video(self, youtube_url, video_id, save_files, cleanup, progress_callback, force_refresh):
+        """Run the pipeline of process_video for one video"""
+        self._log(f"🚀 Starting to process video: {youtube_url}")
         start_time = time.time()
        
-        # Step 1: Download the audio using yt-dlp
-        audio_file, title, duration, video_id = self.download_audio(youtube_url)
-        if not audio_file:
-            return "Failed to download audio from the video."
+        # Step 1: Use a stored or existing transcript (captions) if one is available
+        audio_file = None
+        local_media = os.path.isfile(youtube_url)
+        transcript = None
+        if not local_media:
+            transcript = None if force_refresh else self._stored_transcript(video_id)
+            transcript = transcript or self.fetch_transcript(video_id)
+       
+        if transcript:
+            transcription = transcript["text"]
+            transcript_source = transcript["source"]
+            title = transcript.get("title")
+            duration = transcript.get("duration", 0)
+            if title is None:
+                try:
+                    title, duration = self._fetch_video_info(youtube_url)
+                except Exception as e:
+                    self._log(f"Note: Could not retrieve video information: {str(e)}")
+                    title, duration = "Unknown Title", duration or 0
+            self._report_progress(progress_callback, "transcribe", 1.0, source=transcript_source,
+                                  title=title, duration=duration)
+        else:
+            # Otherwise download the audio using yt-dlp
+            transcript_source = "whisper"
+            self._report_progress(progress_callback, "download", 0.0)
+            audio_file, title, duration, video_id = self.download_audio(youtube_url, force_refresh)
+            if audio_file is None:
+                return "Failed to download audio from the video."
+            self._report_progress(progress_callback, "download", 1.0, title=title, duration=duration)
        
         try:
             # Step 2: Transcribe the audio
-            transcription = self.transcribe_audio(audio_file)
-            if not transcription:
-                return "Failed to transcribe the audio."
+            if audio_file is not None:
+                self._report_progress(progress_callback, "transcribe", 0.0)
+                transcription = self.transcribe_audio(audio_file)
+                if not transcription:
+                    return "Failed to transcribe the audio."
+                if self._uses_store(video_id) and not local_media:
+                    self.artifact_store.put_transcript(video_id, self.whisper_model_size, {
+                        "text": transcription, "title": title, "duration": duration
+                    })
+                self._report_progress(progress_callback, "transcribe", 1.0, source=transcript_source)
            
             # Step 3: Summarize the transcript
-            summary = self.summarize_text(transcription)
+            self._report_progress(progress_callback, "summarize", 0.0)
+            summary = self.summarize_text(transcription, progress_callback)
             if not summary:
                 return "Failed to summarize the transcript."
            
             # Step 4: Clean up if requested
-            if cleanup:
+            if cleanup and audio_file is not None:
                 try:
-                    os.remove(audio_file)
-                    print(f"🧹 Temporary audio file removed")
+                    if self._discard_audio(audio_file):
+                        self._log(f"🧹 Temporary audio file removed")
                 except:
-                    print("Note: Could not remove temporary file")
+                    self._log("Note: Could not remove temporary file")
            
             # Save to files if requested
             if save_files:
@@ -246,23 +687,26 @@ class YouTubeVideoSummarizer:
                 with open(summary_file, "w", encoding="utf-8") as f:
                     f.write(summary)
                
-                print(f"📄 Files saved to:\n - {transcript_file}\n - {summary_file}")
+                self._log(f"📄 Files saved to:\n - {transcript_file}\n - {summary_file}")
            
             total_time = time.time() - start_time
+            metrics.observe("video_stage_seconds", total_time, stage="total")
+            metrics.increment("videos_processed_total", source=transcript_source)
             compression_ratio = round(len(summary)/len(transcription)*100, 1)
            
-            print("\n===== VIDEO SUMMARY =====")
-            print(f"🎬 Title: {title}")
-            print(f"🔗 URL: {youtube_url}")
-            print(f"🆔 Video ID: {video_id}")
-            print(f"⏱️ Video Length: {round(duration/60, 2)} minutes")
-            print(f"📊 Transcription Length: {len(transcription)} characters")
-            print(f"📊 Summary Length: {len(summary)} characters ({compression_ratio}% of original)")
-            print(f"⏱️ Total Processing Time: {round(total_time, 2)} seconds")
+            self._log("\n===== VIDEO SUMMARY =====")
+            self._log(f"🎬 Title: {title}")
+            self._log(f"🔗 URL: {youtube_url}")
+            self._log(f"🆔 Video ID: {video_id}")
+            self._log(f"⏱️ Video Length: {round(duration/60, 2)} minutes")
+            self._log(f"📜 Transcript Source: {transcript_source}")
+            self._log(f"📊 Transcription Length: {len(transcription)} characters")
+            self._log(f"📊 Summary Length: {len(summary)} characters ({compression_ratio}% of original)")
+            self._log(f"⏱️ Total Processing Time: {round(total_time, 2)} seconds")
            
             # Display results
-            print("\n=== SUMMARY ===")
-            print(summary)
+            self._log("\n=== SUMMARY ===")
+            self._log(summary)
            
             return {
                 "title": title,
@@ -270,6 +714,7 @@ class YouTubeVideoSummarizer:
                 "video_id": video_id,
                 "duration": duration,
                 "transcription": transcription,
+                "transcript_source": transcript_source,
                 "summary": summary,
                 "processing_time": total_time,
                 "compression_ratio": compression_ratio
@@ -278,19 +723,95 @@ class YouTubeVideoSummarizer:
         except Exception as e:
             # If the temporary file exists, remove it
             try:
-                if audio_file and os.path.exists(audio_file):
-                    os.remove(audio_file)
+                if audio_file is not None:
+                    self._discard_audio(audio_file)
             except:
                 pass
            
             print(f"❌ Error processing video: {str(e)}")
             return f"Error processing video: {str(e)}"
 
+    def _resolve_audio_stream(self, youtube_url):
+        """Look up the direct audio URL of a video, so it can be decoded while downloading"""
+        with self._youtube_dl({'quiet': True, 'format': 'bestaudio/best'}) as ydl:
+            info = ydl.extract_info(youtube_url, download=False)
+        return info['url'], info.get('http_headers'), info.get('title', 'Unknown Title'), info.get('duration', 0) or 0
+
+    def _transcribe_segment(self, segment):
+        """Transcribe one audio segment with the shared Whisper model"""
+        with self._lease_whisper_model() as model:
+            return model.transcribe(segment)["text"]
+
+    def _summarize_chunk(self, chunk):
+        """Summarize a single transcript chunk"""
+        with self._lease_summarizer() as summarizer:
+            lengths = self._chunk_lengths(chunk, getattr(summarizer, "tokenizer", None))
+            return self._summarize_chunks(summarizer, [chunk], [lengths])[0]
+
+    def _chunk_transcript(self, text):
+        """Chunk transcript text with the summarization model's tokenizer"""
+        return self.chunk_text(text, getattr(self._load_summarizer(), "tokenizer", None))
+
+    def process_video_stream(self, youtube_url=None, segment_source=None, transcribe=None, summarize=None,
+                             chunk=None):
+        """Summarize a video with overlapping download, transcription and summarization
+
+        A generator yielding events as they happen: {"stage": "transcribe", ...} for
+        every transcribed audio segment, {"stage": "summarize", ...} with each partial
+        chunk summary, and finally {"stage": "done", ...} with the same fields as the
+        process_video result. By default audio is decoded straight from the video's
+        stream URL; segment_source (e.g. stream_pcm_segments("talk.mp3")), transcribe,
+        chunk and summarize can be injected to run offline.
+        """
+        start_time = time.time()
+        title, duration, video_id = None, 0, None
+        if youtube_url:
+            video_id = self._extract_video_id(youtube_url)
+        if segment_source is None:
+            audio_url, http_headers, title, duration = self._resolve_audio_stream(youtube_url)
+            segment_source = stream_pcm_segments(audio_url, self.segment_seconds, http_headers)
+
+        pipeline = StreamingPipeline(
+            segment_source,
+            transcribe or self._transcribe_segment,
+            chunk or (self._chunk_transcript if summarize is None else self.chunk_text),
+            summarize or self._summarize_chunk
+        )
+
+        transcript_parts = []
+        summaries = []
+        for event in pipeline.run():
+            if event["stage"] == "transcribe":
+                transcript_parts.append(event["text"])
+            else:
+                summaries.append(event["summary"])
+            yield event
+
+        transcription = " ".join(part for part in transcript_parts if part)
+        summary = " ".join(summaries)
+        if len(summary) > 2000:
+            yield {"stage": "final_summary"}
+            with self._lease_summarizer() as summarizer:
+                summary = self._condense_summary(summarizer, summary)
+
+        yield {
+            "stage": "done",
+            "title": title,
+            "youtube_url": youtube_url,
+            "video_id": video_id,
+            "duration": duration,
+            "transcription": transcription,
+            "transcript_source": "whisper",
+            "summary": summary,
+            "processing_time": time.time() - start_time,
+            "compression_ratio": round(len(summary) / len(transcription) * 100, 1) if transcription else 0.0
+        }
+
 
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='YouTube Video Summarizer')
-    parser.add_argument('--url', type=str, help='YouTube video URL')
+    parser.add_argument('--url', type=str, help='YouTube video URL or local media file')
     parser.add_argument('--model', type=str, default='tiny',
                         choices=['tiny', 'base', 'small', 'medium', 'large'],
                         help='Whisper model size (default: tiny)')
@@ -300,6 +821,22 @@ def parse_arguments():
                         help='Do not save transcript and summary files')
     parser.add_argument('--no-cleanup', action='store_false', dest='cleanup',
                         help='Do not delete temporary audio files')
+    parser.add_argument('--no-captions', action='store_true',
+                        help='Always transcribe with Whisper, even if the video has captions')
+    parser.add_argument('--chunking', type=str, default='tokens', choices=['tokens', 'chars'],
+                        help='Split transcripts by model tokens at sentence boundaries, or by characters')
+    parser.add_argument('--transcribe-workers', type=int, default=1,
+                        help='Transcribe silence-delimited segments in this many processes (default: 1)')
+    parser.add_argument('--force-refresh', action='store_true',
+                        help='Download and transcribe again instead of reusing stored artifacts')
+    parser.add_argument('--audio-format', type=str, default='native', choices=['native', 'pcm', 'mp3'],
+                        help='Keep the downloaded audio as is, decode it to PCM, or re-encode to MP3')
+    parser.add_argument('--stream', action='store_true',
+                        help='Overlap download, transcription and summarization and print partial summaries')
+    parser.add_argument('--batch-size', type=int, default=4,
+                        help='Number of chunks summarized per model call (default: 4)')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Only print the summary and errors, without progress output')
     return parser.parse_args()
 
 
@@ -322,12 +859,29 @@ if __name__ == "__main__":
         if args.url:
             summarizer = YouTubeVideoSummarizer(
                 output_dir=args.output,
-                whisper_model=args.model
-            )
-            summarizer.process_video(
-                args.url,
-                save_files=args.save_files,
-                cleanup=args.cleanup
+                whisper_model=args.model,
+                transcript_sources=[] if args.no_captions else None,
+                batch_size=args.batch_size,
+                chunking=args.chunking,
+                transcribe_workers=args.transcribe_workers,
+                audio_format=args.audio_format,
+                verbose=not args.quiet
             )
+            if args.stream:
+                for event in summarizer.process_video_stream(args.url):
+                    if event["stage"] == "summarize":
+                        print(f"🧩 Chunk {event['chunk'] + 1}: {event['summary']}")
+                    elif event["stage"] == "done":
+                        print("\n=== SUMMARY ===")
+                        print(event["summary"])
+            else:
+                results = summarizer.process_video(
+                    args.url,
+                    save_files=args.save_files,
+                    cleanup=args.cleanup,
+                    force_refresh=args.force_refresh
+                )
+                if args.quiet and isinstance(results, dict):
+                    print(results["summary"])
         else:
             print("Please provide a YouTube URL with the --url argument")
\ No newline at end of file